@@ -0,0 +1,48 @@
+"""Time and ratio of the compression, per kind of column, compressor and with or without type inference"""
+
+import pytest
+from synthetic import make_column, make_frame
+
+from compressio import (
+    Compress,
+    DefaultCompressioTypeset,
+    DefaultCompressor,
+    SparseCompressioTypeset,
+    SparseCompressor,
+)
+from compressio.compress import compress_func
+from compressio.size import estimate_size
+
+COMPRESSORS = {
+    "default": (DefaultCompressioTypeset, DefaultCompressor),
+    "sparse": (SparseCompressioTypeset, SparseCompressor),
+}
+
+
+def record_ratio(benchmark, original, compressed) -> None:
+    benchmark.extra_info["ratio"] = round(
+        estimate_size(original) / estimate_size(compressed), 2
+    )
+
+
+@pytest.mark.parametrize("compressor", list(COMPRESSORS))
+@pytest.mark.parametrize("inference", [False, True], ids=["exact", "inference"])
+def test_compress_column(benchmark, kind, rows, compressor, inference):
+    series = make_column(kind, rows)
+    typeset_type, compressor_type = COMPRESSORS[compressor]
+    benchmark.group = f"compress {kind}"
+
+    compressed = benchmark(
+        compress_func, series, typeset_type(), compressor_type(), inference
+    )
+    benchmark.extra_info["dtype"] = str(compressed.dtype)
+    record_ratio(benchmark, series, compressed)
+
+
+@pytest.mark.parametrize("n_jobs", [1, -1])
+def test_compress_frame(benchmark, rows, columns, kinds, n_jobs):
+    data = make_frame(rows, columns, kinds)
+    benchmark.group = "compress frame"
+
+    compressed = benchmark(Compress(n_jobs=n_jobs).it, data)
+    record_ratio(benchmark, data, compressed)
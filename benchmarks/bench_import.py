@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import compressio", "from compressio import Compress", "import pandas"],
+)
+def test_import_time(benchmark, statement):
+    """Cold start of a fresh interpreter, compared to importing pandas alone"""
+    benchmark.group = "import"
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", statement],),
+        kwargs={"check": True},
+        rounds=5,
+    )
@@ -0,0 +1,64 @@
+"""Speed of common operations on the original and on the compressed data
+
+The compressed dtypes trade speed for memory in places, e.g. arithmetic on float16 is emulated on most
+CPUs. Each operation is a group, so that the original and compressed timings are shown side by side.
+"""
+
+import pandas as pd
+import pytest
+from synthetic import make_orders
+
+from compressio import Compress
+
+
+@pytest.fixture(scope="module", params=["original", "compressed"])
+def orders(request, rows) -> pd.DataFrame:
+    data = make_orders(rows)
+    if request.param == "compressed":
+        data = Compress().it(data)
+    return data
+
+
+@pytest.fixture(scope="module")
+def customers() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "customer": ["red", "green", "blue", "yellow"],
+            "region": ["north", "east", "south", "west"],
+        }
+    )
+
+
+def test_groupby(benchmark, orders):
+    benchmark.group = "groupby"
+    benchmark(lambda: orders.groupby("customer", observed=True)["quantity"].sum())
+
+
+def test_filter(benchmark, orders):
+    benchmark.group = "filter"
+    benchmark(lambda: orders[orders["quantity"] > 50])
+
+
+def test_filter_flags(benchmark, orders):
+    benchmark.group = "filter flags"
+    benchmark(lambda: orders[orders["express"]])
+
+
+def test_sum(benchmark, orders):
+    benchmark.group = "sum"
+    benchmark(orders["price"].sum)
+
+
+def test_arithmetic(benchmark, orders):
+    benchmark.group = "arithmetic"
+    benchmark(lambda: orders["price"] * 1.5 + orders["quantity"])
+
+
+def test_sort(benchmark, orders):
+    benchmark.group = "sort"
+    benchmark(orders.sort_values, "price")
+
+
+def test_merge(benchmark, orders, customers):
+    benchmark.group = "merge"
+    benchmark(orders.merge, customers, on="customer")
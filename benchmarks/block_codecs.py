@@ -0,0 +1,61 @@
+"""Compression ratio and decode throughput of the block codecs on typical cold columns
+
+Run with `python benchmarks/block_codecs.py`, codecs of which the package is not installed are skipped.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from compressio.arrays import BlockCompressedArray
+from compressio.codecs import CODECS, get_codec
+
+SIZE = 1_000_000
+
+
+def columns():
+    random = np.random.RandomState(0)
+    return {
+        "sequential ids": pd.Series(np.arange(SIZE, dtype=np.int32)),
+        "low cardinality": pd.Series(random.randint(0, 50, SIZE).astype(np.int8)),
+        "timestamps": pd.Series(
+            pd.date_range("2021-01-01", periods=SIZE, freq="s")
+            + pd.to_timedelta(random.randint(0, 5, SIZE), unit="s")
+        ),
+        "prices": pd.Series(np.round(random.lognormal(3, 1, SIZE), 2)),
+        "noise": pd.Series(random.rand(SIZE)),
+    }
+
+
+def benchmark(series: pd.Series, codec: str, repeat: int = 3):
+    array = BlockCompressedArray.encode(series.array, codec=codec)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        array.decode()
+        timings.append(time.perf_counter() - start)
+    return series.nbytes / array.nbytes, series.nbytes / min(timings) / 1e6
+
+
+def main():
+    codecs = []
+    for codec in CODECS:
+        try:
+            get_codec(codec)
+            codecs.append(codec)
+        except ImportError:
+            pass
+
+    rows = []
+    for name, series in columns().items():
+        for codec in codecs:
+            ratio, throughput = benchmark(series, codec)
+            rows.append((name, codec, ratio, throughput))
+
+    result = pd.DataFrame(rows, columns=["column", "codec", "ratio", "decode MB/s"])
+    print(result.to_string(index=False, float_format="{:.1f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import pytest
+from synthetic import KINDS
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("compressio benchmarks")
+    group.addoption("--rows", type=int, default=100_000, help="rows per dataset")
+    group.addoption(
+        "--columns", type=int, default=20, help="columns of the mixed frame"
+    )
+    group.addoption(
+        "--kinds",
+        default=",".join(KINDS),
+        help="comma separated kinds of columns in the mixed frame",
+    )
+
+
+@pytest.fixture(scope="session")
+def rows(request) -> int:
+    return request.config.getoption("--rows")
+
+
+@pytest.fixture(scope="session")
+def columns(request) -> int:
+    return request.config.getoption("--columns")
+
+
+@pytest.fixture(scope="session")
+def kinds(request) -> list:
+    return request.config.getoption("--kinds").split(",")
+
+
+def pytest_generate_tests(metafunc):
+    if "kind" in metafunc.fixturenames:
+        kinds = metafunc.config.getoption("--kinds").split(",")
+        metafunc.parametrize("kind", kinds)
@@ -0,0 +1,111 @@
+"""Synthetic columns and frames for the benchmarks, one generator per kind of column"""
+
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def integers(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(random.randint(0, 100, rows), dtype=np.int64)
+
+
+def identifiers(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(np.arange(10**9, 10**9 + rows), dtype=np.int64)
+
+
+def floats(rows: int, random: np.random.RandomState) -> pd.Series:
+    # Multiples of 1/4 are exact in float16
+    return pd.Series(random.randint(0, 400, rows) / 4, dtype=np.float64)
+
+
+def prices(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(np.round(random.lognormal(3, 1, rows), 2))
+
+
+def strings(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(
+        random.choice(["red", "green", "blue", "yellow"], rows), dtype=object
+    )
+
+
+def text(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series([f"user-{value}" for value in random.randint(0, rows, rows)])
+
+
+def numeric_strings(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(random.randint(0, 1000, rows).astype(str), dtype=object)
+
+
+def booleans(rows: int, random: np.random.RandomState) -> pd.Series:
+    return pd.Series(random.rand(rows) < 0.5)
+
+
+def datetimes(rows: int, random: np.random.RandomState) -> pd.Series:
+    start = pd.Timestamp("2021-01-01")
+    return pd.Series(
+        start + pd.to_timedelta(np.sort(random.randint(0, 10**7, rows)), unit="s")
+    )
+
+
+def sparse(rows: int, random: np.random.RandomState) -> pd.Series:
+    values = np.zeros(rows, dtype=np.int64)
+    positions = random.randint(0, rows, rows // 100)
+    values[positions] = random.randint(1, 1000, len(positions))
+    return pd.Series(values)
+
+
+def missing(rows: int, random: np.random.RandomState) -> pd.Series:
+    values = random.randint(0, 50, rows).astype(np.float64)
+    values[random.rand(rows) < 0.9] = np.nan
+    return pd.Series(values)
+
+
+KINDS: Dict[str, Callable[[int, np.random.RandomState], pd.Series]] = {
+    "integers": integers,
+    "identifiers": identifiers,
+    "floats": floats,
+    "prices": prices,
+    "strings": strings,
+    "text": text,
+    "numeric_strings": numeric_strings,
+    "booleans": booleans,
+    "datetimes": datetimes,
+    "sparse": sparse,
+    "missing": missing,
+}
+
+
+def make_column(kind: str, rows: int, seed: int = 0) -> pd.Series:
+    return KINDS[kind](rows, np.random.RandomState(seed)).rename(kind)
+
+
+def make_frame(
+    rows: int, columns: int, kinds: Sequence[str], seed: int = 0
+) -> pd.DataFrame:
+    """A frame of which the columns cycle through the kinds
+
+    :param rows: number of rows
+    :param columns: number of columns
+    :param kinds: the kinds of columns, see `KINDS`
+    :param seed: seed of the random values
+    :return: the frame
+    """
+    data = {}
+    for position in range(columns):
+        kind = kinds[position % len(kinds)]
+        data[f"{kind}_{position}"] = make_column(kind, rows, seed + position).to_numpy()
+    return pd.DataFrame(data)
+
+
+def make_orders(rows: int, seed: int = 0) -> pd.DataFrame:
+    """A frame with the column types of a typical fact table, for the downstream operations"""
+    random = np.random.RandomState(seed)
+    return pd.DataFrame(
+        {
+            "customer": strings(rows, random).to_numpy(),
+            "quantity": integers(rows, random).to_numpy(),
+            "price": floats(rows, random).to_numpy(),
+            "express": booleans(rows, random).to_numpy(),
+        }
+    )
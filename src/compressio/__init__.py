@@ -1,26 +1,75 @@
-from compressio.compress import Compress
-from compressio.compression_algorithms import type_compressions
-from compressio.diagnostics import (
-    compress_report,
-    savings,
-    savings_report,
-    storage_size,
-)
-from compressio.type_compressor import (
-    BaseTypeCompressor,
-    DefaultCompressor,
-    SparseCompressor,
-)
-from compressio.typesets import DefaultCompressioTypeset, SparseCompressioTypeset
+"""compressio: compress pandas data in memory
+
+The public names are imported on first access, so that `import compressio` does not load pandas,
+visions, pint and tqdm until they are used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
 from .version import __version__
 
+if TYPE_CHECKING:
+    from compressio.budget import BudgetPlanner
+    from compressio.compress import Compress
+    from compressio.compression_algorithms import type_compressions
+    from compressio.diagnostics import (
+        compress_report,
+        savings,
+        savings_report,
+        storage_size,
+    )
+    from compressio.lazy import LazyFrame
+    from compressio.partitions import Partitions
+    from compressio.plan import CompressionPlan
+    from compressio.storage import load, load_plan, save
+    from compressio.telemetry import ColumnRecord, CompressionReport
+    from compressio.type_compressor import (
+        BaseTypeCompressor,
+        DefaultCompressor,
+        SparseCompressor,
+    )
+    from compressio.typesets import DefaultCompressioTypeset, SparseCompressioTypeset
+
+# The module of each public name
+_modules = {
+    "Compress": "compressio.compress",
+    "BudgetPlanner": "compressio.budget",
+    "storage_size": "compressio.diagnostics",
+    "savings": "compressio.diagnostics",
+    "savings_report": "compressio.diagnostics",
+    "compress_report": "compressio.diagnostics",
+    "CompressionPlan": "compressio.plan",
+    "ColumnRecord": "compressio.telemetry",
+    "CompressionReport": "compressio.telemetry",
+    "LazyFrame": "compressio.lazy",
+    "Partitions": "compressio.partitions",
+    "save": "compressio.storage",
+    "load": "compressio.storage",
+    "load_plan": "compressio.storage",
+    "BaseTypeCompressor": "compressio.type_compressor",
+    "DefaultCompressor": "compressio.type_compressor",
+    "SparseCompressor": "compressio.type_compressor",
+    "type_compressions": "compressio.compression_algorithms",
+    "DefaultCompressioTypeset": "compressio.typesets",
+    "SparseCompressioTypeset": "compressio.typesets",
+}
+
 __all__ = [
     "Compress",
+    "BudgetPlanner",
     "storage_size",
     "savings",
     "savings_report",
     "compress_report",
+    "CompressionPlan",
+    "ColumnRecord",
+    "CompressionReport",
+    "LazyFrame",
+    "Partitions",
+    "save",
+    "load",
+    "load_plan",
     "BaseTypeCompressor",
     "DefaultCompressor",
     "SparseCompressor",
@@ -29,3 +78,15 @@ __all__ = [
     "SparseCompressioTypeset",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_modules[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_modules))
@@ -0,0 +1,37 @@
+from compressio.arrays.base import EncodedArray, EncodedDtype
+from compressio.arrays.bits import BitArray, BitDtype
+from compressio.arrays.blocks import BlockCompressedArray, BlockDtype
+from compressio.arrays.decimal import DecimalArray, DecimalDtype
+from compressio.arrays.frame_of_reference import (
+    DeltaArray,
+    DeltaDtype,
+    FrameOfReferenceArray,
+    FrameOfReferenceDtype,
+)
+from compressio.arrays.run_length import RunLengthArray, RunLengthDtype
+
+# Encodings that can be enabled on the compressors, by name
+ENCODINGS = {
+    "frame_of_reference": FrameOfReferenceArray,
+    "delta": DeltaArray,
+    "decimal": DecimalArray,
+    "run_length": RunLengthArray,
+}
+
+__all__ = [
+    "ENCODINGS",
+    "EncodedArray",
+    "EncodedDtype",
+    "BitArray",
+    "BitDtype",
+    "BlockCompressedArray",
+    "BlockDtype",
+    "DecimalArray",
+    "DecimalDtype",
+    "DeltaArray",
+    "DeltaDtype",
+    "FrameOfReferenceArray",
+    "FrameOfReferenceDtype",
+    "RunLengthArray",
+    "RunLengthDtype",
+]
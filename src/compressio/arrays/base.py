@@ -0,0 +1,370 @@
+import operator
+import re
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype
+from pandas.api.types import is_integer, is_list_like, pandas_dtype
+
+
+class EncodedDtype(ExtensionDtype):
+    """Dtype of an encoded array, named after the encoding and the dtype of the decoded values
+
+    For example `for[int64]` is a frame-of-reference encoded column that decodes to int64.
+    """
+
+    # Set by the subclasses
+    encoding = ""
+    _metadata: Tuple[str, ...] = ("subtype",)
+
+    def __init__(self, subtype: Any = "int64"):
+        self.subtype = pandas_dtype(subtype)
+
+    @property
+    def name(self) -> str:
+        return f"{self.encoding}[{self.subtype}]"
+
+    # Encoded datetimes are not datetime dtypes for pandas, which would expect the datetime array layout
+    @property
+    def type(self):
+        return object if self.subtype.kind in "mM" else self.subtype.type
+
+    @property
+    def kind(self) -> str:
+        return "O" if self.subtype.kind in "mM" else self.subtype.kind
+
+    @property
+    def na_value(self):
+        if isinstance(self.subtype, ExtensionDtype):
+            return self.subtype.na_value
+        if self.subtype.kind in "mM":
+            return pd.NaT
+        if self.subtype.kind in "fcO":
+            return np.nan
+        return pd.NA
+
+    @property
+    def _is_numeric(self) -> bool:
+        return self.kind in "iufcb"
+
+    @property
+    def _is_boolean(self) -> bool:
+        return self.kind == "b"
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "EncodedDtype":
+        if not isinstance(string, str):
+            raise TypeError(
+                f"'construct_from_string' expects a string, got {type(string)}"
+            )
+
+        match = re.fullmatch(rf"{cls.encoding}\[(.+)\]", string)
+        if match is None:
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+        return cls(match.group(1))
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def split_mask(
+    values: Any, mask: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Split dense values into a numpy array and a mask of the missing values
+
+    :param values: numpy array or pandas (extension) array
+    :param mask: additional positions that are missing
+    :return: the values (missing values are left as is) and the mask, or None when nothing is missing
+    """
+    missing = np.asarray(pd.isna(values), dtype=bool)
+    if mask is not None:
+        missing = missing | mask
+
+    if hasattr(values, "_data") and hasattr(values, "_mask"):
+        # Nullable extension arrays
+        values = values._data
+    elif isinstance(values, ExtensionArray):
+        values = values.to_numpy()
+    values = np.asarray(values)
+
+    if not missing.any():
+        return values, None
+    return values, missing
+
+
+def concat_dense(arrays: Sequence[Any]) -> Any:
+    if all(isinstance(array, np.ndarray) for array in arrays):
+        return np.concatenate(arrays)
+    return pd.concat([pd.Series(array) for array in arrays], ignore_index=True).array
+
+
+class EncodedArray(ExtensionArray):
+    """Base class of compressed, immutable extension arrays that decode on access
+
+    Subclasses implement `encode`, `decode`, `dtype`, `nbytes` and `__len__`. All other operations are
+    derived from these by decoding the values, subclasses override them where the operation can be applied
+    to the encoded values directly.
+    """
+
+    _dtype_class: Type[EncodedDtype] = EncodedDtype
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "EncodedArray":
+        """Encode dense values
+
+        :param values: numpy array or pandas (extension) array
+        :param mask: additional positions that are missing
+        :param subtype: dtype of the decoded values, by default the dtype of the values
+        :return: the encoded array
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        """Whether values of this (dense) dtype can be encoded
+
+        :param dtype: the dtype of the values
+        :return: True when `encode` accepts the values
+        """
+        return False
+
+    @classmethod
+    def compress(cls, values: Any) -> Optional["EncodedArray"]:
+        """Encode the values when they suit the encoding, used by the compression algorithms
+
+        :param values: numpy array or pandas (extension) array
+        :return: the encoded array, or None when the values can not be encoded
+        """
+        try:
+            return cls.encode(values)
+        except (TypeError, ValueError):
+            return None
+
+    def decode(self) -> Any:
+        """Decode the values
+
+        :return: a numpy array, or a pandas extension array when the values can not be represented in numpy
+            (e.g. missing integers)
+        """
+        raise NotImplementedError
+
+    @property
+    def dtype(self) -> EncodedDtype:
+        raise NotImplementedError
+
+    @property
+    def nbytes(self) -> int:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        """The arguments of the constructor apart from the subtype, with which the array is saved
+
+        :return: arrays and integers by the name of the constructor argument
+        """
+        raise NotImplementedError
+
+    def _get_scalar(self, position: int) -> Any:
+        return self.decode()[position]
+
+    def _get_subset(self, item: Any) -> "EncodedArray":
+        return self._encode_like(self.decode()[item])
+
+    def _encode_like(
+        self, values: Any, mask: Optional[np.ndarray] = None
+    ) -> "EncodedArray":
+        """Encode values with the same encoding and the same decoded dtype"""
+        return type(self).encode(values, mask, subtype=self.dtype.subtype)
+
+    @staticmethod
+    def _sequence_values(scalars, subtype=None) -> Any:
+        """Dense values of a sequence of scalars, in the subtype when it can hold them"""
+        if isinstance(scalars, EncodedArray):
+            scalars = scalars.decode()
+        try:
+            return pd.Series(scalars, dtype=subtype).array
+        except (TypeError, ValueError):
+            # e.g. missing values that the subtype can not hold, these are masked by the encoding
+            return pd.Series(scalars).array
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(dtype, str):
+            dtype = pandas_dtype(dtype)
+        if isinstance(dtype, EncodedDtype):
+            dtype = dtype.subtype
+        return cls.encode(cls._sequence_values(scalars, dtype), subtype=dtype)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return original._encode_like(values)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            if item < 0:
+                item += len(self)
+            if not 0 <= item < len(self):
+                raise IndexError(f"index {item} is out of bounds for size {len(self)}")
+            return self._get_scalar(item)
+
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        if not isinstance(item, slice):
+            item = pd.api.indexers.check_array_indexer(self, item)
+        return self._get_subset(item)
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __array__(self, dtype=None):
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=None, copy=False, na_value=None):
+        values = self.decode()
+        if isinstance(values, np.ndarray) and na_value is None:
+            return np.asarray(values, dtype=dtype)
+
+        kwargs = {} if na_value is None else {"na_value": na_value}
+        return pd.Series(values, copy=False).to_numpy(dtype=dtype, **kwargs)
+
+    def isna(self) -> np.ndarray:
+        return np.asarray(pd.isna(self.decode()), dtype=bool)
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.intp)
+        values = self.decode()
+
+        if not allow_fill:
+            return self._encode_like(values.take(indices))
+
+        if (indices < -1).any():
+            raise ValueError(
+                "Invalid value in 'indices', must be >= -1 with allow_fill"
+            )
+        if fill_value is not None and not pd.isna(fill_value):
+            raise ValueError(f"{type(self).__name__} can only fill missing values")
+
+        missing = indices == -1
+        if len(values) == 0:
+            if not missing.all():
+                raise IndexError("cannot do a non-empty take from an empty array")
+            taken = np.zeros(len(indices), dtype=np.int64)
+        else:
+            taken = values.take(np.where(missing, 0, indices))
+        return self._encode_like(taken, missing)
+
+    def copy(self):
+        return self._encode_like(self.decode())
+
+    def fillna(self, value=None, method=None, limit=None):
+        filled = pd.Series(self.decode(), copy=False).fillna(
+            value=value, method=method, limit=limit
+        )
+        return self._encode_like(filled.array)
+
+    def _where(self, mask, value):
+        kept = pd.Series(self.decode(), copy=False).where(mask, value)
+        return self._encode_like(kept.array)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        values = concat_dense([array.decode() for array in to_concat])
+        return to_concat[0]._encode_like(values)
+
+    def _values_for_factorize(self):
+        values = self.decode()
+        if isinstance(values, np.ndarray):
+            # Numpy integers and booleans have no missing values
+            na_value = None if values.dtype.kind in "iub" else self.dtype.na_value
+            return values, na_value
+        return np.asarray(values, dtype=object), self.dtype.na_value
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        return pd.Series(self.decode(), copy=False).value_counts(dropna=dropna)
+
+    def _values_for_argsort(self):
+        return self.to_numpy()
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if dtype == self.dtype:
+            return self.copy() if copy else self
+        if isinstance(dtype, EncodedDtype):
+            array_type = dtype.construct_array_type()
+            return array_type._from_sequence(self.decode(), dtype=dtype)
+
+        result = pd.Series(self.decode(), copy=False).astype(dtype)
+        if isinstance(dtype, ExtensionDtype):
+            return result.array
+        return result.to_numpy()
+
+    def _reduce(self, name: str, skipna: bool = True, **kwargs):
+        kwargs.pop("keepdims", None)
+        series = pd.Series(self.decode(), copy=False)
+        return getattr(series, name)(skipna=skipna, **kwargs)
+
+    def __setitem__(self, key, value):
+        raise TypeError(f"{type(self).__name__} is immutable, decode it first")
+
+    @classmethod
+    def _create_dense_method(cls, op, name: str):
+        def method(self, other):
+            if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+                return NotImplemented
+            if isinstance(other, EncodedArray):
+                other = other.decode()
+            elif is_list_like(other) and not isinstance(
+                other, (np.ndarray, ExtensionArray)
+            ):
+                other = np.asarray(other)
+            return op(self.decode(), other)
+
+        method.__name__ = name
+        return method
+
+    @classmethod
+    def _add_dense_ops(cls) -> None:
+        """Arithmetic and comparison operators are evaluated on the decoded values"""
+        for name, op in [
+            ("__radd__", lambda a, b: b + a),
+            ("__rsub__", lambda a, b: b - a),
+            ("__rmul__", lambda a, b: b * a),
+            ("__rtruediv__", lambda a, b: b / a),
+            ("__rfloordiv__", lambda a, b: b // a),
+            ("__rmod__", lambda a, b: b % a),
+            ("__rpow__", lambda a, b: b**a),
+            ("__rand__", lambda a, b: b & a),
+            ("__ror__", lambda a, b: b | a),
+            ("__rxor__", lambda a, b: b ^ a),
+        ]:
+            setattr(cls, name, cls._create_dense_method(op, name))
+
+        for op in [
+            operator.add,
+            operator.sub,
+            operator.mul,
+            operator.truediv,
+            operator.floordiv,
+            operator.mod,
+            operator.pow,
+            operator.eq,
+            operator.ne,
+            operator.lt,
+            operator.le,
+            operator.gt,
+            operator.ge,
+            operator.and_,
+            operator.or_,
+            operator.xor,
+        ]:
+            name = f"__{op.__name__.strip('_')}__"
+            setattr(cls, name, cls._create_dense_method(op, name))
+
+
+EncodedArray._add_dense_ops()
@@ -0,0 +1,173 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import register_extension_dtype
+
+from compressio.arrays.base import EncodedArray, EncodedDtype
+
+# Number of bits set in each byte
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def count_bits(packed: np.ndarray) -> int:
+    """Number of bits that are set in a packed bit array"""
+    return int(POPCOUNT[packed].sum(dtype=np.int64))
+
+
+def boolean_values(values: Any) -> Any:
+    """The values as a numpy bool array, or as a nullable boolean array when values are missing
+
+    :param values: numpy array or pandas (extension) array of booleans, objects are accepted when all
+        values are booleans or missing
+    :return: the values
+    """
+    if isinstance(values, pd.arrays.SparseArray):
+        values = values.to_dense()
+    if isinstance(values, EncodedArray):
+        values = values.decode()
+    if isinstance(values, (np.ndarray, pd.arrays.BooleanArray)) and values.dtype in (
+        np.bool_,
+        "boolean",
+    ):
+        return values
+
+    values = np.asarray(values, dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("boolean", "empty"):
+        raise TypeError("Only booleans can be bit-packed")
+    array = pd.array(values, dtype="boolean")
+    if not array._mask.any():
+        return array._data
+    return array
+
+
+@register_extension_dtype
+class BitDtype(EncodedDtype):
+    encoding = "bits"
+
+    def __init__(self, subtype: Any = "bool"):
+        super().__init__(subtype)
+
+    @classmethod
+    def construct_array_type(cls):
+        return BitArray
+
+
+class BitArray(EncodedArray):
+    """Booleans packed in one bit per value, with a validity mask of one bit per value
+
+    Compared to numpy booleans (1 byte) and pandas' nullable booleans (2 bytes), this reduces the memory of
+    flag columns 8 to 16 times. `any`, `all`, `sum` and `mean` count the bits without unpacking them, and the
+    array can be used to index a series or frame.
+    """
+
+    _dtype_class = BitDtype
+
+    def __init__(
+        self,
+        bits: np.ndarray,
+        length: int,
+        valid: Optional[np.ndarray] = None,
+        subtype: Any = "bool",
+    ):
+        self._bits = bits
+        self._length = int(length)
+        self._valid = valid
+        self._dtype = BitDtype(subtype)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        return dtype == np.bool_ or str(dtype) in ("boolean", "object")
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "BitArray":
+        values = boolean_values(values)
+        if isinstance(values, np.ndarray):
+            data, missing = values, mask
+        else:
+            data, missing = values._data, values._mask
+            if mask is not None:
+                missing = missing | mask
+
+        if subtype is None:
+            subtype = values.dtype
+        subtype = pd.api.types.pandas_dtype(subtype)
+        if subtype != np.bool_ and str(subtype) != "boolean":
+            raise TypeError(f"Only booleans can be bit-packed, got {subtype}")
+
+        valid = None
+        if missing is not None and missing.any():
+            # Missing values are stored as False, so that the value bits can be counted directly
+            data = data & ~missing
+            valid = np.packbits(~missing)
+        return cls(np.packbits(data), len(data), valid, subtype)
+
+    def _unpack(self, packed: np.ndarray) -> np.ndarray:
+        return np.unpackbits(packed, count=self._length).view(np.bool_)
+
+    def decode(self) -> Any:
+        data = self._unpack(self._bits)
+        if self._valid is None and self.dtype.subtype == np.bool_:
+            return data
+        return pd.arrays.BooleanArray(data, self.isna())
+
+    @property
+    def dtype(self) -> BitDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        valid_size = 0 if self._valid is None else self._valid.nbytes
+        return int(self._bits.nbytes) + valid_size
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {"bits": self._bits, "length": self._length, "valid": self._valid}
+
+    def isna(self) -> np.ndarray:
+        if self._valid is None:
+            return np.zeros(self._length, dtype=bool)
+        return ~self._unpack(self._valid)
+
+    def _get_scalar(self, position: int) -> Any:
+        byte, bit = divmod(position, 8)
+        if self._valid is not None and not (self._valid[byte] >> (7 - bit)) & 1:
+            return self.dtype.na_value
+        return bool((self._bits[byte] >> (7 - bit)) & 1)
+
+    def _get_subset(self, item: Any) -> "BitArray":
+        data = self._unpack(self._bits)[item]
+        mask = None if self._valid is None else self.isna()[item]
+        return type(self).encode(data, mask, subtype=self.dtype.subtype)
+
+    def copy(self):
+        valid = None if self._valid is None else self._valid.copy()
+        return type(self)(self._bits.copy(), self._length, valid, self.dtype.subtype)
+
+    def _reduce(self, name: str, skipna: bool = True, **kwargs):
+        if self._valid is not None and not skipna:
+            # Kleene logic for missing values
+            return super()._reduce(name, skipna=skipna, **kwargs)
+
+        # Missing values are stored as False
+        true_count = count_bits(self._bits)
+        valid_count = self._length if self._valid is None else count_bits(self._valid)
+        if name in ("any", "max"):
+            if name == "max" and valid_count == 0:
+                return self.dtype.na_value
+            return true_count > 0
+        if name in ("all", "min"):
+            if name == "min" and valid_count == 0:
+                return self.dtype.na_value
+            return true_count == valid_count
+        if name == "sum":
+            if valid_count < kwargs.get("min_count", 0):
+                return self.dtype.na_value
+            return true_count
+        if name == "mean":
+            return true_count / valid_count if valid_count else np.nan
+        return super()._reduce(name, skipna=skipna, **kwargs)
@@ -0,0 +1,249 @@
+import re
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import register_extension_dtype
+from pandas.api.types import pandas_dtype
+
+from compressio.arrays.base import EncodedArray, EncodedDtype, split_mask
+from compressio.arrays.frame_of_reference import (
+    NULLABLE_DTYPES,
+    NumpyExtensionArray,
+    decoded_array,
+    storage_dtype,
+)
+from compressio.arrays.run_length import with_missing
+from compressio.codecs import DEFAULT_CODEC, get_codec
+
+# Number of values that are compressed together, reading a value decompresses its block
+BLOCK_SIZE = 65_536
+
+
+@register_extension_dtype
+class BlockDtype(EncodedDtype):
+    """Named after the decoded dtype and the codec, e.g. `blocks[int8, zlib]`"""
+
+    encoding = "blocks"
+    _metadata = ("subtype", "codec")
+
+    def __init__(self, subtype: Any = "int64", codec: str = DEFAULT_CODEC):
+        super().__init__(subtype)
+        self.codec = codec
+
+    @property
+    def name(self) -> str:
+        return f"{self.encoding}[{self.subtype}, {self.codec}]"
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "BlockDtype":
+        if not isinstance(string, str):
+            raise TypeError(
+                f"'construct_from_string' expects a string, got {type(string)}"
+            )
+
+        match = re.fullmatch(rf"{cls.encoding}\[(.+), (\w+)\]", string)
+        if match is None:
+            raise TypeError(f"Cannot construct a '{cls.__name__}' from '{string}'")
+        return cls(match.group(1), match.group(2))
+
+    @classmethod
+    def construct_array_type(cls):
+        return BlockCompressedArray
+
+
+class BlockCompressedArray(EncodedArray):
+    """Values compressed by a byte-level codec (zlib, lzma, zstd, lz4 or blosc) in blocks
+
+    Intended for cold columns that are rarely read: the narrowed buffer is split in blocks of `block_size`
+    values that are compressed separately, so that reading a value or a slice only decompresses the blocks
+    that hold it. Other operations decompress all blocks. Missing values are stored as a bit mask.
+    """
+
+    _dtype_class = BlockDtype
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        ends: np.ndarray,
+        length: int,
+        missing: Optional[np.ndarray] = None,
+        subtype: Any = "int64",
+        codec: str = DEFAULT_CODEC,
+        block_size: int = BLOCK_SIZE,
+    ):
+        self._data = data
+        self._ends = ends
+        self._length = int(length)
+        self._missing = missing
+        self._block_size = int(block_size)
+        self._dtype = BlockDtype(subtype, codec)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        if isinstance(dtype, np.dtype):
+            return dtype.kind in "biufcmM"
+        return isinstance(dtype, pd.DatetimeTZDtype) or str(dtype) in NULLABLE_DTYPES
+
+    @classmethod
+    def encode(
+        cls,
+        values: Any,
+        mask: Optional[np.ndarray] = None,
+        subtype: Any = None,
+        codec: str = DEFAULT_CODEC,
+        block_size: int = BLOCK_SIZE,
+    ) -> "BlockCompressedArray":
+        if subtype is None:
+            is_numpy = isinstance(values, (np.ndarray, NumpyExtensionArray))
+            subtype = np.asarray(values).dtype if is_numpy else values.dtype
+        subtype = pandas_dtype(subtype)
+        if not cls.supports(subtype):
+            raise TypeError(f"Only fixed-width values can be compressed, got {subtype}")
+
+        dtype = storage_dtype(subtype)
+        if dtype.kind in "mM":
+            array = pd.array(values, dtype=subtype)
+            data, missing = array.asi8, np.asarray(array.isna(), dtype=bool)
+            if mask is not None:
+                missing = missing | mask
+        else:
+            data, missing = split_mask(values, mask)
+            if missing is None:
+                missing = np.zeros(len(data), dtype=bool)
+            data = data.astype(dtype, copy=False)
+        if missing.any():
+            # Missing values are stored as zero, which compresses well
+            data = np.where(missing, 0, data)
+
+        compress, _ = get_codec(codec)
+        blocks = [
+            compress(np.ascontiguousarray(data[start : start + block_size]).tobytes())
+            for start in range(0, len(data), block_size)
+        ]
+        return cls(
+            np.frombuffer(b"".join(blocks), dtype=np.uint8),
+            np.cumsum([len(block) for block in blocks], dtype=np.int64),
+            len(data),
+            np.packbits(missing) if missing.any() else None,
+            subtype,
+            codec,
+            block_size,
+        )
+
+    def _encode_like(
+        self, values: Any, mask: Optional[np.ndarray] = None
+    ) -> "BlockCompressedArray":
+        return type(self).encode(
+            values,
+            mask,
+            subtype=self.dtype.subtype,
+            codec=self.dtype.codec,
+            block_size=self._block_size,
+        )
+
+    @classmethod
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
+        if isinstance(dtype, str):
+            dtype = pandas_dtype(dtype)
+        codec = dtype.codec if isinstance(dtype, BlockDtype) else DEFAULT_CODEC
+        if isinstance(dtype, EncodedDtype):
+            dtype = dtype.subtype
+        values = cls._sequence_values(scalars, dtype)
+        return cls.encode(values, subtype=dtype, codec=codec)
+
+    def _blocks(self, first: int, last: int) -> np.ndarray:
+        """The values of blocks `first` up to and including `last`"""
+        _, decompress = get_codec(self.dtype.codec)
+        starts = np.concatenate([[0], self._ends[:-1]])
+        raw = b"".join(
+            decompress(self._data[starts[block] : self._ends[block]].tobytes())
+            for block in range(first, last + 1)
+        )
+        dtype = storage_dtype(self.dtype.subtype)
+        return np.frombuffer(raw, dtype=np.int64 if dtype.kind in "mM" else dtype)
+
+    def _mask(self, start: int, stop: int) -> Optional[np.ndarray]:
+        if self._missing is None:
+            return None
+        # Only the bytes of the bit mask that hold positions `start` up to `stop` are unpacked
+        offset = start % 8
+        packed = self._missing[start // 8 : (stop + 7) // 8]
+        mask = np.unpackbits(packed, count=offset + stop - start).view(np.bool_)
+        return mask[offset:]
+
+    def _decoded(self, data: np.ndarray, mask: Optional[np.ndarray]) -> Any:
+        subtype = self.dtype.subtype
+        if storage_dtype(subtype).kind in "mM":
+            return decoded_array(data, mask, subtype)
+        if isinstance(subtype, np.dtype):
+            return with_missing(data.copy(), mask)
+        if mask is None:
+            mask = np.zeros(len(data), dtype=bool)
+        return subtype.construct_array_type()(data.copy(), mask)
+
+    def decode(self) -> Any:
+        if self._length == 0:
+            dtype = storage_dtype(self.dtype.subtype)
+            return self._decoded(np.zeros(0, dtype=dtype), None)
+        return self._decoded(
+            self._blocks(0, len(self._ends) - 1), self._mask(0, self._length)
+        )
+
+    @property
+    def dtype(self) -> BlockDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        missing_size = 0 if self._missing is None else self._missing.nbytes
+        return int(self._data.nbytes) + int(self._ends.nbytes) + missing_size
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {
+            "data": self._data,
+            "ends": self._ends,
+            "length": self._length,
+            "missing": self._missing,
+            "codec": self.dtype.codec,
+            "block_size": self._block_size,
+        }
+
+    def isna(self) -> np.ndarray:
+        mask = self._mask(0, self._length)
+        return np.zeros(self._length, dtype=bool) if mask is None else mask
+
+    def _get_scalar(self, position: int) -> Any:
+        mask = self._mask(position, position + 1)
+        if mask is not None and mask[0]:
+            return self.dtype.na_value
+        block = position // self._block_size
+        data = self._blocks(block, block)[position % self._block_size :][:1]
+        return self._decoded(data, None)[0]
+
+    def _get_subset(self, item: Any) -> "BlockCompressedArray":
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self._length)
+            if step == 1 and start < stop:
+                first, last = start // self._block_size, (stop - 1) // self._block_size
+                offset = first * self._block_size
+                data = self._blocks(first, last)[start - offset : stop - offset]
+                return self._encode_like(
+                    self._decoded(data, None), self._mask(start, stop)
+                )
+        return super()._get_subset(item)
+
+    def copy(self):
+        missing = None if self._missing is None else self._missing.copy()
+        return type(self)(
+            self._data.copy(),
+            self._ends.copy(),
+            self._length,
+            missing,
+            self.dtype.subtype,
+            self.dtype.codec,
+            self._block_size,
+        )
@@ -0,0 +1,193 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import register_extension_dtype
+
+from compressio.arrays.base import EncodedArray, EncodedDtype, split_mask
+from compressio.arrays.frame_of_reference import signed_types, smallest_type
+from compressio.sampling import sample_positions
+
+# Largest number of decimals that is considered, beyond this the values are not fixed-point decimals
+MAX_DECIMALS = 6
+
+# Number of values on which the number of decimals is determined, before it is verified on all values
+DECIMALS_SAMPLE_SIZE = 1_000
+
+
+def is_exact_scale(values: np.ndarray, decimals: int) -> bool:
+    """Whether the values are integers divided by 10**decimals, bit for bit"""
+    factor = 10.0**decimals
+    scaled = np.round(values.astype(np.float64) * factor)
+    if np.abs(scaled).max(initial=0) >= 2**53:
+        # Beyond 2**53 not every integer is a float64, so the division is no longer exact
+        return False
+    return np.array_equal((scaled / factor).astype(values.dtype), values)
+
+
+def find_decimals(
+    values: np.ndarray, max_decimals: int = MAX_DECIMALS
+) -> Optional[int]:
+    """The smallest number of decimals with which the values are represented exactly
+
+    :param values: finite floats
+    :param max_decimals: the largest number of decimals to try
+    :return: the number of decimals, or None when the values have more
+    """
+    sample = values[sample_positions(len(values), DECIMALS_SAMPLE_SIZE)]
+    for decimals in range(max_decimals + 1):
+        if is_exact_scale(sample, decimals) and is_exact_scale(values, decimals):
+            return decimals
+    return None
+
+
+@register_extension_dtype
+class DecimalDtype(EncodedDtype):
+    encoding = "decimal"
+
+    def __init__(self, subtype: Any = "float64"):
+        super().__init__(subtype)
+
+    @classmethod
+    def construct_array_type(cls):
+        return DecimalArray
+
+
+class DecimalArray(EncodedArray):
+    """Floats with a fixed number of decimals stored as scaled integers
+
+    Prices with two decimals, for example, are stored as the number of cents in 16 or 32 bits. A column is
+    only encoded when every value is restored bit for bit. Missing values (NaN) are stored in a separate
+    mask.
+    """
+
+    _dtype_class = DecimalDtype
+
+    def __init__(
+        self,
+        scaled: np.ndarray,
+        decimals: int,
+        mask: Optional[np.ndarray] = None,
+        subtype: Any = "float64",
+    ):
+        self._scaled = scaled
+        self._decimals = int(decimals)
+        self._mask = mask
+        self._dtype = DecimalDtype(subtype)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        return isinstance(dtype, np.dtype) and dtype.kind == "f"
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "DecimalArray":
+        data, mask = split_mask(values, mask)
+        subtype = np.dtype(subtype if subtype is not None else data.dtype)
+        if subtype.kind != "f":
+            raise TypeError(f"Only floats can be encoded, got {subtype}")
+        data = data.astype(subtype, copy=False)
+
+        valid = data if mask is None else data[~mask]
+        if not np.isfinite(valid).all() or np.signbit(valid[valid == 0]).any():
+            raise ValueError("Infinite values and negative zero are not decimals")
+        decimals = find_decimals(valid)
+        if decimals is None:
+            raise ValueError(f"The values have more than {MAX_DECIMALS} decimals")
+
+        scaled = np.round(data.astype(np.float64) * 10.0**decimals)
+        if mask is not None:
+            scaled[mask] = 0
+        scaled_type = smallest_type(
+            signed_types, scaled.min(initial=0), scaled.max(initial=0)
+        )
+        return cls(scaled.astype(scaled_type), decimals, mask, subtype)
+
+    def _decode_scaled(self, scaled: np.ndarray) -> np.ndarray:
+        values = scaled.astype(np.float64) / 10.0**self._decimals
+        return values.astype(self.dtype.subtype, copy=False)
+
+    def decode(self) -> np.ndarray:
+        values = self._decode_scaled(self._scaled)
+        if self._mask is not None:
+            values[self._mask] = np.nan
+        return values
+
+    @property
+    def dtype(self) -> DecimalDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        mask_size = 0 if self._mask is None else self._mask.nbytes
+        return int(self._scaled.nbytes) + mask_size + 8
+
+    def __len__(self) -> int:
+        return len(self._scaled)
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {"scaled": self._scaled, "decimals": self._decimals, "mask": self._mask}
+
+    def _with_scaled(
+        self, scaled: np.ndarray, mask: Optional[np.ndarray]
+    ) -> "DecimalArray":
+        if mask is not None and not mask.any():
+            mask = None
+        return type(self)(scaled, self._decimals, mask, self.dtype.subtype)
+
+    def _get_scalar(self, position: int) -> Any:
+        if self._mask is not None and self._mask[position]:
+            return self.dtype.na_value
+        return self._decode_scaled(self._scaled[position : position + 1])[0]
+
+    def _get_subset(self, item: Any) -> "DecimalArray":
+        mask = None if self._mask is None else self._mask[item]
+        return self._with_scaled(self._scaled[item], mask)
+
+    def isna(self) -> np.ndarray:
+        if self._mask is None:
+            return np.zeros(len(self), dtype=bool)
+        return self._mask.copy()
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            mask = None if self._mask is None else self._mask.take(indices)
+            return self._with_scaled(self._scaled.take(indices), mask)
+
+        if (indices < -1).any():
+            raise ValueError(
+                "Invalid value in 'indices', must be >= -1 with allow_fill"
+            )
+        if fill_value is not None and not pd.isna(fill_value):
+            raise ValueError(f"{type(self).__name__} can only fill missing values")
+
+        missing = indices == -1
+        if len(self) == 0:
+            if not missing.all():
+                raise IndexError("cannot do a non-empty take from an empty array")
+            scaled = np.zeros(len(indices), dtype=self._scaled.dtype)
+            return self._with_scaled(scaled, missing)
+
+        indices = np.where(missing, 0, indices)
+        mask = missing if self._mask is None else missing | self._mask.take(indices)
+        return self._with_scaled(self._scaled.take(indices), mask)
+
+    def copy(self):
+        mask = None if self._mask is None else self._mask.copy()
+        return self._with_scaled(self._scaled.copy(), mask)
+
+    def _reduce(self, name: str, skipna: bool = True, **kwargs):
+        # The order of the scaled integers is the order of the values
+        if name in ("min", "max"):
+            scaled = self._scaled
+            if self._mask is not None:
+                if not skipna:
+                    return self.dtype.na_value
+                scaled = scaled[~self._mask]
+            if len(scaled) == 0:
+                return self.dtype.na_value
+            extreme = scaled.min() if name == "min" else scaled.max()
+            return self._decode_scaled(np.array([extreme]))[0]
+        return super()._reduce(name, skipna=skipna, **kwargs)
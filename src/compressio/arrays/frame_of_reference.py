@@ -0,0 +1,387 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import register_extension_dtype
+
+from compressio.arrays.base import EncodedArray, EncodedDtype, split_mask
+
+# Renamed in pandas 2.1
+NumpyExtensionArray = getattr(pd.arrays, "NumpyExtensionArray", None) or getattr(
+    pd.arrays, "PandasArray"
+)
+
+unsigned_types = [np.uint8, np.uint16, np.uint32, np.uint64]
+signed_types = [np.int8, np.int16, np.int32, np.int64]
+
+
+def smallest_type(types, minv: int, maxv: int) -> np.dtype:
+    """The first type of which the range contains minv and maxv"""
+    for dtype in types:
+        info = np.iinfo(dtype)
+        if info.min <= minv and maxv <= info.max:
+            return np.dtype(dtype)
+    raise ValueError(f"No integer type holds the range [{minv}, {maxv}]")
+
+
+# Nullable integer dtypes, which are encoded with their mask
+NULLABLE_INTEGERS = {
+    "Int8",
+    "Int16",
+    "Int32",
+    "Int64",
+    "UInt8",
+    "UInt16",
+    "UInt32",
+    "UInt64",
+}
+
+# Nullable extension dtypes, which are stored as their values and mask
+NULLABLE_DTYPES = NULLABLE_INTEGERS | {"Float32", "Float64", "boolean"}
+
+
+def storage_dtype(subtype: Any) -> np.dtype:
+    """The numpy dtype of the decoded values, also for nullable integers and timezone-aware datetimes"""
+    if isinstance(subtype, pd.DatetimeTZDtype):
+        return np.dtype(f"M8[{subtype.unit}]")
+    return np.dtype(getattr(subtype, "numpy_dtype", subtype))
+
+
+def integer_dtype(subtype: Any) -> np.dtype:
+    """The integer dtype in which the values are encoded, datetimes and timedeltas are int64"""
+    dtype = storage_dtype(subtype)
+    return np.dtype(np.int64) if dtype.kind in "mM" else dtype
+
+
+def is_encodable(dtype: Any) -> bool:
+    """Whether the dtype holds integers, datetimes or timedeltas"""
+    if isinstance(dtype, np.dtype):
+        return dtype.kind in "iumM"
+    return isinstance(dtype, pd.DatetimeTZDtype) or str(dtype) in NULLABLE_INTEGERS
+
+
+def _dense_values(values: Any, mask: Optional[np.ndarray], subtype: Any):
+    """The values as integers with the missing positions set to zero, the mask and the decoded dtype"""
+    if subtype is None:
+        # The dtype of numpy-backed pandas arrays is a wrapper of the numpy dtype
+        is_numpy = isinstance(values, (np.ndarray, NumpyExtensionArray))
+        subtype = np.asarray(values).dtype if is_numpy else values.dtype
+    subtype = pd.api.types.pandas_dtype(subtype)
+    if not is_encodable(subtype):
+        raise TypeError(f"Only integers and datetimes can be encoded, got {subtype}")
+
+    if storage_dtype(subtype).kind in "mM":
+        # Datetimes are encoded as their int64 representation (in UTC)
+        array = pd.array(values, dtype=subtype)
+        missing = np.asarray(array.isna(), dtype=bool)
+        if mask is not None:
+            missing = missing | mask
+        data = np.where(missing, 0, array.asi8)
+        return data, (missing if missing.any() else None), subtype
+
+    data, mask = split_mask(values, mask)
+    if mask is not None:
+        data = np.where(mask, 0, data)
+    return data.astype(integer_dtype(subtype), copy=False), mask, subtype
+
+
+def to_unsigned(data: np.ndarray) -> np.ndarray:
+    """View integers as uint64, on which arithmetic wraps around"""
+    return data.astype(np.int64 if data.dtype.kind == "i" else np.uint64).view(
+        np.uint64
+    )
+
+
+def from_unsigned(data: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if dtype.kind == "i":
+        data = data.view(np.int64)
+    return data.astype(dtype, copy=False)
+
+
+def find_step(values: np.ndarray) -> int:
+    """The largest step that divides all values, e.g. 10**9 for datetimes with a resolution of seconds"""
+    if len(values) == 0:
+        return 1
+    return int(np.gcd.reduce(values)) or 1
+
+
+def decoded_array(data: np.ndarray, mask: Optional[np.ndarray], subtype: Any) -> Any:
+    """Decoded values: a numpy array, or a pandas array for missing integers and datetimes"""
+    dtype = storage_dtype(subtype)
+    if dtype.kind in "mM":
+        if mask is not None:
+            data = np.where(mask, np.iinfo(np.int64).min, data)
+        if dtype.kind == "m":
+            return pd.arrays.TimedeltaArray(data.view(dtype))
+        if isinstance(subtype, pd.DatetimeTZDtype):
+            return pd.arrays.DatetimeArray(data.view(dtype), dtype=subtype)
+        return pd.arrays.DatetimeArray(data.view(dtype))
+
+    if mask is None and isinstance(subtype, np.dtype):
+        return data
+    if mask is None:
+        mask = np.zeros(len(data), dtype=bool)
+    return pd.arrays.IntegerArray(data, mask)
+
+
+@register_extension_dtype
+class FrameOfReferenceDtype(EncodedDtype):
+    encoding = "for"
+
+    @classmethod
+    def construct_array_type(cls):
+        return FrameOfReferenceArray
+
+
+class FrameOfReferenceArray(EncodedArray):
+    """Integers and datetimes stored as unsigned offsets from a base value (the minimum)
+
+    Clustered values, such as identifiers that fall in a narrow window, are stored in 8 or 16 bits per value
+    regardless of their magnitude. The offsets are counted in steps of the largest common divisor, so that
+    timestamps with a resolution of seconds spanning a few days fit in 32 bits. Missing values are stored in
+    a separate mask.
+    """
+
+    _dtype_class = FrameOfReferenceDtype
+
+    def __init__(
+        self,
+        offsets: np.ndarray,
+        base: int,
+        mask: Optional[np.ndarray] = None,
+        subtype: Any = "int64",
+        step: int = 1,
+    ):
+        self._offsets = offsets
+        self._base = int(base)
+        self._step = int(step)
+        self._mask = mask
+        self._dtype = FrameOfReferenceDtype(subtype)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        return is_encodable(dtype)
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "FrameOfReferenceArray":
+        data, mask, subtype = _dense_values(values, mask, subtype)
+        valid = data if mask is None else data[~mask]
+        if len(valid) == 0:
+            return cls(np.zeros(len(data), dtype=np.uint8), 0, mask, subtype)
+
+        base, maxv = int(valid.min()), int(valid.max())
+        offsets = to_unsigned(data) - np.uint64(base % 2**64)
+        if mask is not None:
+            offsets[mask] = 0
+        step = find_step(offsets)
+        if step > 1:
+            offsets //= np.uint64(step)
+
+        offset_type = smallest_type(unsigned_types, 0, (maxv - base) // step)
+        return cls(offsets.astype(offset_type), base, mask, subtype, step)
+
+    def _decode_offsets(self, offsets: np.ndarray) -> np.ndarray:
+        data = offsets.astype(np.uint64) * np.uint64(self._step)
+        data += np.uint64(self._base % 2**64)
+        return from_unsigned(data, integer_dtype(self.dtype.subtype))
+
+    def decode(self) -> Any:
+        return decoded_array(
+            self._decode_offsets(self._offsets), self._mask, self.dtype.subtype
+        )
+
+    @property
+    def dtype(self) -> FrameOfReferenceDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        mask_size = 0 if self._mask is None else self._mask.nbytes
+        return int(self._offsets.nbytes) + mask_size + 16
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {
+            "offsets": self._offsets,
+            "base": self._base,
+            "mask": self._mask,
+            "step": self._step,
+        }
+
+    def _with_offsets(
+        self, offsets: np.ndarray, mask: Optional[np.ndarray]
+    ) -> "FrameOfReferenceArray":
+        if mask is not None and not mask.any():
+            mask = None
+        return type(self)(offsets, self._base, mask, self.dtype.subtype, self._step)
+
+    def _decode_scalar(self, offset: Any) -> Any:
+        data = self._decode_offsets(np.array([offset]))
+        return decoded_array(data, None, self.dtype.subtype)[0]
+
+    def _get_scalar(self, position: int) -> Any:
+        if self._mask is not None and self._mask[position]:
+            return self.dtype.na_value
+        return self._decode_scalar(self._offsets[position])
+
+    def _get_subset(self, item: Any) -> "FrameOfReferenceArray":
+        mask = None if self._mask is None else self._mask[item]
+        return self._with_offsets(self._offsets[item], mask)
+
+    def isna(self) -> np.ndarray:
+        if self._mask is None:
+            return np.zeros(len(self), dtype=bool)
+        return self._mask.copy()
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            mask = None if self._mask is None else self._mask.take(indices)
+            return self._with_offsets(self._offsets.take(indices), mask)
+
+        if (indices < -1).any():
+            raise ValueError(
+                "Invalid value in 'indices', must be >= -1 with allow_fill"
+            )
+        if fill_value is not None and not pd.isna(fill_value):
+            raise ValueError(f"{type(self).__name__} can only fill missing values")
+
+        missing = indices == -1
+        if len(self) == 0:
+            if not missing.all():
+                raise IndexError("cannot do a non-empty take from an empty array")
+            offsets = np.zeros(len(indices), dtype=self._offsets.dtype)
+            return self._with_offsets(offsets, missing)
+
+        indices = np.where(missing, 0, indices)
+        mask = missing if self._mask is None else missing | self._mask.take(indices)
+        return self._with_offsets(self._offsets.take(indices), mask)
+
+    def copy(self):
+        mask = None if self._mask is None else self._mask.copy()
+        return self._with_offsets(self._offsets.copy(), mask)
+
+    def _reduce(self, name: str, skipna: bool = True, **kwargs):
+        # The minimum and maximum are found on the (narrow) offsets
+        if name in ("min", "max"):
+            offsets = self._offsets
+            if self._mask is not None:
+                if not skipna:
+                    return self.dtype.na_value
+                offsets = offsets[~self._mask]
+            if len(offsets) == 0:
+                return self.dtype.na_value
+            return self._decode_scalar(
+                offsets.min() if name == "min" else offsets.max()
+            )
+        return super()._reduce(name, skipna=skipna, **kwargs)
+
+
+@register_extension_dtype
+class DeltaDtype(EncodedDtype):
+    encoding = "delta"
+
+    @classmethod
+    def construct_array_type(cls):
+        return DeltaArray
+
+
+class DeltaArray(EncodedArray):
+    """Integers and datetimes stored as the first value and the differences between consecutive values
+
+    Monotone columns with small steps, such as row identifiers, sorted keys and timestamps, are stored in
+    8 or 16 bits per value even when their range is wide. As for frame-of-reference encoding, the
+    differences are counted in steps of their largest common divisor. Missing values are stored in a
+    separate mask, the difference over a missing value is zero. Access to a single value decodes the whole
+    array.
+    """
+
+    _dtype_class = DeltaDtype
+
+    def __init__(
+        self,
+        deltas: np.ndarray,
+        first: int,
+        length: int,
+        mask: Optional[np.ndarray] = None,
+        subtype: Any = "int64",
+        step: int = 1,
+    ):
+        self._deltas = deltas
+        self._first = int(first)
+        self._step = int(step)
+        self._length = length
+        self._mask = mask
+        self._dtype = DeltaDtype(subtype)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        return is_encodable(dtype)
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "DeltaArray":
+        data, mask, subtype = _dense_values(values, mask, subtype)
+        if mask is not None:
+            valid = np.flatnonzero(~mask)
+            if len(valid) > 0:
+                # Repeat the previous valid value at the missing positions, so that the differences are zero
+                positions = np.where(mask, -1, np.arange(len(data)))
+                positions = np.maximum.accumulate(positions)
+                data = data[np.where(positions < 0, valid[0], positions)]
+
+        if len(data) == 0:
+            return cls(np.zeros(0, dtype=np.int8), 0, 0, mask, subtype)
+
+        # Differences wrap around in uint64, the signed view is the true difference for all but huge steps
+        deltas = np.diff(to_unsigned(data)).view(np.int64)
+        step = find_step(deltas)
+        if len(deltas) > 0:
+            deltas = deltas // step
+            delta_type = smallest_type(signed_types, deltas.min(), deltas.max())
+            deltas = deltas.astype(delta_type)
+        first = int(data[0])
+        return cls(deltas, first, len(data), mask, subtype, step)
+
+    def decode(self) -> Any:
+        if self._length == 0:
+            data = np.zeros(0, dtype=np.uint64)
+        else:
+            data = np.empty(self._length, dtype=np.uint64)
+            data[0] = np.uint64(self._first % 2**64)
+            data[1:] = self._deltas.astype(np.int64).view(np.uint64)
+            data[1:] *= np.uint64(self._step)
+            data = np.cumsum(data, dtype=np.uint64)
+        data = from_unsigned(data, integer_dtype(self.dtype.subtype))
+        return decoded_array(data, self._mask, self.dtype.subtype)
+
+    @property
+    def dtype(self) -> DeltaDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        mask_size = 0 if self._mask is None else self._mask.nbytes
+        return int(self._deltas.nbytes) + mask_size + 16
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {
+            "deltas": self._deltas,
+            "first": self._first,
+            "length": self._length,
+            "mask": self._mask,
+            "step": self._step,
+        }
+
+    def isna(self) -> np.ndarray:
+        if self._mask is None:
+            return np.zeros(len(self), dtype=bool)
+        return self._mask.copy()
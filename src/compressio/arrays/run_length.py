@@ -0,0 +1,306 @@
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, register_extension_dtype
+
+from compressio.arrays.base import EncodedArray, EncodedDtype
+from compressio.arrays.frame_of_reference import (
+    NULLABLE_DTYPES,
+    NumpyExtensionArray,
+    smallest_type,
+    unsigned_types,
+)
+
+# Only encode a column when the number of runs is at most this fraction of its length
+MAX_RUN_RATIO = 0.1
+
+
+def with_missing(values: Any, mask: Optional[np.ndarray]) -> Any:
+    """Set the masked values to missing, integers and booleans become nullable"""
+    if mask is None or not mask.any():
+        return values
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "iu":
+            return pd.arrays.IntegerArray(values, mask)
+        if values.dtype.kind == "b":
+            return pd.arrays.BooleanArray(values, mask)
+        return pd.Series(values, copy=False).mask(mask).to_numpy()
+    indices = np.where(mask, -1, np.arange(len(values)))
+    return values.take(indices, allow_fill=True)
+
+
+def run_starts(values: Any, missing: np.ndarray) -> np.ndarray:
+    """Positions where a run of equal values starts, missing values form runs of their own"""
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp)
+    codes, _ = pd.factorize(values)
+    codes = np.where(missing, -1, codes)
+    changes = codes[1:] != codes[:-1]
+
+    # 0.0 == -0.0 and 1 == 1.0 == True, but replacing one by the other is not lossless (see `fill_positions`)
+    kind = getattr(values.dtype, "kind", None)
+    if kind in ("f", "c"):
+        numbers = (
+            values
+            if isinstance(values, np.ndarray)
+            else values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=np.nan)
+        )
+        signs = np.signbit(numbers.real) + 2 * np.signbit(numbers.imag)
+        changes |= signs[1:] != signs[:-1]
+    elif isinstance(values, np.ndarray) and values.dtype == object:
+        types, _ = pd.factorize(
+            np.fromiter(map(id, map(type, values)), np.int64, len(values))
+        )
+        changes |= types[1:] != types[:-1]
+    return np.flatnonzero(np.concatenate([[True], changes]))
+
+
+@register_extension_dtype
+class RunLengthDtype(EncodedDtype):
+    encoding = "rle"
+
+    @classmethod
+    def construct_array_type(cls):
+        return RunLengthArray
+
+
+class RunLengthArray(EncodedArray):
+    """Values stored as runs: the value of each run and the position where it ends
+
+    Status, flag and key columns of time series often repeat the same value for long stretches. Slicing,
+    `take`, `isna` and the reductions (min, max, sum, mean, any, all) operate on the runs without expanding
+    them. Values of any dtype can be encoded, missing values are stored in a mask over the runs.
+    """
+
+    _dtype_class = RunLengthDtype
+
+    def __init__(
+        self,
+        values: Any,
+        run_ends: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        subtype: Any = None,
+    ):
+        self._values = values
+        self._run_ends = run_ends
+        self._mask = mask
+        self._dtype = RunLengthDtype(subtype if subtype is not None else values.dtype)
+
+    @classmethod
+    def supports(cls, dtype: Any) -> bool:
+        # The dtypes of which `pd.factorize` hashes the values, nested values such as Arrow lists are not
+        if isinstance(dtype, np.dtype):
+            return dtype.kind in "biufcmMOSU"
+        return (
+            isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype, pd.DatetimeTZDtype))
+            or str(dtype) in NULLABLE_DTYPES
+        )
+
+    @classmethod
+    def encode(
+        cls, values: Any, mask: Optional[np.ndarray] = None, subtype: Any = None
+    ) -> "RunLengthArray":
+        if isinstance(values, NumpyExtensionArray):
+            values = values.to_numpy()
+        elif not isinstance(values, (np.ndarray, ExtensionArray)):
+            values = np.asarray(values)
+        if subtype is not None and pd.api.types.pandas_dtype(subtype) != values.dtype:
+            values = pd.Series(values, copy=False).astype(subtype).array
+            if isinstance(values, NumpyExtensionArray):
+                values = values.to_numpy()
+
+        missing = np.asarray(pd.isna(values), dtype=bool)
+        if mask is not None:
+            missing = missing | mask
+        starts = run_starts(values, missing)
+        run_ends = np.append(starts[1:], len(values))
+
+        run_mask = missing[starts]
+        return cls(
+            values[starts],
+            run_ends.astype(smallest_type(unsigned_types, 0, len(values))),
+            run_mask if run_mask.any() else None,
+            values.dtype,
+        )
+
+    @classmethod
+    def compress(cls, values: Any) -> Optional["RunLengthArray"]:
+        array = super().compress(values)
+        if array is None or array.run_count > MAX_RUN_RATIO * len(array):
+            return None
+        return array
+
+    @property
+    def run_count(self) -> int:
+        return len(self._run_ends)
+
+    @property
+    def run_values(self) -> Any:
+        """The value of each run"""
+        return with_missing(self._values, self._mask)
+
+    @property
+    def run_lengths(self) -> np.ndarray:
+        """The length of each run"""
+        return np.diff(self._run_ends, prepend=0).astype(np.int64)
+
+    def _run_ids(self, positions: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self._run_ends, positions, side="right")
+
+    def decode(self) -> Any:
+        run_ids = np.repeat(np.arange(self.run_count), self.run_lengths)
+        values = self._values[run_ids]
+        return with_missing(values, None if self._mask is None else self._mask[run_ids])
+
+    @property
+    def dtype(self) -> RunLengthDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        mask_size = 0 if self._mask is None else self._mask.nbytes
+        return int(self._values.nbytes) + int(self._run_ends.nbytes) + mask_size
+
+    def __len__(self) -> int:
+        return int(self._run_ends[-1]) if self.run_count > 0 else 0
+
+    def _encoded_state(self) -> Dict[str, Any]:
+        return {"values": self._values, "run_ends": self._run_ends, "mask": self._mask}
+
+    def _from_run_ids(
+        self, run_ids: np.ndarray, missing: Optional[np.ndarray] = None
+    ) -> "RunLengthArray":
+        """The values of the given runs, in which consecutive equal run ids form a run
+
+        :param run_ids: run of each value
+        :param missing: values that are missing regardless of their run (e.g. filled by `take`)
+        """
+        if len(run_ids) == 0:
+            starts = np.zeros(0, dtype=np.intp)
+        else:
+            changes = run_ids[1:] != run_ids[:-1]
+            if missing is not None:
+                changes |= missing[1:] != missing[:-1]
+            starts = np.flatnonzero(np.concatenate([[True], changes]))
+        run_ends = np.append(starts[1:], len(run_ids))
+
+        starts_ids = run_ids[starts]
+        mask = None if self._mask is None else self._mask[starts_ids]
+        if missing is not None:
+            mask = missing[starts] if mask is None else mask | missing[starts]
+        if mask is not None and not mask.any():
+            mask = None
+
+        return type(self)(
+            self._values[starts_ids],
+            run_ends.astype(smallest_type(unsigned_types, 0, len(run_ids))),
+            mask,
+            self.dtype.subtype,
+        )
+
+    def _get_scalar(self, position: int) -> Any:
+        run_id = self._run_ids(position)
+        if self._mask is not None and self._mask[run_id]:
+            return self.dtype.na_value
+        return self._values[run_id]
+
+    def _get_subset(self, item: Any) -> "RunLengthArray":
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step != 1:
+                return self.take(np.arange(start, stop, step))
+            if stop <= start:
+                return self.take(np.zeros(0, dtype=np.intp))
+
+            first, last = self._run_ids(np.array([start, stop - 1]))
+            run_ends = np.minimum(self._run_ends[first : last + 1], stop) - start
+            mask = None if self._mask is None else self._mask[first : last + 1]
+            if mask is not None and not mask.any():
+                mask = None
+            return type(self)(
+                self._values[first : last + 1],
+                run_ends.astype(smallest_type(unsigned_types, 0, stop - start)),
+                mask,
+                self.dtype.subtype,
+            )
+
+        item = np.asarray(item)
+        if item.dtype == bool:
+            item = np.flatnonzero(item)
+        return self.take(item)
+
+    def isna(self) -> np.ndarray:
+        if self._mask is None:
+            return np.zeros(len(self), dtype=bool)
+        return np.repeat(self._mask, self.run_lengths)
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        indices = np.asarray(indices, dtype=np.intp)
+        if not allow_fill:
+            indices = np.where(indices < 0, indices + len(self), indices)
+            if ((indices < 0) | (indices >= len(self))).any():
+                raise IndexError("indices are out of bounds")
+            return self._from_run_ids(self._run_ids(indices))
+
+        if (indices < -1).any():
+            raise ValueError(
+                "Invalid value in 'indices', must be >= -1 with allow_fill"
+            )
+        if fill_value is not None and not pd.isna(fill_value):
+            raise ValueError(f"{type(self).__name__} can only fill missing values")
+
+        missing = indices == -1
+        if len(self) == 0 and not missing.all():
+            raise IndexError("cannot do a non-empty take from an empty array")
+        if (indices >= len(self)).any():
+            raise IndexError("indices are out of bounds")
+        if len(self) == 0:
+            # Runs of missing values need a value to refer to
+            subtype = self.dtype.subtype
+            if isinstance(subtype, np.dtype):
+                values = np.zeros(1, dtype=subtype)
+            else:
+                array_type = subtype.construct_array_type()
+                values = array_type._from_sequence([subtype.na_value], dtype=subtype)
+            empty = type(self)(values, np.ones(1, dtype=np.uint8), None, subtype)
+            return empty._from_run_ids(np.zeros(len(indices), dtype=np.intp), missing)
+
+        run_ids = self._run_ids(np.where(missing, 0, indices))
+        return self._from_run_ids(run_ids, missing)
+
+    def copy(self):
+        mask = None if self._mask is None else self._mask.copy()
+        return type(self)(
+            self._values.copy(), self._run_ends.copy(), mask, self.dtype.subtype
+        )
+
+    def _reduce(self, name: str, skipna: bool = True, **kwargs):
+        values, lengths = self._values, self.run_lengths
+        if self._mask is not None:
+            if not skipna and name in ("min", "max", "sum", "mean"):
+                return self.dtype.na_value
+            values, lengths = values[~self._mask], lengths[~self._mask]
+
+        if name in ("min", "max", "any", "all"):
+            # Only the distinct values matter, not how often they occur
+            series = pd.Series(values, copy=False)
+            return getattr(series, name)(skipna=skipna)
+
+        is_numeric = isinstance(values, np.ndarray) and values.dtype.kind in "iufb"
+        if name in ("sum", "mean") and is_numeric:
+            count = int(lengths.sum())
+            if name == "mean":
+                return (
+                    np.dot(values.astype(np.float64), lengths) / count
+                    if count
+                    else np.nan
+                )
+            if count < kwargs.get("min_count", 0):
+                return self.dtype.na_value
+            if values.dtype.kind == "f":
+                return np.dot(values.astype(np.float64), lengths)
+            if values.dtype.kind == "u":
+                return np.dot(values.astype(np.uint64), lengths.astype(np.uint64))
+            return np.dot(values.astype(np.int64), lengths)
+        return super()._reduce(name, skipna=skipna, **kwargs)
@@ -0,0 +1,358 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from visions import VisionsTypeset
+
+from compressio.arrays import ENCODINGS, BitDtype, BlockDtype, EncodedDtype
+from compressio.codecs import DEFAULT_CODEC
+from compressio.compress import fit_series
+from compressio.compression_algorithms import compress_blocks
+from compressio.parallel import parallel_map
+from compressio.plan import ColumnPlan, CompressionPlan
+from compressio.size import estimate_size, index_size
+from compressio.type_compressor import (
+    BaseTypeCompressor,
+    DefaultCompressor,
+    SparseCompressor,
+)
+from compressio.typesets import (
+    DefaultCompressioTypeset,
+    SparseCompressioTypeset,
+    cached_typeset,
+)
+
+if TYPE_CHECKING:
+    from pint import Quantity
+
+# Relative cost of reading a value in each representation, dense numpy and categorical values are free
+ACCESS_COSTS = {
+    "dense": 0.0,
+    "bits": 0.5,
+    "sparse": 1.0,
+    "encoded": 2.0,
+    "blocks": 10.0,
+}
+
+
+def access_cost(dtype: Any) -> float:
+    """Relative cost of reading a value of this dtype, see `ACCESS_COSTS`"""
+    if isinstance(dtype, BlockDtype):
+        return ACCESS_COSTS["blocks"]
+    if isinstance(dtype, BitDtype):
+        return ACCESS_COSTS["bits"]
+    if isinstance(dtype, EncodedDtype):
+        return ACCESS_COSTS["encoded"]
+    if isinstance(dtype, pd.SparseDtype):
+        return ACCESS_COSTS["sparse"]
+    return ACCESS_COSTS["dense"]
+
+
+def default_candidates() -> Dict[str, Tuple[VisionsTypeset, BaseTypeCompressor]]:
+    """Narrowed dtypes and categories, sparse arrays and encoded arrays"""
+    return {
+        "narrow": (cached_typeset(DefaultCompressioTypeset), DefaultCompressor()),
+        "sparse": (cached_typeset(SparseCompressioTypeset), SparseCompressor()),
+        "encoded": (
+            cached_typeset(DefaultCompressioTypeset),
+            DefaultCompressor(encodings=tuple(ENCODINGS)),
+        ),
+    }
+
+
+def to_bytes(size: Union[int, float, str, "Quantity"]) -> float:
+    """A size in bytes, from a number of bytes or from a quantity such as `"4 GB"`"""
+    from pint import Quantity
+
+    if isinstance(size, (int, float, np.number)):
+        return float(size)
+    return float(Quantity(size).to("byte").magnitude)
+
+
+class Candidate:
+    """A representation of a column, with its size in bytes and its (unweighted) access cost
+
+    Only the measurements and the plan are kept, the compressed column is rebuilt by `build_candidate` once
+    the candidate is chosen.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dtype: Any,
+        plan: Optional[ColumnPlan],
+        nbytes: int,
+        cost: float,
+        compressor: Optional[str] = None,
+        codec: Optional[str] = None,
+    ):
+        """
+        :param name: the name of the candidate, e.g. "narrow+zlib"
+        :param dtype: the dtype of the compressed column
+        :param plan: the plan of the compressed column
+        :param nbytes: the size of the compressed column
+        :param cost: the access cost of the compressed column
+        :param compressor: the candidate compressor, None for the original column
+        :param codec: the codec by which the compressed column is compressed in blocks, if any
+        """
+        self.name = name
+        self.dtype = dtype
+        self.plan = plan
+        self.nbytes = nbytes
+        self.cost = cost
+        self.compressor = compressor
+        self.codec = codec
+
+    @classmethod
+    def measure(
+        cls,
+        name: str,
+        series: pd.Series,
+        plan: ColumnPlan,
+        compressor: Optional[str] = None,
+        codec: Optional[str] = None,
+    ) -> "Candidate":
+        """The candidate of a compressed column"""
+        nbytes = estimate_size(series, index=False)
+        cost = access_cost(series.dtype) * len(series)
+        return cls(name, series.dtype, plan, nbytes, cost, compressor, codec)
+
+    def __repr__(self) -> str:
+        return f"Candidate({self.name}, {self.dtype}, {self.nbytes} bytes)"
+
+
+def column_candidates(
+    series: pd.Series,
+    candidates: Dict[str, Tuple[VisionsTypeset, BaseTypeCompressor]],
+    codec: Optional[str],
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> List[Candidate]:
+    """Compress a column with each candidate, keeping the candidates that are smaller than cheaper ones
+
+    The original column is a candidate, and each dense candidate is also compressed in blocks by the codec.
+    The compressed columns are measured and dropped, so that the compressed columns of a single candidate are held at a time.
+
+    :return: the candidates, by increasing access cost
+    """
+    all_candidates = []
+    visions_type = None
+    for name, (typeset, compressor) in candidates.items():
+        compressed, plan = fit_series(
+            series, typeset, compressor, with_inference, sample_size
+        )
+        visions_type = visions_type or plan.visions_type
+        all_candidates.append(
+            Candidate.measure(name, compressed, plan, compressor=name)
+        )
+        if codec is not None:
+            blocks = compress_blocks(compressed, codec=codec)
+            if blocks is not compressed:
+                blocks_plan = ColumnPlan.from_series(blocks, plan.visions_type)
+                all_candidates.append(
+                    Candidate.measure(
+                        f"{name}+{codec}",
+                        blocks,
+                        blocks_plan,
+                        compressor=name,
+                        codec=codec,
+                    )
+                )
+
+    original_plan = ColumnPlan.from_series(series, visions_type or "Generic")
+    all_candidates.insert(0, Candidate.measure("original", series, original_plan))
+
+    result: List[Candidate] = []
+    for candidate in sorted(all_candidates, key=lambda c: (c.cost, c.nbytes)):
+        # Dominated: a candidate that is at most as expensive is at least as small
+        if all(candidate.nbytes < other.nbytes for other in result):
+            result.append(candidate)
+    return result
+
+
+def build_candidate(
+    item: Tuple[pd.Series, Candidate],
+    candidates: Dict[str, Tuple[VisionsTypeset, BaseTypeCompressor]],
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> pd.Series:
+    """Compress a column into the representation of its chosen candidate
+
+    :param item: the column and its candidate, from `column_candidates` with the same arguments
+    :return: the compressed column
+    """
+    series, candidate = item
+    if candidate.compressor is None:
+        return series
+    typeset, compressor = candidates[candidate.compressor]
+    compressed, _ = fit_series(series, typeset, compressor, with_inference, sample_size)
+    if candidate.codec is not None:
+        compressed = compress_blocks(compressed, codec=candidate.codec)
+    return compressed
+
+
+def choose_candidates(
+    candidates: Dict[Any, List[Candidate]],
+    budget: float,
+    access_frequency: Dict[Any, float],
+) -> Dict[Any, Candidate]:
+    """Choose a candidate per column that fits the budget at the least weighted access cost
+
+    Starts from the cheapest candidate of every column, and greedily moves the column with the largest
+    saving per unit of additional cost to a smaller candidate, until the columns fit the budget.
+
+    :param candidates: the candidates by column, by increasing access cost
+    :param budget: the size in bytes that the columns have to fit in
+    :param access_frequency: the weight of the access cost by column
+    :return: the chosen candidate by column
+    """
+    chosen = {column: options[0] for column, options in candidates.items()}
+    total = sum(candidate.nbytes for candidate in chosen.values())
+
+    while total > budget:
+        best = None
+        for column, options in candidates.items():
+            current = chosen[column]
+            weight = access_frequency.get(column, 1.0)
+            for option in options:
+                saved = current.nbytes - option.nbytes
+                if saved <= 0:
+                    continue
+                extra = (option.cost - current.cost) * weight
+                score = saved / extra if extra > 0 else np.inf
+                if best is None or score > best[0]:
+                    best = (score, column, option)
+
+        if best is None:
+            raise ValueError(
+                f"The columns take at least {int(total)} bytes, "
+                f"which does not fit the budget of {int(budget)} bytes"
+            )
+        _, column, option = best
+        total -= chosen[column].nbytes - option.nbytes
+        chosen[column] = option
+    return chosen
+
+
+class BudgetPlanner:
+    """Compress a frame to fit a memory budget, with the least overhead when the columns are read
+
+    Each column is compressed by each candidate compressor (and in blocks by a byte-level codec), which
+    gives the size and the access cost of each representation. The planner then picks a representation per
+    column, such that the frame fits the budget and the access cost, weighted by how often each column is
+    read, is as small as possible. When no budget is given, every column takes its cheapest representation.
+    """
+
+    def __init__(
+        self,
+        candidates: Optional[
+            Dict[str, Tuple[VisionsTypeset, BaseTypeCompressor]]
+        ] = None,
+        codec: Optional[str] = DEFAULT_CODEC,
+        with_type_inference: bool = False,
+        n_jobs: Optional[int] = 1,
+        backend: str = "thread",
+        sample_size: Optional[int] = None,
+    ):
+        """
+        :param candidates: typeset and compressor by name of the candidate, see `default_candidates`
+        :param codec: byte-level codec of the block compressed candidates, None to leave them out
+        :param with_type_inference: infer types from the values
+        :param n_jobs: number of workers that compress the columns, -1 for all cores
+        :param backend: "thread" or "process"
+        :param sample_size: infer the type on a sample of this many rows
+        """
+        self.candidates = candidates if candidates is not None else default_candidates()
+        self.codec = codec
+        self.with_type_inference = with_type_inference
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.sample_size = sample_size
+        self.plan: Optional[CompressionPlan] = None
+        self.choices: Dict[Any, str] = {}
+
+    def evaluate(self, data: pd.DataFrame) -> Dict[Any, List[Candidate]]:
+        """The candidates of each column that are not dominated by a cheaper and smaller candidate"""
+        func = partial(
+            column_candidates,
+            candidates=self.candidates,
+            codec=self.codec,
+            with_inference=self.with_type_inference,
+            sample_size=self.sample_size,
+        )
+        columns = [data[col] for col in data.columns]
+        results = parallel_map(func, columns, self.n_jobs, self.backend)
+        return dict(zip(data.columns, results))
+
+    def fit_transform(
+        self,
+        data: pd.DataFrame,
+        budget: Union[int, float, str, "Quantity", None] = None,
+        ratio: Optional[float] = None,
+        access_frequency: Optional[Dict[Any, float]] = None,
+    ) -> pd.DataFrame:
+        """Compress the data to fit the budget, recording the chosen plan in `self.plan`
+
+        :param data: the frame to compress
+        :param budget: the maximum size of the compressed frame including the index, in bytes or as a
+            quantity such as "4 GB"
+        :param ratio: the minimum compression ratio, as an alternative to the budget
+        :param access_frequency: relative frequency with which the columns are read, 1 for columns that
+            are not listed; frequently read columns are the last to get expensive representations
+        :return: the compressed frame
+        """
+        if budget is not None and ratio is not None:
+            raise ValueError("Pass either a budget or a ratio, not both")
+
+        fixed_size = index_size(data.index)
+        if ratio is not None:
+            target = estimate_size(data) / ratio
+        elif budget is not None:
+            target = to_bytes(budget)
+        else:
+            target = np.inf
+
+        candidates = self.evaluate(data)
+        chosen = choose_candidates(
+            candidates, target - fixed_size, access_frequency or {}
+        )
+
+        func = partial(
+            build_candidate,
+            candidates=self.candidates,
+            with_inference=self.with_type_inference,
+            sample_size=self.sample_size,
+        )
+        items = [(data[col], chosen[col]) for col in data.columns]
+        columns = parallel_map(func, items, self.n_jobs, self.backend)
+
+        result = pd.DataFrame(index=data.index)
+        self.plan = CompressionPlan()
+        self.choices = {}
+        for col, compressed in zip(data.columns, columns):
+            result[col] = compressed
+            self.plan[col] = chosen[col].plan
+            self.choices[col] = chosen[col].name
+        return result
+
+    def summary(self, data: pd.DataFrame) -> pd.DataFrame:
+        """The size and the access cost of the candidates of each column
+
+        :param data: the frame to compress
+        :return: a row per column and candidate
+        """
+        rows = [
+            (
+                col,
+                candidate.name,
+                str(candidate.dtype),
+                candidate.nbytes,
+                candidate.cost,
+            )
+            for col, options in self.evaluate(data).items()
+            for candidate in options
+        ]
+        return pd.DataFrame(
+            rows, columns=["column", "candidate", "dtype", "bytes", "cost"]
+        )
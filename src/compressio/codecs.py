@@ -0,0 +1,51 @@
+import lzma
+import zlib
+from typing import Callable, Dict, Tuple
+
+# Codec with which columns are packed when none is given
+DEFAULT_CODEC = "zlib"
+
+
+def _zstd() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("The zstd codec requires zstandard to be installed")
+    return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+
+
+def _lz4() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError("The lz4 codec requires lz4 to be installed")
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+def _blosc() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        import blosc
+    except ImportError:
+        raise ImportError("The blosc codec requires blosc to be installed")
+    return blosc.compress, blosc.decompress
+
+
+# Byte-level codecs by name, returning the compress and decompress functions
+CODECS: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "zlib": lambda: (zlib.compress, zlib.decompress),
+    "lzma": lambda: (lzma.compress, lzma.decompress),
+    "zstd": _zstd,
+    "lz4": _lz4,
+    "blosc": _blosc,
+}
+
+
+def get_codec(name: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """The compress and decompress functions of a codec
+
+    :param name: one of `CODECS`, zstd, lz4 and blosc require the package of the same name (zstandard for zstd)
+    :return: the functions
+    """
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec '{name}', choose from {sorted(CODECS)}")
+    return CODECS[name]()
@@ -1,17 +1,77 @@
-from functools import singledispatch
+from functools import partial, singledispatch
+from typing import Callable, Iterable, List, Optional, Tuple, Type, Union
 
+import networkx as nx
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
-from visions import VisionsTypeset
+from visions import VisionsBaseType, VisionsTypeset
 from visions.typesets.typeset import get_type_from_path, traverse_graph
 
+from compressio.concat import append_frame, append_series, concat_frames
+from compressio.lazy import LAZY_CACHE_SIZE, LazyFrame
+from compressio.parallel import parallel_map
+from compressio.plan import ColumnPlan, CompressionPlan
+from compressio.sampling import sample_series
+from compressio.size import estimate_size, index_size
+from compressio.storage import save
+from compressio.telemetry import (
+    ColumnRecord,
+    CompressionReport,
+    current_record,
+    record_scope,
+    timed,
+)
 from compressio.type_compressor import BaseTypeCompressor, DefaultCompressor
-from compressio.typesets import DefaultCompressioTypeset
+from compressio.typesets import (
+    DefaultCompressioTypeset,
+    cached_typeset,
+    native_type,
+)
 from compressio.typing import pdT
 
 
-def get_data_and_dtype(data: pdT, typeset: VisionsTypeset, with_inference: bool):
+def cast_along_path(
+    series: pd.Series, path: List[Type[VisionsBaseType]], graph: nx.DiGraph
+) -> Optional[pd.Series]:
+    """Verify and apply the relations along a path in the type graph to the full series
+
+    :param series: the series to cast
+    :param path: the path of types, starting from the root node
+    :param graph: the relation graph the path was found in
+    :return: the cast series, or None when one of the relations does not hold
+    """
+    state: dict = {}
+    for from_type, to_type in zip(path, path[1:]):
+        relation = graph[from_type][to_type]["relationship"]
+        if not relation.is_relation(series, state):
+            return None
+        series = relation.transform(series, state)
+    return series
+
+
+def get_data_and_dtype(
+    data: pdT,
+    typeset: VisionsTypeset,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+):
+    visions_type = native_type(data, typeset, with_inference)
+    if visions_type is not None:
+        # The type of native dtypes follows from the dtype
+        return data, visions_type
+
     graph = typeset.relation_graph if with_inference else typeset.base_graph
+
+    if sample_size is not None and len(data) > sample_size:
+        # Infer the type on a sample, then verify it on the full series in a
+        # single pass along the path. Only when the verification fails, the
+        # full traversal is required.
+        sample = sample_series(data, sample_size)
+        _, dtype_path, _ = traverse_graph(sample, typeset.root_node, graph)
+        cast_data = cast_along_path(data, dtype_path, graph)
+        if cast_data is not None:
+            return cast_data, get_type_from_path(dtype_path)
+
     data, dtype_path, state = traverse_graph(data, typeset.root_node, graph)
     dtype = get_type_from_path(dtype_path)
     return data, dtype
@@ -24,7 +84,15 @@ def compress_func(
     compressor: BaseTypeCompressor,
     with_inference: bool,
     inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
 ) -> pdT:
+    from compressio.partitions import compress_dask, is_dask_frame
+
+    if is_dask_frame(data):
+        # Dask is optional, so its frames are recognised instead of registered
+        return compress_dask(data, typeset, compressor, with_inference, sample_size)
     raise Exception(f"Unsupported datatype {type(data)}")
 
 
@@ -35,40 +103,467 @@ def _(
     compressor: BaseTypeCompressor,
     with_inference: bool,
     inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
 ) -> pd.Series:
-    data, dtype = get_data_and_dtype(data, typeset, with_inference)
+    with timed("inference_time"):
+        data, dtype = get_data_and_dtype(data, typeset, with_inference, sample_size)
+    record = current_record()
+    if record is not None:
+        record.visions_type = str(dtype)
     return compressor.compress(data, dtype)
 
 
-@compress_func.register(pd.DataFrame)  # type: ignore
+@compress_func.register(pd.Index)  # type: ignore
 def _(
-    data: pd.DataFrame,
+    data: pd.Index,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
+) -> pd.Index:
+    if isinstance(data, pd.RangeIndex):
+        # Only the start, stop and step are stored
+        return data
+
+    series = pd.Series(data.array, name=data.name)
+    compressed = compress_func(
+        series, typeset, compressor, with_inference, sample_size=sample_size
+    )
+    if not isinstance(compressed.dtype, (np.dtype, pd.CategoricalDtype)):
+        # Encoded, sparse and Arrow arrays are not used for the lookups of an index
+        return data
+
+    # Older versions of pandas widen the integer and float types of an index
+    index = pd.Index(compressed.array, name=data.name)
+    return index if index_size(index) < index_size(data) else data
+
+
+@compress_func.register(pd.MultiIndex)  # type: ignore
+def _(
+    data: pd.MultiIndex,
     typeset: VisionsTypeset,
     compressor: BaseTypeCompressor,
     with_inference: bool,
     inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
+) -> pd.MultiIndex:
+    # Dropping the unused levels (e.g. after filtering) also narrows the codes
+    index = data.remove_unused_levels()
+    levels = [
+        compress_func(
+            level, typeset, compressor, with_inference, sample_size=sample_size
+        )
+        for level in index.levels
+    ]
+    index = index.set_levels(levels, verify_integrity=False)
+    return index if index_size(index) < index_size(data) else data
+
+
+def compress_index(
+    data: pdT,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    original: Optional[pdT] = None,
+    sample_size: Optional[int] = None,
+) -> pdT:
+    """Compress the index of a series or frame, see `compress_func`
+
+    :param data: the series or frame
+    :param original: the uncompressed data, of which the index is left untouched when the data is the same
+        object
+    :return: the data with the compressed index
+    """
+    index = compress_func(
+        data.index, typeset, compressor, with_inference, sample_size=sample_size
+    )
+    if index is data.index:
+        return data
+    if data is original:
+        data = data.copy(deep=False)
+    data.index = index
+    return data
+
+
+def record_series(
+    series: pd.Series,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> Tuple[pd.Series, ColumnRecord]:
+    """Compress a series and record what the compression did, see `ColumnRecord`
+
+    :return: the compressed series and its record
+    """
+    exact = compressor.exact_sizes
+    record = ColumnRecord(
+        series.name, str(series.dtype), estimate_size(series, exact, index=False)
+    )
+    with record_scope(record):
+        compressed = compress_func(
+            series, typeset, compressor, with_inference, sample_size=sample_size
+        )
+    record.dtype_after = str(compressed.dtype)
+    record.bytes_after = estimate_size(compressed, exact, index=False)
+    return compressed, record
+
+
+def assemble_frame(
+    data: pd.DataFrame, compressed: Iterable[pd.Series], inplace: bool
 ) -> pd.DataFrame:
+    """Put the compressed columns in a frame, in the order of the columns of the data"""
+    from tqdm import tqdm
+
     result = data if inplace else pd.DataFrame()
-    for col in tqdm(data.columns):
-        result[col] = compress_func(
-            data[col], typeset, compressor, with_inference, inplace
-        )
+    for col, series in zip(data.columns, tqdm(compressed, total=len(data.columns))):
+        result[col] = series
     return result
 
 
+def fit_series(
+    series: pd.Series,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> Tuple[pd.Series, ColumnPlan]:
+    """Compress a series and record the plan that reproduces the compression
+
+    :return: the compressed series and its plan
+    """
+    data, dtype = get_data_and_dtype(series, typeset, with_inference, sample_size)
+    compressed = compressor.compress(data, dtype)
+    return compressed, ColumnPlan.from_series(compressed, str(dtype))
+
+
+def transform_series(
+    item: Tuple[pd.Series, Optional[ColumnPlan]],
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> Tuple[pd.Series, Optional[ColumnPlan]]:
+    """Apply the plan to a series, or re-fit when the series violates the plan
+
+    :return: the compressed series and the new plan if the series was re-fitted, None otherwise
+    """
+    series, plan = item
+    if plan is not None and plan.validate(series):
+        return plan.apply(series), None
+    return fit_series(series, typeset, compressor, with_inference, sample_size)
+
+
+@compress_func.register(pd.DataFrame)  # type: ignore
+def _(
+    data: pd.DataFrame,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
+) -> pd.DataFrame:
+    # Columns are independent, so they can be compressed by a pool of workers.
+    # Results come back in column order, which keeps the output identical to
+    # the serial path.
+    func = partial(
+        compress_func,
+        typeset=typeset,
+        compressor=compressor,
+        with_inference=with_inference,
+        sample_size=sample_size,
+    )
+    columns = [data[col] for col in data.columns]
+    compressed = parallel_map(func, columns, n_jobs, backend)
+    return assemble_frame(data, compressed, inplace)
+
+
 class Compress:
     def __init__(
         self,
         typeset: VisionsTypeset = None,
         compressor: BaseTypeCompressor = None,
         with_type_inference: bool = False,
+        n_jobs: Optional[int] = 1,
+        backend: str = "thread",
+        sample_size: Optional[int] = None,
+        telemetry: bool = False,
+        callback: Optional[Callable[[ColumnRecord], None]] = None,
+        index: bool = False,
     ) -> None:
-        self.typeset = typeset if typeset is not None else DefaultCompressioTypeset()
+        """
+        :param typeset: the visions typeset, `DefaultCompressioTypeset` by default
+        :param compressor: the compression algorithms by type, `DefaultCompressor` by default
+        :param with_type_inference: infer types from the values, e.g. numbers that are stored as strings
+        :param n_jobs: number of workers that compress the columns, -1 for all cores
+        :param backend: "thread" or "process"
+        :param sample_size: infer the type on a sample of this many rows, see `get_data_and_dtype`
+        :param telemetry: record what the compression of each column did in `report`
+        :param callback: called with the record of each column when it is compressed, e.g.
+            `compressio.telemetry.log_record`; implies telemetry
+        :param index: also compress the index, or the levels of a multi-index, when that saves memory
+        """
+        self.typeset = (
+            typeset if typeset is not None else cached_typeset(DefaultCompressioTypeset)
+        )
         self.compressor = compressor if compressor is not None else DefaultCompressor()
         self.with_type_inference = with_type_inference
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.sample_size = sample_size
+        self.plan: Optional[CompressionPlan] = None
+        self.telemetry = telemetry or callback is not None
+        self.callback = callback
+        self.report: Optional[CompressionReport] = None
+        self.index = index
 
-    def it(self, data: pdT, inplace: bool = False) -> pdT:
-        data = compress_func(
-            data, self.typeset, self.compressor, self.with_type_inference, inplace
-        )
+    def it(
+        self,
+        data: pdT,
+        inplace: bool = False,
+        lazy: bool = False,
+        codec: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        dense: bool = False,
+    ) -> Union[pdT, LazyFrame]:
+        """Compress the data
+
+        A lazy frame without a codec keeps the compressed columns as they are: accessing a column only
+        decodes it when `dense` is set, the codec is what defers unpacking the columns until they are read.
+
+        :param data: the series or frame to compress
+        :param inplace: replace the columns of the frame
+        :param lazy: return a `LazyFrame`, which decodes the columns when they are accessed
+        :param codec: byte-level codec with which a lazy frame packs the columns, e.g. "zlib" or "zstd"
+        :param cache_size: number of decoded columns that a lazy frame keeps, `LAZY_CACHE_SIZE` by default
+        :param dense: a lazy frame decodes sparse and encoded columns into their dense dtype on access
+        :return: the compressed data
+        """
+        if lazy and not isinstance(data, pd.DataFrame):
+            raise TypeError("Only frames can be compressed into a lazy frame")
+        if not lazy and (codec is not None or cache_size is not None or dense):
+            raise ValueError(
+                "A codec, cache size and dense columns can only be used for lazy frames"
+            )
+
+        original = data
+        if self.telemetry and isinstance(data, (pd.Series, pd.DataFrame)):
+            data = self._it_recorded(data, inplace)
+        else:
+            data = compress_func(
+                data,
+                self.typeset,
+                self.compressor,
+                self.with_type_inference,
+                inplace,
+                n_jobs=self.n_jobs,
+                backend=self.backend,
+                sample_size=self.sample_size,
+            )
+        if self.index and isinstance(data, (pd.Series, pd.DataFrame)):
+            data = self._compress_index(data, None if inplace else original)
+        if lazy:
+            if cache_size is None:
+                cache_size = LAZY_CACHE_SIZE
+            return LazyFrame.from_frame(
+                data, codec=codec, cache_size=cache_size, dense=dense
+            )
         return data
+
+    def _it_recorded(self, data: pdT, inplace: bool) -> pdT:
+        """Compress the data like `compress_func`, collecting the records of the columns in `report`"""
+        report = CompressionReport()
+        self.report = report
+
+        def emit(item: Tuple[pd.Series, ColumnRecord]) -> pd.Series:
+            series, record = item
+            report.records.append(record)
+            if self.callback is not None:
+                self.callback(record)
+            return series
+
+        func = self._column_func(record_series)
+        if isinstance(data, pd.Series):
+            return emit(func(data))
+
+        columns = [data[col] for col in data.columns]
+        results = parallel_map(func, columns, self.n_jobs, self.backend)
+        return assemble_frame(data, map(emit, results), inplace)
+
+    def iter_chunks(
+        self, chunks: Iterable[pd.DataFrame], ignore_index: bool = False
+    ) -> pd.DataFrame:
+        """Compress a stream of chunks into a single frame
+
+        Each chunk is compressed on arrival, so that only one uncompressed chunk is in memory at any time.
+        The dtypes of the compressed chunks are reconciled when they are combined: integer types are widened
+        and category sets are unioned.
+
+        :param chunks: iterable of frames, for example a pandas reader with `chunksize`
+        :param ignore_index: replace the index of the chunks by a range index
+        :return: the compressed frame
+        """
+        compressed = (self.it(chunk, inplace=True) for chunk in chunks)
+        return concat_frames(compressed, ignore_index=ignore_index)
+
+    def read_csv(self, path, chunksize: int = 100_000, **kwargs) -> pd.DataFrame:
+        """Read and compress a csv file chunk by chunk
+
+        :param path: the file to read
+        :param chunksize: number of rows per chunk
+        :param kwargs: passed on to `pandas.read_csv`
+        :return: the compressed frame
+        """
+        reader = pd.read_csv(path, chunksize=chunksize, **kwargs)
+        try:
+            return self.iter_chunks(reader)
+        finally:
+            reader.close()
+
+    def read_parquet(
+        self,
+        path,
+        batch_size: int = 100_000,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Read and compress a parquet file batch by batch (requires pyarrow)
+
+        :param path: the file to read
+        :param batch_size: number of rows per batch
+        :param columns: the columns to read, all by default
+        :return: the compressed frame
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading parquet files requires pyarrow to be installed")
+
+        parquet_file = pq.ParquetFile(path)
+        batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+        chunks = (batch.to_pandas() for batch in batches)
+        return self.iter_chunks(chunks, ignore_index=True)
+
+    def append(self, data: pdT, new: pdT, ignore_index: bool = False) -> pdT:
+        """Append uncompressed rows to compressed data, without compressing the data again
+
+        Only the columns that do not hold the new rows are widened: integers to the next type that fits,
+        floats to the first type in which the new values are exact. Unseen categories are added to the
+        categories and sparse columns stay sparse. Other columns are appended by compressing the new rows.
+
+        :param data: the compressed series or frame
+        :param new: the rows to append, with the same columns
+        :param ignore_index: replace the index by a range index
+        :return: the compressed data with the rows appended
+        """
+        compress = self._column_func(compress_func)
+        if isinstance(data, pd.Series):
+            return append_series(data, new, compress, ignore_index=ignore_index)
+        return append_frame(data, new, compress, ignore_index=ignore_index)
+
+    def _column_func(self, func):
+        return partial(
+            func,
+            typeset=self.typeset,
+            compressor=self.compressor,
+            with_inference=self.with_type_inference,
+            sample_size=self.sample_size,
+        )
+
+    def _compress_index(self, data: pdT, original: Optional[pdT] = None) -> pdT:
+        if not self.index:
+            return data
+        return compress_index(
+            data,
+            self.typeset,
+            self.compressor,
+            self.with_type_inference,
+            original=original,
+            sample_size=self.sample_size,
+        )
+
+    def fit_transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Compress the data and record the compression plan in `self.plan`
+
+        :param data: the frame to compress
+        :return: the compressed frame
+        """
+        columns = [data[col] for col in data.columns]
+        results = parallel_map(
+            self._column_func(fit_series), columns, self.n_jobs, self.backend
+        )
+
+        plan = CompressionPlan()
+        result = pd.DataFrame(index=data.index)
+        for col, (series, column_plan) in zip(data.columns, results):
+            result[col] = series
+            plan[col] = column_plan
+        self.plan = plan
+        return self._compress_index(result)
+
+    def fit(self, data: pd.DataFrame) -> CompressionPlan:
+        """Record the compression plan of the data, which can be reused with `transform`
+
+        :param data: the frame to fit the plan on
+        :return: the (serializable) compression plan
+        """
+        self.fit_transform(data)
+        assert self.plan is not None
+        return self.plan
+
+    def transform(
+        self, data: pd.DataFrame, plan: Optional[CompressionPlan] = None
+    ) -> pd.DataFrame:
+        """Compress data by casting it to the dtypes in the plan, skipping inference
+
+        Columns that violate the plan (e.g. values out of range or unseen categories) and columns that are
+        not in the plan are re-fitted, and their plans are updated.
+
+        :param data: the frame to compress
+        :param plan: the plan to apply, by default the plan of the last fit
+        :return: the compressed frame
+        """
+        if plan is None:
+            plan = self.plan
+        if plan is None:
+            raise ValueError("No compression plan available, call `fit` first")
+
+        items = [
+            (data[col], plan[col] if col in plan else None) for col in data.columns
+        ]
+        results = parallel_map(
+            self._column_func(transform_series), items, self.n_jobs, self.backend
+        )
+
+        result = pd.DataFrame(index=data.index)
+        for col, (series, column_plan) in zip(data.columns, results):
+            result[col] = series
+            if column_plan is not None:
+                plan[col] = column_plan
+        return self._compress_index(result)
+
+    def save(self, data: pdT, path) -> None:
+        """Compress the data and save it with its compression plan, to be loaded with `compressio.load`
+
+        Frames are compressed with the plan of the last fit, or fitted when there is none. Series are compressed
+        with `it` and saved without a plan.
+
+        :param data: the (uncompressed) series or frame
+        :param path: the file to write
+        """
+        if isinstance(data, pd.Series):
+            save(self.it(data), path)
+            return
+
+        compressed = (
+            self.fit_transform(data) if self.plan is None else self.transform(data)
+        )
+        save(compressed, path, plan=self.plan)
@@ -1,19 +1,37 @@
 from compressio.compression_algorithms import type_compressions
 from compressio.compression_algorithms.type_compressions import (
+    MAX_UNIQUE_RATIO,
+    compress_blocks,
+    compress_boolean,
+    compress_categorical,
     compress_complex,
     compress_datetime,
+    compress_encoded,
     compress_float,
     compress_integer,
+    compress_integral_float,
+    compress_list,
     compress_object,
+    compress_sparse,
     compress_sparse_missing,
+    compress_string,
 )
 
 __all__ = [
     "type_compressions",
+    "MAX_UNIQUE_RATIO",
+    "compress_blocks",
+    "compress_boolean",
+    "compress_categorical",
     "compress_complex",
     "compress_datetime",
+    "compress_encoded",
     "compress_float",
     "compress_integer",
+    "compress_integral_float",
+    "compress_list",
     "compress_object",
+    "compress_sparse",
     "compress_sparse_missing",
+    "compress_string",
 ]
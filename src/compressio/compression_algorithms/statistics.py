@@ -0,0 +1,247 @@
+import copy
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from compressio.sampling import sample_series
+from compressio.size import estimate_size
+from compressio.telemetry import timed
+
+# Number of rows used to estimate the number of distinct values
+UNIQUE_SAMPLE_SIZE = 10_000
+
+_local = threading.local()
+
+
+def estimate_unique_count(
+    series: pd.Series,
+    valid_count: Optional[int] = None,
+    sample_size: int = UNIQUE_SAMPLE_SIZE,
+) -> int:
+    """Estimate the number of distinct (non-null) values from a sample
+
+    Uses the Guaranteed-Error Estimator (Charikar et al., 2000): values seen once in the sample are scaled
+    up by sqrt(n / r), values seen more often are counted once.
+
+    :param series: the series
+    :param valid_count: the number of non-null values in the series, if known
+    :param sample_size: the number of rows to sample
+    :return: the estimated number of distinct values
+    """
+    sample = sample_series(series, sample_size).dropna()
+    if len(sample) == 0:
+        return 0
+
+    try:
+        counts = sample.value_counts(sort=False).to_numpy()
+    except TypeError:
+        # Unhashable values (e.g. lists) are distinct for our purposes
+        return len(series)
+
+    if valid_count is None:
+        valid_count = int(series.notna().sum())
+    f1 = int((counts == 1).sum())
+    if f1 == len(sample):
+        # No value repeats in the sample: the column is (close to) unique
+        return valid_count
+    estimate = np.sqrt(valid_count / len(sample)) * f1 + (len(counts) - f1)
+    return int(min(round(estimate), valid_count))
+
+
+class ColumnStatistics:
+    """Statistics of a column, computed once and shared between compression algorithms
+
+    The minimum and maximum are only available for numeric columns and ignore missing values, the real
+    and imaginary ranges only for complex columns. The distinct count and the memory size are estimated on
+    first access.
+    """
+
+    def __init__(
+        self,
+        series: pd.Series,
+        length: int,
+        null_count: int,
+        minv: Any = None,
+        maxv: Any = None,
+        real_range: Optional[tuple] = None,
+        imag_range: Optional[tuple] = None,
+    ):
+        self._series = weakref.ref(series)
+        self.length = length
+        self.null_count = null_count
+        self.min = minv
+        self.max = maxv
+        self.real_range = real_range
+        self.imag_range = imag_range
+        self._unique_count: Optional[int] = None
+        self._nbytes: Optional[int] = None
+
+    @property
+    def hasnans(self) -> bool:
+        return self.null_count > 0
+
+    @property
+    def valid_count(self) -> int:
+        return self.length - self.null_count
+
+    @property
+    def series(self) -> pd.Series:
+        series = self._series()
+        if series is None:
+            raise ValueError("The series of these statistics no longer exists")
+        return series
+
+    @property
+    def unique_count(self) -> int:
+        if self._unique_count is None:
+            with timed("statistics_time"):
+                self._unique_count = estimate_unique_count(
+                    self.series, self.valid_count
+                )
+        return self._unique_count
+
+    @property
+    def nbytes(self) -> int:
+        """Memory size of the values (excluding the index)"""
+        if self._nbytes is None:
+            with timed("statistics_time"):
+                self._nbytes = estimate_size(
+                    self.series, exact=getattr(_local, "exact", False), index=False
+                )
+        return self._nbytes
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnStatistics":
+        array = series.array
+        length = len(series)
+        null_count = 0
+
+        if isinstance(series.dtype, pd.SparseDtype):
+            values = np.asarray(array.sp_values)
+            n_fill = length - len(values)
+            if n_fill > 0:
+                if pd.isna(array.fill_value):
+                    null_count += n_fill
+                elif values.dtype.kind in "biufc":
+                    values = np.append(values, array.fill_value)
+        elif hasattr(array, "_data") and hasattr(array, "_mask"):
+            # Nullable extension arrays: data and mask are separate
+            mask = array._mask
+            null_count += int(mask.sum())
+            values = array._data[~mask] if null_count > 0 else array._data
+        else:
+            values = series.to_numpy()
+
+        kind = values.dtype.kind
+        if kind not in "biufc":
+            null_count += int(pd.isna(values).sum())
+            return cls(series, length, null_count)
+
+        if kind in "fc":
+            finite = ~np.isnan(values)
+            n_nan = len(values) - int(finite.sum())
+            if n_nan > 0:
+                null_count += n_nan
+                values = values[finite]
+
+        real_range = imag_range = None
+        minv = maxv = None
+        if len(values) > 0:
+            if kind == "c":
+                real_range = (values.real.min(), values.real.max())
+                imag_range = (values.imag.min(), values.imag.max())
+            else:
+                minv, maxv = values.min(), values.max()
+
+        return cls(
+            series,
+            length,
+            null_count,
+            minv,
+            maxv,
+            real_range,
+            imag_range,
+        )
+
+
+@contextmanager
+def statistics_scope(exact_sizes: bool = False) -> Iterator[None]:
+    """Share column statistics between the algorithms applied within this scope
+
+    The cache is local to the thread and cleared when the outermost scope exits, so statistics never
+    outlive the compression of a column.
+
+    :param exact_sizes: measure the memory size of every object instead of estimating it from a sample
+    """
+    if getattr(_local, "cache", None) is not None:
+        yield
+        return
+
+    _local.cache = {}
+    _local.exact = exact_sizes
+    try:
+        yield
+    finally:
+        _local.cache = None
+        _local.exact = False
+
+
+def column_statistics(series: pd.Series) -> ColumnStatistics:
+    """Statistics of the series, cached within a `statistics_scope`
+
+    :param series: the series
+    :return: the statistics
+    """
+    cache = getattr(_local, "cache", None)
+    if cache is not None:
+        stats = cache.get(id(series))
+        if stats is not None and stats._series() is series:
+            return stats
+
+    with timed("statistics_time"):
+        stats = ColumnStatistics.from_series(series)
+    if cache is not None:
+        cache[id(series)] = stats
+    return stats
+
+
+def share_statistics(stats: ColumnStatistics, target: pd.Series) -> pd.Series:
+    """Reuse the statistics of a series for its lossless cast within the current scope
+
+    Casting to a different dtype does not change the values, so the next algorithm in the chain does not
+    need to scan the column again.
+
+    :param stats: the statistics of the original series
+    :param target: the cast series
+    :return: the cast series
+    """
+    cache = getattr(_local, "cache", None)
+    if cache is None or target.dtype == object:
+        return target
+
+    target_stats = copy.copy(stats)
+    target_stats._series = weakref.ref(target)
+    target_stats._nbytes = None
+    cache[id(target)] = target_stats
+    return target
+
+
+def memory_size(series: pd.Series) -> int:
+    """Memory size of the values of a series, shared within a `statistics_scope`
+
+    Used to decide whether a compressed candidate is smaller than the original.
+
+    :param series: the series
+    :return: the (estimated) size in bytes, excluding the index
+    """
+    cache = getattr(_local, "cache", None)
+    if cache is not None:
+        stats = cache.get(id(series))
+        if stats is not None and stats._series() is series:
+            return stats.nbytes
+    with timed("statistics_time"):
+        return estimate_size(series, exact=getattr(_local, "exact", False), index=False)
@@ -1,7 +1,30 @@
-from typing import Callable, Iterable, Type, Union
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Type, Union
 
 import numpy as np
 import pandas as pd
+from pandas._libs.sparse import IntIndex
+
+from compressio.arrays import (
+    ENCODINGS,
+    BitArray,
+    BitDtype,
+    BlockCompressedArray,
+    EncodedDtype,
+)
+from compressio.arrays.blocks import BLOCK_SIZE
+from compressio.codecs import DEFAULT_CODEC
+from compressio.compression_algorithms.statistics import (
+    column_statistics,
+    memory_size,
+    share_statistics,
+)
+from compressio.sampling import sample_series
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute
+except ImportError:  # pragma: no cover
+    pa = None
 
 nan_value = pd.NA if hasattr(pd, "NA") else np.nan
 
@@ -23,43 +46,138 @@ def get_compressed_type(
     return next(test_sequence)
 
 
-def compress_sparse_missing(series: pd.Series) -> pd.Series:
-    """Compresses the data by using the SparseArray data structure for missing values/nans
+# Only build a sparse array when the fill value is estimated to fill at least this fraction of the column
+MIN_FILL_RATIO = 0.5
+
+# Number of rows on which the most frequent value is estimated
+FILL_SAMPLE_SIZE = 10_000
+
+
+def most_frequent(series: pd.Series, sample_size: int = FILL_SAMPLE_SIZE) -> tuple:
+    """Estimate the most frequent non-missing value and its frequency from a sample
+
+    :param series: the series
+    :param sample_size: number of rows to sample
+    :return: the value and the fraction of rows it fills, or (None, 0.0) when it can not be determined
+    """
+    sample = sample_series(series, sample_size)
+    try:
+        counts = sample.value_counts(sort=True, dropna=True)
+    except TypeError:
+        # Unhashable values
+        return None, 0.0
+    if len(counts) == 0:
+        return None, 0.0
+
+    value = counts.index[0]
+    if series.dtype == object and isinstance(value, np.generic):
+        # The index of the counts may have converted Python objects to numpy scalars
+        value = value.item()
+    return value, counts.iloc[0] / len(sample)
+
+
+def fill_positions(values: np.ndarray, fill_value: Any) -> np.ndarray:
+    """Where the values equal the fill value, requiring the same type for objects and sign for floats"""
+    is_fill = values == fill_value
+    if values.dtype == object:
+        # 1 == 1.0 == True, but replacing one by the other is not lossless
+        candidates = np.flatnonzero(is_fill)
+        fill_type = type(fill_value)
+        is_fill[candidates] = [type(value) is fill_type for value in values[candidates]]
+    elif values.dtype.kind == "f":
+        is_fill &= np.signbit(values) == np.signbit(fill_value)
+    return is_fill
+
+
+def compress_sparse(series: pd.Series, missing_only: bool = False) -> pd.Series:
+    """Compresses the data by using the SparseArray data structure, with the most frequent value as fill value
+
+    The fill value is the missing value when at least half of the column is missing, otherwise the most
+    frequent value estimated from a sample (e.g. 0, an empty string or a default value). Only the other
+    values and their positions are stored.
 
     :param series: series to compress
+    :param missing_only: only use the missing value as fill value
     :return: the (compressed) series
     """
-    if not series.hasnans:
+    dtype = series.dtype
+    if (
+        len(series) == 0
+        or is_arrow_dtype(dtype)
+        or isinstance(dtype, (pd.SparseDtype, EncodedDtype))
+        or dtype.kind in "mM"
+    ):
         return series
 
-    # numpy dtypes
-    fill_value = np.nan
-    test_dtype = series.dtype
-
-    # pandas dtypes
-    if pd.api.types.is_extension_array_dtype(test_dtype):
-        if test_dtype != pd.CategoricalDtype():
-            if hasattr(test_dtype, "numpy_dtype"):
-                test_dtype = test_dtype.numpy_dtype
-            elif hasattr(test_dtype, "type"):
-                test_dtype = test_dtype.type
-            else:
-                raise ValueError(f"Couldn't obtain the dtype of {type(test_dtype)}")
-            fill_value = nan_value
+    stats = column_statistics(series)
+    fill_missing = stats.null_count >= MIN_FILL_RATIO * stats.length
+    if not fill_missing:
+        if missing_only:
+            # Using the missing value as fill value only pays off when most values are missing
+            if not stats.hasnans:
+                return series
+            fill_missing = True
         else:
-            test_dtype = np.object
-
-    new_series = pd.Series(
-        pd.arrays.SparseArray(
-            series[series.notnull()], dtype=test_dtype, fill_value=fill_value
-        )
+            fill_value, ratio = most_frequent(series)
+            if ratio < MIN_FILL_RATIO:
+                return series
+
+    array = series.array
+    if isinstance(dtype, pd.CategoricalDtype):
+        values = np.asarray(array, dtype=object)
+        missing = pd.isna(values)
+    elif hasattr(array, "_data") and hasattr(array, "_mask"):
+        # Nullable extension arrays, the values can not hold missing values unless they are the fill value
+        if not fill_missing and stats.hasnans:
+            return series
+        values, missing = array._data, array._mask
+    else:
+        values = series.to_numpy()
+        missing = pd.isna(values)
+
+    if fill_missing:
+        fill_value = nan_value if hasattr(array, "_mask") else np.nan
+        is_fill = missing
+    else:
+        is_fill = fill_positions(values, fill_value) & ~missing
+
+    positions = np.flatnonzero(~is_fill)
+    sparse_array = pd.arrays.SparseArray(
+        values[positions],
+        sparse_index=IntIndex(len(values), positions.astype(np.int32)),
+        fill_value=fill_value,
+        dtype=values.dtype,
     )
-    if new_series.memory_usage(deep=True) < series.memory_usage(deep=True):
+    new_series = pd.Series(sparse_array, index=series.index, name=series.name)
+    if memory_size(new_series) < memory_size(series):
         return new_series
 
     return series
 
 
+def compress_sparse_missing(series: pd.Series) -> pd.Series:
+    """Compresses the data by using the SparseArray data structure for missing values/nans
+
+    :param series: series to compress
+    :return: the (compressed) series
+    """
+    return compress_sparse(series, missing_only=True)
+
+
+def valid_values(series: pd.Series) -> np.ndarray:
+    """The non-missing values of a numeric series as a numpy array"""
+    dtype = getattr(series.dtype, "numpy_dtype", series.dtype)
+    return series.dropna().to_numpy(dtype=dtype)
+
+
+def is_exact_cast(values: np.ndarray, dtype: Type[np.dtype]) -> bool:
+    """Whether the values survive a round trip through the dtype bit for bit (up to the NaN payload)"""
+    return np.array_equal(values.astype(dtype).astype(values.dtype), values)
+
+
+float_types = [np.float16, np.float32, np.float64]
+
+
 def compress_float(series: pd.Series) -> pd.Series:
     """
     Compressing to half-precision floating-point format can degrade computational performance
@@ -67,80 +185,464 @@ def compress_float(series: pd.Series) -> pd.Series:
     https://en.wikipedia.org/wiki/Half-precision_floating-point_format
     https://stackoverflow.com/a/49997863/470433
     https://stackoverflow.com/a/15341193/470433
+
+    A smaller float type is only chosen when every value round-trips exactly, fitting the range is not
+    enough: 0.1 does not survive a cast to float32.
     :param series:
     :return:
     """
-    minv, maxv = series.min(), series.max()
-    tester = type_tester(minv, maxv, np.finfo)
-    test_types = [np.float16, np.float32, np.float64]
-
-    compressed_type = get_compressed_type(test_types, tester)
-    return series.astype(compressed_type)
+    stats = column_statistics(series)
+    if stats.valid_count == 0:
+        # Only missing values
+        return series.astype(np.float16)
+
+    tester = type_tester(stats.min, stats.max, np.finfo)
+    values = None
+    for compressed_type in float_types:
+        if np.dtype(compressed_type).itemsize >= series.dtype.itemsize:
+            return series
+        if not tester(compressed_type):
+            continue
+
+        if values is None:
+            values = valid_values(series)
+        if is_exact_cast(values, compressed_type):
+            return share_statistics(stats, series.astype(compressed_type))
+    return series
 
 
-def compress_integer(series: pd.Series) -> pd.Series:
-    minv, maxv = series.min(), series.max()
+integer_types = [
+    np.int8,
+    np.uint8,
+    np.int16,
+    np.uint16,
+    np.int32,
+    np.uint32,
+    np.int64,
+    np.uint64,
+]
+
+
+def get_integer_type(
+    minv: Union[int, float],
+    maxv: Union[int, float],
+    nullable: bool,
+    type_options: Sequence[Type[np.dtype]] = tuple(integer_types),
+) -> Union[Type[np.dtype], str]:
+    """Smallest integer type that holds all values between minv and maxv
+
+    :param minv: minimum value
+    :param maxv: maximum value
+    :param nullable: whether to return the pandas nullable integer type
+    :param type_options: the candidate types, in order of preference
+    :return: the numpy type, or the name of the nullable pandas type
+    """
     tester = type_tester(minv, maxv, np.iinfo)
+    compressed_type = get_compressed_type(type_options, tester)
 
-    test_types = [
-        np.int8,
-        np.uint8,
-        np.int16,
-        np.uint16,
-        np.int32,
-        np.uint32,
-        np.int64,
-        np.uint64,
-    ]
-
-    compressed_type = get_compressed_type(test_types, tester)
-
-    if series.hasnans:
+    if nullable:
         name = np.dtype(compressed_type).name
         if np.iinfo(compressed_type).min >= 0:
-            compressed_type = name[0:2].upper() + name[2:]
+            return name[0:2].upper() + name[2:]
         else:
-            compressed_type = name.capitalize()
+            return name.capitalize()
+
+    return compressed_type
+
+
+def compress_integral_float(series: pd.Series) -> pd.Series:
+    """Store floats that are all integers as the smallest (nullable) integer type
 
-    return series.astype(compressed_type)
+    Counts and identifiers are often stored as floats because of missing values. Negative zero and
+    infinite values are not integers, so such columns are left as is.
+
+    :param series: series of floats to compress
+    :return: the (compressed) series
+    """
+    stats = column_statistics(series)
+    if stats.valid_count == 0 or not pd.api.types.is_float_dtype(series.dtype):
+        return series
+
+    values = valid_values(series)
+    if not np.isfinite(values).all() or (values % 1 != 0).any():
+        return series
+    if np.signbit(values[values == 0]).any():
+        return series
+
+    minv, maxv = values.min(), values.max()
+    if minv < np.iinfo(np.int64).min or maxv > np.iinfo(np.uint64).max:
+        return series
+
+    compressed_type = get_integer_type(minv, maxv, stats.hasnans)
+    return share_statistics(stats, series.astype(compressed_type))
+
+
+def compress_integer(series: pd.Series) -> pd.Series:
+    stats = column_statistics(series)
+    if stats.valid_count == 0:
+        return series
+
+    compressed_type = get_integer_type(stats.min, stats.max, stats.hasnans)
+    return share_statistics(stats, series.astype(compressed_type))
+
+
+def compress_encoded(series: pd.Series, encodings: Sequence[str] = ()) -> pd.Series:
+    """Store the series in the smallest of the given encoded arrays, if that saves memory
+
+    Encoded arrays (e.g. frame-of-reference and delta encoded integers, decimal-scaled floats) are
+    immutable and decode on access, which is why they are only considered when enabled on the compressor.
+
+    :param series: series to compress
+    :param encodings: names of the encodings to consider, see `compressio.arrays.ENCODINGS`
+    :return: the (compressed) series
+    """
+    best, best_size = series, None
+    for name in encodings:
+        array_type = ENCODINGS[name]
+        if not array_type.supports(series.dtype):
+            continue
+
+        if best_size is None:
+            best_size = memory_size(series)
+        array = array_type.compress(series.array)
+        if array is None:
+            # The values do not suit the encoding, e.g. floats with many decimals
+            continue
+
+        candidate = pd.Series(array, index=series.index, name=series.name)
+        size = memory_size(candidate)
+        if size < best_size:
+            best, best_size = candidate, size
+    return best
+
+
+def compress_boolean(series: pd.Series) -> pd.Series:
+    """Pack the booleans in one bit per value (and one bit per value for the missing values)
+
+    Object, numpy and nullable booleans take 8, 1 and 2 bytes per value. Sparse and encoded (e.g. run-length)
+    columns are only replaced when the bit-packed array is smaller.
+
+    :param series: series of booleans to compress
+    :return: the (compressed) series
+    """
+    if isinstance(series.dtype, BitDtype) or len(series) == 0:
+        return series
+
+    stats = column_statistics(series)
+    if stats.null_count == stats.length:
+        # Without values, there is no evidence that the column holds booleans
+        return series
+
+    array = BitArray.compress(series.array)
+    if array is None:
+        return series
+
+    candidate = pd.Series(array, index=series.index, name=series.name)
+    if memory_size(candidate) < memory_size(series):
+        return candidate
+    return series
+
+
+def compress_blocks(
+    series: pd.Series, codec: str = DEFAULT_CODEC, block_size: int = BLOCK_SIZE
+) -> pd.Series:
+    """Compress the (narrowed) values with a byte-level codec, in blocks that are decompressed on access
+
+    Meant for cold columns: reading a value or slice decompresses its blocks, other operations decompress the
+    full column. Select it for a visions type in the compression map (as the first algorithm, so that it
+    runs last), or per column with `cold_columns` on the compressor.
+
+    :param series: series to compress
+    :param codec: the codec, see `compressio.codecs.CODECS`
+    :param block_size: number of values per block
+    :return: the (compressed) series
+    """
+    if len(series) == 0 or not BlockCompressedArray.supports(series.dtype):
+        return series
+
+    array = BlockCompressedArray.encode(
+        series.array, codec=codec, block_size=block_size
+    )
+    candidate = pd.Series(array, index=series.index, name=series.name)
+    if memory_size(candidate) < memory_size(series):
+        return candidate
+    return series
 
 
 def compress_complex(series: pd.Series) -> pd.Series:
     if series.dtype == np.complex64:
         return series
 
-    real_part = series.apply(lambda x: x.real)
-    imag_part = series.apply(lambda x: x.imag)
-
-    minv_real, maxv_real = real_part.min(), real_part.max()
-    minv_imag, maxv_imag = imag_part.min(), imag_part.max()
+    stats = column_statistics(series)
+    if stats.real_range is None or stats.imag_range is None:
+        return series
 
-    test_real = type_tester(minv_real, maxv_real, np.finfo)
-    test_imag = type_tester(minv_imag, maxv_imag, np.finfo)
+    test_real = type_tester(*stats.real_range, np.finfo)
+    test_imag = type_tester(*stats.imag_range, np.finfo)
 
     if test_real(np.float32) and test_imag(np.float32):
-        return series.astype(np.complex64)
+        return share_statistics(stats, series.astype(np.complex64))
 
     return series
 
 
-def compress_object(series: pd.Series) -> pd.Series:
+# Skip the categorical encoding when more than this fraction of the values is distinct
+MAX_UNIQUE_RATIO = 0.5
+
+
+def categorical_size(length: int, unique_count: int, value_size: float) -> float:
+    """Projected memory size of a categorical: the codes plus the categories
+
+    :param length: number of values
+    :param unique_count: (estimated) number of categories
+    :param value_size: average size of a value in the original representation
+    :return: the size in bytes
+    """
+    code_type = get_compressed_type(
+        [np.int8, np.int16, np.int32, np.int64],
+        type_tester(-1, unique_count, np.iinfo),
+    )
+    return length * np.dtype(code_type).itemsize + unique_count * value_size
+
+
+def compress_categorical(
+    series: pd.Series, max_unique_ratio: float = MAX_UNIQUE_RATIO
+) -> pd.Series:
+    """Encode the series as a categorical, if that saves memory
+
+    The number of distinct values is estimated from a sample first, so that columns with a high
+    cardinality are skipped before the whole column is hashed.
+
+    :param series: series to compress
+    :param max_unique_ratio: skip the encoding when the estimated fraction of distinct values is larger
+    :return: the (compressed) series
+    """
+    stats = column_statistics(series)
+    if stats.length == 0:
+        return series
+
+    if stats.valid_count > 0:
+        unique_count = stats.unique_count
+        if unique_count > max_unique_ratio * stats.valid_count:
+            return series
+
+        value_size = stats.nbytes / stats.length
+        if categorical_size(stats.length, unique_count, value_size) >= stats.nbytes:
+            return series
+
     try:
         new_series = series.astype("category")
-        if new_series.memory_usage(deep=True) < series.memory_usage(deep=True):
+        if memory_size(new_series) < memory_size(series):
             return new_series
     except:  # noqa
         pass
     return series
 
 
-def compress_datetime(series: pd.Series) -> pd.Series:
+def compress_object(
+    series: pd.Series, max_unique_ratio: float = MAX_UNIQUE_RATIO
+) -> pd.Series:
+    """Encode the objects as a categorical, objects that are all booleans (or missing) are bit-packed
+
+    :param series: series to compress
+    :param max_unique_ratio: skip the categorical encoding when the estimated fraction of distinct values is
+        larger
+    :return: the smallest representation
+    """
+    candidates = [
+        compress_categorical(series, max_unique_ratio),
+        compress_boolean(series),
+    ]
+    return min(candidates, key=memory_size)
+
+
+def compress_datetime(
+    series: pd.Series,
+    max_unique_ratio: float = MAX_UNIQUE_RATIO,
+    encodings: Sequence[str] = (),
+) -> pd.Series:
+    """Encode the datetimes as a categorical, or as narrow offsets when encodings are enabled
+
+    The encoded arrays store the offsets from the minimum (or the differences between consecutive values)
+    in steps of the resolution of the data, e.g. seconds or days, so that timestamps that span a few days
+    fit in 32 bits or less. The timezone is kept in the dtype and NaT in a mask.
+
+    :param series: series of datetimes to compress
+    :param max_unique_ratio: skip the categorical encoding when the estimated fraction of distinct values is
+        larger
+    :param encodings: names of the encodings to consider, see `compressio.arrays.ENCODINGS`
+    :return: the smallest representation
+    """
+    candidates = [
+        compress_categorical(series, max_unique_ratio),
+        compress_encoded(series, encodings),
+    ]
+    return min(candidates, key=memory_size)
+
+
+# Difference in size, as a fraction of the original size, for which the more compatible string
+# representation is preferred
+STRING_SIZE_TOLERANCE = 0.05
+
+
+def is_arrow_dtype(dtype) -> bool:
+    return getattr(dtype, "storage", None) == "pyarrow" or (
+        hasattr(pd, "ArrowDtype") and isinstance(dtype, pd.ArrowDtype)
+    )
+
+
+def arrow_string_candidates(series: pd.Series, unique_count: int) -> List[pd.Series]:
+    """Arrow-backed representations of a series of strings: `string[pyarrow]` and a dictionary array
+
+    :param series: series of strings (and missing values)
+    :param unique_count: (estimated) number of distinct values, or 0 to skip the dictionary encoding
+    :return: the candidates, or an empty list when pyarrow is unavailable or the values are not strings
+    """
+    if pa is None:
+        return []
+
     try:
-        new_series = series.astype("category")
-        if new_series.memory_usage(deep=True) < series.memory_usage(deep=True):
-            return new_series
-    except:  # noqa
-        pass
+        array = pa.array(series, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return []
+
+    candidates = [
+        pd.Series(
+            pd.arrays.ArrowStringArray(array), index=series.index, name=series.name
+        )
+    ]
+
+    if unique_count > 0 and hasattr(pd, "ArrowDtype"):
+        encoded = array.dictionary_encode()
+        # The estimate only decides whether to try, the index type follows from the actual dictionary
+        dictionary_size = len(encoded.dictionary)
+        index_type = get_compressed_type(
+            [pa.int8(), pa.int16(), pa.int32()],
+            lambda t: dictionary_size <= np.iinfo(t.to_pandas_dtype()).max,
+        )
+        try:
+            dictionary = encoded.cast(pa.dictionary(index_type, pa.string()))
+        except pa.ArrowInvalid:
+            return candidates
+        candidates.append(
+            pd.Series(
+                pd.arrays.ArrowExtensionArray(dictionary),
+                index=series.index,
+                name=series.name,
+            )
+        )
+    return candidates
+
+
+def compress_string(
+    series: pd.Series, max_unique_ratio: float = MAX_UNIQUE_RATIO
+) -> pd.Series:
+    """Choose the smallest of the object, categorical, Arrow string and Arrow dictionary representations
+
+    Arrow strings store all values in one buffer with offsets, removing the per-object overhead of Python
+    strings, which pays off for high cardinality text. Missing values are stored as nulls in all
+    representations. The Arrow candidates require pyarrow.
+
+    :param series: series of strings to compress
+    :param max_unique_ratio: skip the categorical and dictionary encodings when the estimated fraction of
+        distinct values is larger
+    :return: the (compressed) series
+    """
+    stats = column_statistics(series)
+    if stats.valid_count == 0:
+        return compress_categorical(series, max_unique_ratio)
+
+    unique_count = stats.unique_count
+    if unique_count > max_unique_ratio * stats.valid_count:
+        unique_count = 0
+
+    candidates = [series, compress_categorical(series, max_unique_ratio)]
+    candidates += arrow_string_candidates(series, unique_count)
+
+    # The candidates are ordered by compatibility with the pandas API. A later candidate is only chosen
+    # when it saves substantially more, relative to the original size.
+    sizes = [memory_size(candidate) for candidate in candidates]
+    threshold = min(sizes) + sizes[0] * STRING_SIZE_TOLERANCE
+    return next(c for c, size in zip(candidates, sizes) if size <= threshold)
+
+
+def is_arrow_list_dtype(dtype) -> bool:
+    return (
+        hasattr(pd, "ArrowDtype")
+        and isinstance(dtype, pd.ArrowDtype)
+        and pa.types.is_list(dtype.pyarrow_dtype)
+    )
+
+
+def narrow_arrow_type(values: "pa.Array") -> Optional["pa.DataType"]:
+    """Smallest Arrow type of the flattened values of a list array, like `compress_integer` and `compress_float`
+
+    :param values: the flattened values
+    :return: the type, or None for values that are not integers, floats, booleans or strings
+    """
+    value_type = values.type
+    if pa.types.is_boolean(value_type) or pa.types.is_string(value_type):
+        return value_type
+    if len(values) == values.null_count:
+        return value_type if pa.types.is_integer(value_type) else None
+
+    if pa.types.is_integer(value_type):
+        minmax = pa.compute.min_max(values)
+        compressed_type = get_integer_type(
+            minmax["min"].as_py(), minmax["max"].as_py(), nullable=False
+        )
+        return pa.from_numpy_dtype(compressed_type)
+    if pa.types.is_floating(value_type):
+        # Arrow has no casts to half-precision floats
+        numbers = values.drop_null().to_numpy(zero_copy_only=False)
+        # NaN survives the cast, as in `compress_float` only the other values are checked
+        numbers = numbers[~np.isnan(numbers)]
+        if numbers.itemsize > 4 and is_exact_cast(numbers, np.float32):
+            return pa.float32()
+        return value_type
+    return None
+
+
+def compress_list(series: pd.Series) -> pd.Series:
+    """Store lists as an Arrow list array: the flattened values in a narrow type, plus an offset per list
+
+    A column of Python lists holds a list object per row and an object per value. The list array stores the
+    values of all lists in one buffer and the boundaries of the lists in an offsets buffer. Only lists of
+    integers, floats, booleans or strings are encoded, missing lists become nulls. Requires pyarrow.
+
+    :param series: series of lists to compress
+    :return: the (compressed) series
+    """
+    if pa is None or not hasattr(pd, "ArrowDtype"):
+        return series
+
+    stats = column_statistics(series)
+    if stats.valid_count == 0:
+        return series
+    values = series.to_numpy()
+    valid = values[pd.notna(values)]
+    if type(valid[0]) is not list or not all(type(v) is list for v in valid):
+        return series
+
+    try:
+        # Not `from_pandas`, which would turn NaN inside the lists into nulls
+        missing = np.asarray(pd.isna(values), dtype=bool)
+        array = pa.array(values, mask=missing, from_pandas=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return series
+    if not pa.types.is_list(array.type):
+        return series
+    value_type = narrow_arrow_type(array.flatten())
+    if value_type is None:
+        return series
+
+    new_series = pd.Series(
+        pd.arrays.ArrowExtensionArray(array.cast(pa.list_(value_type))),
+        index=series.index,
+        name=series.name,
+    )
+    if memory_size(new_series) < memory_size(series):
+        return new_series
     return series
 
 
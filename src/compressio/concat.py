@@ -0,0 +1,295 @@
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Type, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import (
+    is_bool_dtype,
+    is_categorical_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+
+from compressio.arrays import BitDtype, EncodedDtype
+from compressio.compression_algorithms.type_compressions import (
+    compress_list,
+    float_types,
+    get_integer_type,
+    integer_types,
+    is_arrow_dtype,
+    is_arrow_list_dtype,
+    is_exact_cast,
+)
+
+
+def _integer_type(series: List[pd.Series]) -> Union[Type[np.dtype], np.dtype, str]:
+    non_empty = [s for s in series if s.notna().any()]
+    if len(non_empty) == 0:
+        return series[0].dtype
+    minv = min(s.min() for s in non_empty)
+    maxv = max(s.max() for s in non_empty)
+    nullable = any(s.hasnans for s in series)
+    return get_integer_type(minv, maxv, nullable)
+
+
+def _union_categories(series: List[pd.Series]) -> pd.Series:
+    template = next(s.values for s in series if is_categorical_dtype(s.dtype))
+    categoricals = []
+    for s in series:
+        if is_categorical_dtype(s.dtype):
+            categoricals.append(s.values)
+        elif s.isna().all():
+            categoricals.append(pd.Categorical(s, categories=template.categories[:0]))
+        else:
+            categoricals.append(pd.Categorical(s))
+    if len({str(c.categories.dtype) for c in categoricals}) > 1:
+        # Categories of different types, e.g. strings and integers, are unioned as objects
+        categoricals = [
+            c.rename_categories(pd.Index(c.categories, dtype=object))
+            for c in categoricals
+        ]
+    union = pd.api.types.union_categoricals(categoricals)
+    return pd.Series(union, index=_concat_index(series))
+
+
+def _concat_index(pieces: Sequence[Union[pd.Series, pd.DataFrame]]) -> pd.Index:
+    return pieces[0].index.append([piece.index for piece in pieces[1:]])
+
+
+def reconcile_series(series: List[pd.Series]) -> List[pd.Series]:
+    """Cast compressed pieces of the same column to a common dtype, without loss of information
+
+    Integers are widened along the order of `compress_integer`, categories are unioned, packed booleans become nullable, floats follow
+    the numpy promotion rules. Pieces that are entirely missing adopt the dtype of the other pieces.
+
+    :param series: the pieces of the column
+    :return: the pieces with a common dtype
+    """
+    dtypes = {str(s.dtype) for s in series}
+    if len(dtypes) == 1 and not is_categorical_dtype(series[0].dtype):
+        return series
+
+    # Pieces that only hold missing values do not constrain the dtype
+    informative = [s for s in series if s.notna().any()] or series
+    if any(isinstance(s.dtype, pd.SparseDtype) for s in informative):
+        sparse_dtypes = {s.dtype for s in informative}
+        if len(sparse_dtypes) == 1:
+            dtype = sparse_dtypes.pop()
+            return [s.astype(dtype) for s in series]
+        series = [
+            s.sparse.to_dense() if isinstance(s.dtype, pd.SparseDtype) else s
+            for s in series
+        ]
+        return reconcile_series(series)
+
+    if all(isinstance(s.dtype, BitDtype) for s in informative):
+        # Packed booleans with and without missing values
+        return [s.astype(BitDtype("boolean")) for s in series]
+
+    if all(
+        is_integer_dtype(s.dtype) and not is_bool_dtype(s.dtype) for s in informative
+    ):
+        dtype = _integer_type(series)
+        return [s.astype(dtype) for s in series]
+
+    if all(is_float_dtype(s.dtype) or is_integer_dtype(s.dtype) for s in informative):
+        dtype = np.result_type(
+            *[getattr(s.dtype, "numpy_dtype", s.dtype) for s in informative]
+        )
+        if not is_float_dtype(dtype):
+            dtype = np.float64
+        return [s.astype(dtype) for s in series]
+
+    return series
+
+
+def concat_series(series: List[pd.Series]) -> pd.Series:
+    """Concatenate compressed pieces of the same column, reconciling their dtypes
+
+    :param series: the pieces to concatenate
+    :return: the concatenated series
+    """
+    if any(is_arrow_list_dtype(s.dtype) for s in series):
+        # The values of the pieces can have different types, e.g. lists of int8 and of int16
+        pieces = [
+            pd.Series(s.tolist(), index=s.index, name=s.name, dtype=object)
+            for s in series
+        ]
+        return compress_list(pd.concat(pieces))
+
+    if any(is_arrow_dtype(s.dtype) for s in series):
+        # Arrow strings are used for text that did not fit a categorical in some of the pieces
+        return pd.concat([s.astype("string[pyarrow]") for s in series])
+
+    if any(is_categorical_dtype(s.dtype) for s in series) and all(
+        is_categorical_dtype(s.dtype) or s.dtype == object or s.isna().all()
+        for s in series
+    ):
+        return _union_categories(series)
+
+    return pd.concat(reconcile_series(series))
+
+
+def concat_frames(
+    frames: Iterable[pd.DataFrame], ignore_index: bool = False
+) -> pd.DataFrame:
+    """Concatenate compressed frames, reconciling the dtypes column by column
+
+    The columns are moved out of the input frames one by one, so that the peak memory usage stays close to
+    the size of the (compressed) result.
+
+    :param frames: the frames to concatenate, which are emptied in the process
+    :param ignore_index: replace the index of the frames by a range index
+    :return: the concatenated frame
+    """
+    frame_list = list(frames)
+    if len(frame_list) == 0:
+        return pd.DataFrame()
+
+    if ignore_index:
+        index = pd.RangeIndex(sum(len(frame) for frame in frame_list))
+    else:
+        index = _concat_index(frame_list)
+    result = pd.DataFrame(index=index)
+    for col in list(frame_list[0].columns):
+        pieces = [frame.pop(col) for frame in frame_list]
+        result[col] = concat_series(pieces).values
+        del pieces
+    return result
+
+
+def _widened_integer(dtype: Any, values: pd.Series) -> Optional[Any]:
+    if not is_numeric_dtype(values.dtype) or is_bool_dtype(values.dtype):
+        return None
+    valid = values.dropna()
+    if is_float_dtype(valid.dtype) and not (valid % 1 == 0).all():
+        return None
+
+    numpy_type = np.dtype(getattr(dtype, "numpy_dtype", dtype)).type
+    info = np.iinfo(numpy_type)
+    minv, maxv = info.min, info.max
+    if len(valid) > 0:
+        minv, maxv = min(minv, valid.min()), max(maxv, valid.max())
+    nullable = isinstance(dtype, ExtensionDtype) or values.hasnans
+    # The current type and the types after it, so that the column is never narrowed
+    type_options = integer_types[integer_types.index(numpy_type) :]
+    try:
+        return get_integer_type(minv, maxv, nullable, type_options)
+    except StopIteration:
+        return None
+
+
+def _widened_float(dtype: np.dtype, values: pd.Series) -> Optional[Any]:
+    if not is_numeric_dtype(values.dtype) or is_bool_dtype(values.dtype):
+        return None
+    valid = values.dropna().to_numpy(dtype=np.float64)
+    for float_type in float_types[float_types.index(dtype.type) :]:
+        if is_exact_cast(valid, float_type):
+            return float_type
+    return None
+
+
+def _extended_categories(
+    dtype: pd.CategoricalDtype, values: pd.Series
+) -> Optional[pd.CategoricalDtype]:
+    unique = pd.Index(pd.unique(values.dropna()))
+    unseen = unique[~unique.isin(dtype.categories)]
+    if len(unseen) == 0:
+        return dtype
+    if dtype.ordered:
+        return None
+    return pd.CategoricalDtype(dtype.categories.append(unseen))
+
+
+def appended_dtype(dtype: Any, values: pd.Series) -> Optional[Any]:
+    """The dtype that holds both a compressed column and new values, widened as little as possible
+
+    Integers are widened along the order of `compress_integer` and floats to the first type in which the
+    new values survive the round trip. Unseen categories are added after the existing categories, and sparse
+    columns keep their fill value.
+
+    :param dtype: the dtype of the compressed column
+    :param values: the new (uncompressed) values
+    :return: the dtype, or None when the new values have to be compressed and reconciled instead
+    """
+    if isinstance(dtype, pd.SparseDtype):
+        subtype = appended_dtype(dtype.subtype, values)
+        if subtype is None or isinstance(
+            pd.api.types.pandas_dtype(subtype), ExtensionDtype
+        ):
+            return None
+        return pd.SparseDtype(subtype, dtype.fill_value)
+    if is_categorical_dtype(dtype):
+        return _extended_categories(dtype, values)
+    if isinstance(dtype, EncodedDtype) or is_bool_dtype(dtype):
+        return None
+    if is_integer_dtype(dtype):
+        return _widened_integer(dtype, values)
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        return _widened_float(dtype, values)
+    return None
+
+
+def append_series(
+    series: pd.Series,
+    new: pd.Series,
+    compress: Callable[[pd.Series], pd.Series],
+    ignore_index: bool = False,
+) -> pd.Series:
+    """Append values to a compressed series, widening its dtype only when the new values require it
+
+    Categories are added without recoding the existing values and sparse columns stay sparse. Columns of
+    which the dtype can not simply be widened (e.g. encoded arrays, or text in an ordered categorical) are
+    appended by compressing the new values and reconciling them with `concat_series`.
+
+    :param series: the compressed series
+    :param new: the new (uncompressed) values
+    :param compress: compresses the new values when their dtype can not be derived from the series
+    :param ignore_index: replace the index by a range index
+    :return: the series with the values appended
+    """
+    dtype = appended_dtype(series.dtype, new)
+    if dtype is None:
+        result = concat_series([series, compress(new)])
+    else:
+        if is_categorical_dtype(dtype):
+            unseen = dtype.categories[len(series.cat.categories) :]
+            if len(unseen) > 0:
+                series = series.cat.add_categories(unseen)
+        elif str(dtype) != str(series.dtype):
+            series = series.astype(dtype)
+        result = pd.concat([series, new.astype(dtype)])
+    result.name = series.name
+    if ignore_index:
+        result = result.reset_index(drop=True)
+    return result
+
+
+def append_frame(
+    data: pd.DataFrame,
+    new: pd.DataFrame,
+    compress: Callable[[pd.Series], pd.Series],
+    ignore_index: bool = False,
+) -> pd.DataFrame:
+    """Append rows to a compressed frame, widening only the columns that do not hold the new rows
+
+    :param data: the compressed frame
+    :param new: the new (uncompressed) rows, with the same columns
+    :param compress: compresses a new column when its dtype can not be derived from the compressed column
+    :param ignore_index: replace the index by a range index
+    :return: the frame with the rows appended
+    """
+    if set(data.columns) != set(new.columns):
+        raise ValueError(
+            "The new rows must have the same columns as the compressed frame"
+        )
+
+    if ignore_index:
+        index = pd.RangeIndex(len(data) + len(new))
+    else:
+        index = _concat_index([data, new])
+    result = pd.DataFrame(index=index)
+    for col in data.columns:
+        result[col] = append_series(data[col], new[col], compress).values
+    return result
@@ -1,27 +1,39 @@
 from functools import singledispatch
+from typing import TYPE_CHECKING
 
 import pandas as pd
-from pint import Quantity
 from visions.typesets import VisionsTypeset
 
-from compressio.compress import compress_func
+from compressio.compress import record_series
+from compressio.size import estimate_size
 from compressio.type_compressor import BaseTypeCompressor
 from compressio.typing import pdT
 
+if TYPE_CHECKING:
+    from pint import Quantity
+
 
 @singledispatch
-def storage_size(data: pdT) -> Quantity:
-    raise TypeError(f"Can't compute memory size of objects with type {type(data)}")
+def storage_size(data: pdT, exact: bool = False) -> "Quantity":
+    """Memory usage of the data, see `compressio.size.estimate_size`
 
+    :param data: the Series or DataFrame
+    :param exact: measure every Python object instead of estimating object columns from a sample
+    :return: the size in bytes
+    """
+    from compressio.partitions import Partitions, is_dask_frame
 
-@storage_size.register(pd.Series)  # type: ignore
-def _(data: pd.Series) -> Quantity:
-    return Quantity(value=data.memory_usage(deep=True), units="byte")
+    if is_dask_frame(data):
+        return storage_size(Partitions.from_dask(data), exact)
+    raise TypeError(f"Can't compute memory size of objects with type {type(data)}")
 
 
+@storage_size.register(pd.Series)  # type: ignore
 @storage_size.register(pd.DataFrame)  # type: ignore
-def _(data: pd.DataFrame) -> Quantity:
-    return Quantity(value=data.memory_usage(deep=True).sum(), units="byte")
+def _(data: pdT, exact: bool = False) -> "Quantity":
+    from pint import Quantity
+
+    return Quantity(value=estimate_size(data, exact=exact), units="byte")
 
 
 @singledispatch
@@ -31,7 +43,14 @@ def compress_report(
     compressor: BaseTypeCompressor,
     with_inference: bool,
     units: str = "megabytes",
+    exact: bool = False,
 ) -> None:
+    from compressio.partitions import Partitions, is_dask_frame
+
+    if is_dask_frame(data):
+        partitions = Partitions.from_dask(data)
+        compress_report(partitions, typeset, compressor, with_inference, units, exact)
+        return
     raise TypeError(f"Can't create a compression report of data type {type(data)}")
 
 
@@ -42,13 +61,13 @@ def _(
     compressor: BaseTypeCompressor,
     with_inference: bool,
     units: str = "megabytes",
+    exact: bool = False,
 ) -> None:
-    before = data.dtype
-    compressed = compress_func(data, typeset, compressor, with_inference)
-    after = compressed.dtype
-    if str(before) != str(after):
+    compressed, record = record_series(data, typeset, compressor, with_inference)
+    before, after = record.dtype_before, record.dtype_after
+    if before != after:
         print(
-            f'{data.name}: converting from {before} to {after} saves {savings(data, compressed, units)} (use `data[{data.name}].astype("{after}")`)'
+            f'{data.name}: converting from {before} to {after} saves {savings(data, compressed, units, exact)} (use `data[{data.name}].astype("{after}")`)'
         )
 
 
@@ -59,18 +78,20 @@ def _(
     compressor: BaseTypeCompressor,
     with_inference: bool,
     units: str = "megabytes",
+    exact: bool = False,
 ) -> None:
     for column in data.columns:
-        compress_report(data[column], typeset, compressor, with_inference, units)
+        compress_report(data[column], typeset, compressor, with_inference, units, exact)
 
 
 def savings(
     original_data: pdT,
     new_data: pdT,
     units: str = "megabyte",
-) -> Quantity:
-    original_size = storage_size(original_data)
-    new_size = storage_size(new_data)
+    exact: bool = False,
+) -> "Quantity":
+    original_size = storage_size(original_data, exact)
+    new_size = storage_size(new_data, exact)
     return (original_size - new_size).to(units)
 
 
@@ -78,9 +99,10 @@ def savings_report(
     original_data: pdT,
     new_data: pdT,
     units: str = "megabyte",
+    exact: bool = False,
 ) -> None:
-    original_size = storage_size(original_data).to(units)
-    new_size = storage_size(new_data).to(units)
+    original_size = storage_size(original_data, exact).to(units)
+    new_size = storage_size(new_data, exact).to(units)
     reduction = original_size - new_size
     print(f"Original size: {original_size}")
     print(f"Compressed size: {new_size}")
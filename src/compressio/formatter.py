@@ -1,3 +1,16 @@
-from pint import UnitRegistry
+from functools import lru_cache
+from typing import Any
 
-ureg = UnitRegistry()
+
+@lru_cache(maxsize=None)
+def unit_registry():
+    """The unit registry, created on first use as parsing the unit definitions is slow"""
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ureg":
+        return unit_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
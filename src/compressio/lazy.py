@@ -0,0 +1,171 @@
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from compressio.arrays import EncodedArray
+from compressio.codecs import get_codec
+from compressio.storage import BufferReader, BufferWriter, read_array, write_array
+
+# Number of decoded columns that a lazy frame keeps
+LAZY_CACHE_SIZE = 8
+
+
+def to_dense(series: pd.Series) -> pd.Series:
+    """Decode sparse and encoded columns into their dense dtype"""
+    if isinstance(series.dtype, pd.SparseDtype):
+        return series.sparse.to_dense()
+    if isinstance(series.array, EncodedArray):
+        return pd.Series(series.array.decode(), index=series.index, name=series.name)
+    return series
+
+
+class LazyColumn:
+    """A compressed column, optionally packed in a block of bytes compressed by a codec"""
+
+    def __init__(self, series: pd.Series, codec: Optional[str] = None):
+        self.dtype = series.dtype
+        self.codec = codec
+        if codec is None:
+            self._series: Optional[pd.Series] = series
+            return
+
+        self._series = None
+        compress, _ = get_codec(codec)
+        writer = BufferWriter()
+        self._spec = write_array(series.array, writer)
+        self._block = compress(writer.to_bytes())
+
+    @property
+    def nbytes(self) -> int:
+        if self._series is not None:
+            return int(self._series.memory_usage(index=False, deep=True))
+        return len(self._block)
+
+    def decode(self, index: pd.Index, name: Any) -> pd.Series:
+        if self._series is not None:
+            return self._series
+        _, decompress = get_codec(self.codec)
+        # The block was written by this column, so its pickled objects (if any) are trusted
+        reader = BufferReader(bytearray(decompress(self._block)), 0, allow_pickle=True)
+        return pd.Series(read_array(self._spec, reader), index=index, name=name)
+
+
+class LazyFrame:
+    """A compressed frame of which the columns are decoded when they are accessed
+
+    Columns are kept in their compressed dtypes, optionally packed by a byte-level codec (zlib, lzma, zstd or
+    lz4). Accessing a column unpacks it, and with `dense` also decodes sparse and encoded arrays. The most
+    recently accessed columns are cached, at most `cache_size` at a time.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[Any, LazyColumn],
+        index: pd.Index,
+        cache_size: int = LAZY_CACHE_SIZE,
+        dense: bool = False,
+    ):
+        self._columns = columns
+        self.index = index
+        self.cache_size = cache_size
+        self.dense = dense
+        self._cache: "OrderedDict[Any, pd.Series]" = OrderedDict()
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: pd.DataFrame,
+        codec: Optional[str] = None,
+        cache_size: int = LAZY_CACHE_SIZE,
+        dense: bool = False,
+    ) -> "LazyFrame":
+        """Wrap a compressed frame
+
+        :param data: the compressed frame
+        :param codec: byte-level codec to pack each column with, see `CODECS`
+        :param cache_size: number of decoded columns to keep
+        :param dense: decode sparse and encoded columns into their dense dtype on access
+        :return: the lazy frame
+        """
+        if data.columns.duplicated().any():
+            raise ValueError("Frames with duplicate column names can not be lazy")
+        columns = {name: LazyColumn(data[name], codec) for name in data.columns}
+        return cls(columns, data.index, cache_size, dense)
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(list(self._columns))
+
+    @property
+    def dtypes(self) -> pd.Series:
+        """The compressed dtypes of the columns"""
+        return pd.Series(
+            [column.dtype for column in self._columns.values()],
+            index=self.columns,
+            dtype=object,
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.index), len(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory size of the stored columns, excluding the cache and the index"""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name) -> bool:
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def _column(self, name) -> pd.Series:
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+        if name not in self._columns:
+            raise KeyError(name)
+
+        series = self._columns[name].decode(self.index, name)
+        if self.dense:
+            series = to_dense(series)
+        if self.cache_size > 0:
+            self._cache[name] = series
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return series
+
+    def __getitem__(self, key: Union[Any, List[Any]]) -> Union[pd.Series, pd.DataFrame]:
+        if isinstance(key, list):
+            return pd.DataFrame(
+                {name: self._column(name) for name in key}, index=self.index
+            )
+        return self._column(key)
+
+    def to_pandas(self, columns: Optional[Iterable[Any]] = None) -> pd.DataFrame:
+        """Decode the (selected) columns into a frame, without filling the cache
+
+        :param columns: the columns to decode, all by default
+        :return: the frame
+        """
+        names = list(self._columns if columns is None else columns)
+        data = {}
+        for name in names:
+            series = self._cache.get(name)
+            if series is None:
+                series = self._columns[name].decode(self.index, name)
+                if self.dense:
+                    series = to_dense(series)
+            data[name] = series
+        return pd.DataFrame(data, index=self.index)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyFrame({len(self)} rows, {len(self._columns)} columns, "
+            f"{len(self._cache)} decoded)"
+        )
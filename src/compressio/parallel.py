@@ -0,0 +1,79 @@
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+BACKENDS = ("thread", "process")
+
+# Per-process state for the process backend. Typesets hold multimethods that
+# cannot be pickled, so the shared arguments are handed to the workers when
+# they start (inherited on fork) instead of being sent along with every task.
+_worker_func: Optional[Callable] = None
+
+
+def _init_worker(func: Callable) -> None:
+    global _worker_func
+    _worker_func = func
+
+
+def _call_worker(item: Any) -> Any:
+    assert _worker_func is not None
+    return _worker_func(item)
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Normalise the number of workers, following the joblib convention
+
+    :param n_jobs: number of workers, None or 1 for serial execution, -1 for all cores
+    :return: a positive number of workers
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    if n_jobs == 0:
+        raise ValueError("n_jobs == 0 has no meaning, use 1 for serial execution")
+    return n_jobs
+
+
+def get_executor(backend: str, n_jobs: int, func: Callable) -> Executor:
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=n_jobs)
+    if backend == "process":
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        return ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(func,),
+        )
+    raise ValueError(f"Unknown backend {backend}, choose one of {BACKENDS}")
+
+
+def parallel_map(
+    func: Callable, items: Iterable, n_jobs: Optional[int] = 1, backend: str = "thread"
+) -> Iterator:
+    """Apply a function to each item, optionally distributed over a pool of workers
+
+    Results are yielded in the order of the input, regardless of the backend.
+
+    :param func: function to apply
+    :param items: the items to map over
+    :param n_jobs: number of workers, None or 1 for serial execution, -1 for all cores
+    :param backend: "thread" or "process"
+    :return: iterator over the results
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, choose one of {BACKENDS}")
+
+    n_jobs = resolve_n_jobs(n_jobs)
+    if n_jobs == 1:
+        yield from map(func, items)
+        return
+
+    with get_executor(backend, n_jobs, func) as executor:
+        if backend == "process":
+            yield from executor.map(_call_worker, items)
+        else:
+            yield from executor.map(func, items)
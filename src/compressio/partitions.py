@@ -0,0 +1,331 @@
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_categorical_dtype
+from visions import VisionsTypeset
+
+from compressio.compress import compress_func, fit_series
+from compressio.concat import concat_frames, concat_series
+from compressio.diagnostics import compress_report, storage_size
+from compressio.parallel import parallel_map
+from compressio.plan import ColumnPlan, CompressionPlan
+from compressio.size import estimate_size
+from compressio.type_compressor import BaseTypeCompressor
+
+if TYPE_CHECKING:
+    from pint import Quantity
+
+Partition = Union[pd.DataFrame, Callable[[], pd.DataFrame]]
+
+
+def load_partition(partition: Partition) -> pd.DataFrame:
+    return partition() if callable(partition) else partition
+
+
+class Partitions:
+    """Frames that together form one frame that does not have to fit in memory
+
+    A partition is a frame or a function without arguments that returns one, e.g.
+    `partial(pd.read_parquet, path)`, so that a partition is only in memory while it is processed.
+    The partitions are kept as they are given and loaded one at a time when they are iterated, an iterator
+    (e.g. of chunks read from a file) can be iterated once. Compressing partitions reads them twice: once to
+    fit a global plan, once to apply it, which takes a sequence such as a list of loaders.
+    """
+
+    def __init__(
+        self,
+        partitions: Iterable[Partition],
+        plan: Optional[CompressionPlan] = None,
+    ):
+        self.partitions = partitions
+        self.plan = plan
+
+    @classmethod
+    def from_dask(cls, data: Any) -> "Partitions":
+        """Partitions that compute the partitions of a Dask frame one at a time
+
+        :param data: the Dask frame
+        :return: the partitions
+        """
+        return cls([partition.compute for partition in data.to_delayed()])
+
+    @property
+    def is_iterator(self) -> bool:
+        """Whether the partitions can only be iterated once"""
+        return iter(self.partitions) is self.partitions
+
+    def __len__(self) -> int:
+        if not isinstance(self.partitions, Sized):
+            raise TypeError("The number of partitions of an iterator is not known")
+        return len(self.partitions)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return map(load_partition, self.partitions)
+
+    def __getitem__(self, position: int) -> pd.DataFrame:
+        return load_partition(self.partitions[position])
+
+    def to_frame(self, ignore_index: bool = False) -> pd.DataFrame:
+        """Concatenate the partitions into a single frame, reconciling their dtypes
+
+        :param ignore_index: replace the index of the partitions by a range index
+        :return: the frame
+        """
+        frames = (frame.copy(deep=False) for frame in self)
+        return concat_frames(frames, ignore_index=ignore_index)
+
+    def __repr__(self) -> str:
+        if not isinstance(self.partitions, Sized):
+            return "Partitions(iterator)"
+        return f"Partitions({len(self)} partitions)"
+
+
+def is_dask_frame(data: Any) -> bool:
+    """Whether the data is a Dask DataFrame, checked without importing Dask"""
+    module = type(data).__module__.split(".")[0]
+    return module in ("dask", "dask_expr") and hasattr(data, "columns")
+
+
+def sketch_series(series: pd.Series) -> pd.Series:
+    """The rows of a compressed series that determine its dtype when it is combined with other partitions
+
+    These are the minimum, the maximum and a missing value, or a valid value when the values can not be
+    ordered. Categories and sparse fill values are part of the dtype and are kept.
+    """
+    missing = np.asarray(series.isna(), dtype=bool)
+    positions = []
+    if missing.any():
+        positions.append(int(missing.argmax()))
+    if not missing.all():
+        try:
+            positions += [int(series.argmin()), int(series.argmax())]
+        except (TypeError, ValueError, NotImplementedError):
+            positions.append(int((~missing).argmax()))
+    return series.iloc[sorted(set(positions))]
+
+
+def sketch_partition(
+    partition: Partition,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> Dict[Any, Tuple[pd.Series, str]]:
+    """Compress a partition and keep the rows of each column that determine its dtype
+
+    :return: the rows and the visions type by column
+    """
+    frame = load_partition(partition)
+    sketch = {}
+    for col in frame.columns:
+        compressed, column_plan = fit_series(
+            frame[col], typeset, compressor, with_inference, sample_size
+        )
+        sketch[col] = (sketch_series(compressed), column_plan.visions_type)
+    return sketch
+
+
+def sketch_pieces(pieces: List[pd.Series]) -> List[pd.Series]:
+    """The sketches of a column, prepared to be concatenated
+
+    The categories of a categorical partition hold all its values, the sketch of another partition only a
+    few. A union of the categories would miss the other values of that partition, so when not every
+    partition is categorical, the categoricals are combined by their values instead.
+    """
+    informative = [piece for piece in pieces if piece.notna().any()]
+    if all(is_categorical_dtype(piece.dtype) for piece in informative):
+        return pieces
+    return [
+        piece.astype(object) if is_categorical_dtype(piece.dtype) else piece
+        for piece in pieces
+    ]
+
+
+def combine_sketches(
+    sketches: List[Dict[Any, Tuple[pd.Series, str]]],
+) -> CompressionPlan:
+    """The plan that holds the values of all partitions, following the rules of `concat_frames`
+
+    :param sketches: the sketches of the partitions, see `sketch_partition`
+    :return: the global plan
+    """
+    columns = [list(sketch) for sketch in sketches]
+    if any(names != columns[0] for names in columns):
+        raise ValueError("All partitions must have the same columns")
+
+    plan = CompressionPlan()
+    for col in columns[0]:
+        combined = concat_series(sketch_pieces([sketch[col][0] for sketch in sketches]))
+        plan[col] = ColumnPlan.from_series(combined, sketches[0][col][1])
+    return plan
+
+
+def apply_plan(
+    partition: Partition,
+    plan: CompressionPlan,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """Cast a partition to the dtypes of the plan
+
+    Columns that can not be cast directly (e.g. when type inference is used) are compressed first.
+    """
+    frame = load_partition(partition)
+    result = pd.DataFrame(index=frame.index)
+    for col in frame.columns:
+        column_plan = plan[col]
+        series = frame[col]
+        if not column_plan.validate(series):
+            series = compress_func(
+                series, typeset, compressor, with_inference, sample_size=sample_size
+            )
+            if column_plan.dtype == "category" and not column_plan.validate(series):
+                # Casting would replace the values that are not in the categories by missing values
+                raise ValueError(
+                    f"Column {col!r} holds values that are not in the categories of the plan"
+                )
+        result[col] = series.astype(column_plan.target_dtype)
+    return result
+
+
+def fit_partitions(
+    data: Partitions,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
+) -> CompressionPlan:
+    """Fit a plan that holds all partitions, from the compressed dtypes and value ranges of each partition
+
+    :param data: the partitions
+    :return: the global plan
+    """
+    func = partial(
+        sketch_partition,
+        typeset=typeset,
+        compressor=compressor,
+        with_inference=with_inference,
+        sample_size=sample_size,
+    )
+    return combine_sketches(list(parallel_map(func, data.partitions, n_jobs, backend)))
+
+
+@compress_func.register(Partitions)  # type: ignore
+def _(
+    data: Partitions,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    inplace: bool = False,
+    n_jobs: Optional[int] = 1,
+    backend: str = "thread",
+    sample_size: Optional[int] = None,
+) -> Partitions:
+    if data.is_iterator:
+        raise TypeError(
+            "Compressing reads the partitions twice, pass them as a sequence (e.g. a list of functions that "
+            "load them) instead of an iterator"
+        )
+
+    # Partitions, rather than columns, are distributed over the workers
+    plan = fit_partitions(
+        data, typeset, compressor, with_inference, n_jobs, backend, sample_size
+    )
+    func = partial(
+        apply_plan,
+        plan=plan,
+        typeset=typeset,
+        compressor=compressor,
+        with_inference=with_inference,
+        sample_size=sample_size,
+    )
+    return Partitions(list(parallel_map(func, data.partitions, n_jobs, backend)), plan)
+
+
+def compress_dask(
+    data: Any,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    sample_size: Optional[int] = None,
+) -> Any:
+    """Compress a Dask frame with a global plan, scheduled by Dask
+
+    :param data: the Dask frame
+    :return: the compressed Dask frame, with the same dtypes in all partitions
+    """
+    import dask
+
+    kwargs = dict(
+        typeset=typeset,
+        compressor=compressor,
+        with_inference=with_inference,
+        sample_size=sample_size,
+    )
+    sketch = dask.delayed(partial(sketch_partition, **kwargs))
+    sketches = dask.compute(*[sketch(part) for part in data.to_delayed()])
+    plan = combine_sketches(list(sketches))
+
+    meta = pd.DataFrame(
+        {col: pd.Series(dtype=plan[col].target_dtype) for col in data.columns}
+    )
+    return data.map_partitions(partial(apply_plan, plan=plan, **kwargs), meta=meta)
+
+
+@storage_size.register(Partitions)  # type: ignore
+def _(data: Partitions, exact: bool = False) -> "Quantity":
+    from pint import Quantity
+
+    size = sum(estimate_size(frame, exact=exact) for frame in data)
+    return Quantity(value=size, units="byte")
+
+
+@compress_report.register(Partitions)  # type: ignore
+def _(
+    data: Partitions,
+    typeset: VisionsTypeset,
+    compressor: BaseTypeCompressor,
+    with_inference: bool,
+    units: str = "megabytes",
+    exact: bool = False,
+) -> None:
+    from pint import Quantity
+
+    compressed = compress_func(data, typeset, compressor, with_inference)
+    assert compressed.plan is not None
+
+    before: Dict[Any, Any] = {}
+    savings: Dict[Any, int] = {}
+    for original, result in zip(data, compressed):
+        for col in original.columns:
+            before.setdefault(col, original[col].dtype)
+            saved = estimate_size(original[col], exact) - estimate_size(
+                result[col], exact
+            )
+            savings[col] = savings.get(col, 0) + saved
+
+    for col, dtype in before.items():
+        after = compressed.plan[col].target_dtype
+        if str(dtype) != str(after):
+            saved = Quantity(value=savings[col], units="byte").to(units)
+            print(
+                f'{col}: converting from {dtype} to {after} saves {saved} (use `data[{col}].astype("{after}")`)'
+            )
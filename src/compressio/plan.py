@@ -0,0 +1,293 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_categorical_dtype,
+    is_complex_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_numeric_dtype,
+)
+
+from compressio.arrays import EncodedDtype
+from compressio.compression_algorithms.type_compressions import is_exact_cast
+
+
+def _encode_scalar(value: Any) -> Any:
+    if value is pd.NA:
+        return "<NA>"
+    if isinstance(value, float) and np.isnan(value):
+        return "<NaN>"
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _decode_scalar(value: Any) -> Any:
+    if value == "<NA>":
+        return pd.NA
+    if value == "<NaN>":
+        return np.nan
+    return value
+
+
+def dtype_to_str(dtype) -> str:
+    """Name of a dtype that `dtype_from_str` can restore, also for Arrow-backed strings"""
+    if isinstance(dtype, pd.StringDtype):
+        return f"string[{dtype.storage}]"
+    if hasattr(pd, "ArrowDtype") and isinstance(dtype, pd.ArrowDtype):
+        import pyarrow as pa
+
+        if pa.types.is_dictionary(dtype.pyarrow_dtype):
+            return f"dictionary[{dtype.pyarrow_dtype.index_type}, {dtype.pyarrow_dtype.value_type}]"
+        if pa.types.is_list(dtype.pyarrow_dtype):
+            return f"list[{dtype.pyarrow_dtype.value_type}]"
+        return f"{dtype.pyarrow_dtype}[pyarrow]"
+    return str(dtype)
+
+
+def dtype_from_str(name: str):
+    if name.startswith("dictionary["):
+        import pyarrow as pa
+
+        index_type, value_type = name[len("dictionary[") : -1].split(", ")
+        return pd.ArrowDtype(
+            pa.dictionary(pa.type_for_alias(index_type), pa.type_for_alias(value_type))
+        )
+    if name.startswith("list["):
+        import pyarrow as pa
+
+        return pd.ArrowDtype(pa.list_(pa.type_for_alias(name[len("list[") : -1])))
+    return pd.api.types.pandas_dtype(name)
+
+
+class ColumnPlan:
+    """The compressed representation chosen for a single column
+
+    Records the visions type and the target dtype (including the categories and the sparse fill value),
+    so that new data with the same schema can be cast without inference.
+    """
+
+    def __init__(
+        self,
+        visions_type: str,
+        dtype: str,
+        categories: Optional[List] = None,
+        categories_dtype: Optional[str] = None,
+        ordered: bool = False,
+        sparse: bool = False,
+        fill_value: Any = None,
+    ):
+        self.visions_type = visions_type
+        self.dtype = dtype
+        self.categories = categories
+        self.categories_dtype = categories_dtype
+        self.ordered = ordered
+        self.sparse = sparse
+        self.fill_value = fill_value
+
+    @classmethod
+    def from_series(cls, series: pd.Series, visions_type: str) -> "ColumnPlan":
+        """Record the plan from a compressed series
+
+        :param series: the compressed series
+        :param visions_type: name of the inferred visions type
+        :return: the plan for this column
+        """
+        dtype = series.dtype
+        sparse = isinstance(dtype, pd.SparseDtype)
+        fill_value = None
+        if sparse:
+            fill_value = dtype.fill_value
+            dtype = dtype.subtype
+
+        if is_categorical_dtype(dtype):
+            return cls(
+                visions_type,
+                "category",
+                categories=dtype.categories.tolist(),
+                categories_dtype=str(dtype.categories.dtype),
+                ordered=bool(dtype.ordered),
+                sparse=sparse,
+                fill_value=fill_value,
+            )
+        return cls(
+            visions_type, dtype_to_str(dtype), sparse=sparse, fill_value=fill_value
+        )
+
+    @property
+    def dense_dtype(self):
+        if self.dtype == "category":
+            categories = pd.Index(self.categories, dtype=self.categories_dtype)
+            return pd.CategoricalDtype(categories, ordered=self.ordered)
+        return dtype_from_str(self.dtype)
+
+    @property
+    def target_dtype(self):
+        if self.sparse:
+            return pd.SparseDtype(self.dense_dtype, self.fill_value)
+        return self.dense_dtype
+
+    def validate(self, series: pd.Series) -> bool:
+        """Cheap check whether the series can be cast to the target dtype without loss of information
+
+        :param series: the (uncompressed) series
+        :return: True when the plan applies to the series
+        """
+        if isinstance(series.dtype, pd.SparseDtype):
+            series = series.sparse.to_dense()
+        dtype = self.dense_dtype
+
+        if is_categorical_dtype(dtype):
+            return bool((series.isin(dtype.categories) | series.isna()).all())
+
+        if str(series.dtype) == str(dtype):
+            return True
+
+        if isinstance(dtype, EncodedDtype):
+            # Encoded arrays adapt to the values, only the decoded dtype has to hold them
+            if is_categorical_dtype(dtype.subtype):
+                # The categories are not part of the name of the dtype, they follow the values
+                return True
+            subtype_plan = ColumnPlan(self.visions_type, dtype_to_str(dtype.subtype))
+            return subtype_plan.validate(series)
+
+        if isinstance(dtype, pd.StringDtype) or self.dtype.startswith("dictionary["):
+            values = series.dropna()
+            if not values.map(type).eq(str).all():
+                return False
+            if self.dtype.startswith("dictionary["):
+                index_type = dtype.pyarrow_dtype.index_type.to_pandas_dtype()
+                return values.nunique() <= np.iinfo(index_type).max
+            return True
+
+        if is_bool_dtype(dtype):
+            if not series.dropna().isin([True, False]).all():
+                return False
+            return isinstance(dtype, pd.api.extensions.ExtensionDtype) or (
+                not series.hasnans
+            )
+
+        if is_complex_dtype(dtype):
+            if not is_numeric_dtype(series.dtype):
+                return False
+            info = np.finfo(dtype)
+            values = series.to_numpy()
+            parts = np.concatenate([values.real, values.imag])
+            return bool((np.abs(parts[np.isfinite(parts)]) <= info.max).all())
+
+        if is_integer_dtype(dtype):
+            if not is_numeric_dtype(series.dtype) or is_bool_dtype(series.dtype):
+                return False
+            if series.hasnans and not isinstance(
+                dtype, pd.api.extensions.ExtensionDtype
+            ):
+                return False
+            values = series.dropna()
+            if len(values) == 0:
+                return True
+            if is_float_dtype(values.dtype) and not (values % 1 == 0).all():
+                return False
+            info = np.iinfo(getattr(dtype, "numpy_dtype", dtype))
+            return bool(info.min <= values.min() and values.max() <= info.max)
+
+        if is_float_dtype(dtype):
+            if not is_numeric_dtype(series.dtype) or is_bool_dtype(series.dtype):
+                return False
+            values = series.dropna()
+            if len(values) == 0:
+                return True
+            info = np.finfo(dtype)
+            if not (info.min <= values.min() and values.max() <= info.max):
+                return False
+            # As in `compress_float`, fitting the range is not enough: 0.1 does not survive a cast to float16
+            numbers = np.asarray(
+                values, dtype=getattr(values.dtype, "numpy_dtype", values.dtype)
+            )
+            return is_exact_cast(numbers, getattr(dtype, "numpy_dtype", dtype))
+
+        return False
+
+    def apply(self, series: pd.Series) -> pd.Series:
+        return series.astype(self.target_dtype)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "visions_type": self.visions_type,
+            "dtype": self.dtype,
+            "categories": (
+                None
+                if self.categories is None
+                else [_encode_scalar(value) for value in self.categories]
+            ),
+            "categories_dtype": self.categories_dtype,
+            "ordered": self.ordered,
+            "sparse": self.sparse,
+            "fill_value": _encode_scalar(self.fill_value),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnPlan":
+        data = dict(data)
+        if data.get("categories") is not None:
+            data["categories"] = [_decode_scalar(value) for value in data["categories"]]
+        data["fill_value"] = _decode_scalar(data.get("fill_value"))
+        return cls(**data)
+
+    def __eq__(self, other):
+        return isinstance(other, ColumnPlan) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"ColumnPlan({self.visions_type}, {self.target_dtype})"
+
+
+class CompressionPlan:
+    """Per-column compression plan, obtained with `Compress.fit` and applied with `Compress.transform`"""
+
+    def __init__(self, columns: Optional[Dict[Any, ColumnPlan]] = None):
+        self.columns = columns if columns is not None else {}
+
+    def __getitem__(self, column) -> ColumnPlan:
+        return self.columns[column]
+
+    def __setitem__(self, column, plan: ColumnPlan) -> None:
+        self.columns[column] = plan
+
+    def __contains__(self, column) -> bool:
+        return column in self.columns
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __eq__(self, other):
+        return isinstance(other, CompressionPlan) and self.columns == other.columns
+
+    def __repr__(self):
+        return f"CompressionPlan({self.columns})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "columns": [
+                {"name": name, "plan": plan.to_dict()}
+                for name, plan in self.columns.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompressionPlan":
+        return cls(
+            {
+                column["name"]: ColumnPlan.from_dict(column["plan"])
+                for column in data["columns"]
+            }
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), default=str)
+
+    @classmethod
+    def from_json(cls, data: str) -> "CompressionPlan":
+        return cls.from_dict(json.loads(data))
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+# Sampling is deterministic, so that compressing the same data twice gives the same result
+RANDOM_STATE = 0
+
+
+def sample_positions(n: int, sample_size: int, ends: bool = True) -> np.ndarray:
+    """Positions of a representative sample: the head, the tail and random rows in between
+
+    :param n: the number of rows
+    :param sample_size: (maximum) number of rows in the sample
+    :param ends: include the head and the tail, which are not random when the data is sorted
+    :return: sorted positions of the sample
+    """
+    if n <= sample_size:
+        return np.arange(n)
+
+    n_ends = sample_size // 3 if ends else 0
+    n_random = sample_size - 2 * n_ends
+    # One random row per stratum, which is O(sample_size) and gives sorted, unique positions
+    rng = np.random.RandomState(RANDOM_STATE)
+    strata = np.linspace(n_ends, n - n_ends, n_random + 1).astype(np.int64)
+    offsets = (rng.random_sample(n_random) * np.diff(strata)).astype(np.int64)
+    middle = strata[:-1] + offsets
+    return np.concatenate([np.arange(n_ends), middle, np.arange(n - n_ends, n)])
+
+
+def sample_series(series: pd.Series, sample_size: int) -> pd.Series:
+    """Take a representative sample of a series: its head, its tail and random rows in between
+
+    The head and tail catch sorted and appended data, the random rows the bulk of the data.
+
+    :param series: series to sample from
+    :param sample_size: (maximum) number of rows in the sample
+    :return: the sample, or the series itself when it is not larger than the sample size
+    """
+    if len(series) <= sample_size:
+        return series
+    return series.iloc[sample_positions(len(series), sample_size)]
@@ -0,0 +1,119 @@
+import sys
+from functools import singledispatch
+
+import numpy as np
+import pandas as pd
+
+from compressio.arrays import RunLengthArray
+from compressio.sampling import sample_positions
+from compressio.typing import pdT
+
+# Number of objects of which the size is measured when estimating the size of an object array
+OBJECT_SAMPLE_SIZE = 1_000
+
+
+def object_array_size(values: np.ndarray) -> int:
+    """Size of an array of Python objects, including the objects, estimated from a sample
+
+    :param values: the object array
+    :return: the size in bytes
+    """
+    positions = sample_positions(len(values), OBJECT_SAMPLE_SIZE, ends=False)
+    if len(positions) == len(values):
+        return values.nbytes + sum(map(sys.getsizeof, values))
+
+    sample_size = sum(map(sys.getsizeof, values[positions]))
+    return values.nbytes + int(sample_size * len(values) / len(positions))
+
+
+@singledispatch
+def array_size(values) -> int:
+    """Size of the buffers of an array, including the objects it references
+
+    Numpy and extension arrays are measured from their buffers, the objects in object arrays are estimated
+    from a sample.
+
+    :param values: the array
+    :return: the size in bytes
+    """
+    return int(values.nbytes)
+
+
+@array_size.register(np.ndarray)
+def _(values: np.ndarray) -> int:
+    if values.dtype == object:
+        return object_array_size(values)
+    return int(values.nbytes)
+
+
+@array_size.register(pd.Categorical)
+def _(values: pd.Categorical) -> int:
+    return int(values.codes.nbytes) + array_size(values.categories.array)
+
+
+@array_size.register(pd.arrays.SparseArray)
+def _(values: pd.arrays.SparseArray) -> int:
+    return int(values.sp_index.nbytes) + array_size(values.sp_values)
+
+
+# Renamed in pandas 2.1
+NumpyExtensionArray = getattr(pd.arrays, "NumpyExtensionArray", None) or getattr(
+    pd.arrays, "PandasArray"
+)
+
+
+@array_size.register(NumpyExtensionArray)
+def _(values) -> int:
+    return array_size(values.to_numpy())
+
+
+@array_size.register(RunLengthArray)
+def _(values: RunLengthArray) -> int:
+    mask_size = 0 if values._mask is None else values._mask.nbytes
+    return array_size(values._values) + int(values._run_ends.nbytes) + mask_size
+
+
+def index_size(index: pd.Index) -> int:
+    if index.dtype == object and not isinstance(index, pd.MultiIndex):
+        # The shallow memory usage includes the hash table, once it is built
+        engine_size = index.memory_usage(deep=False) - index.nbytes
+        return array_size(index.array) + int(engine_size)
+    return int(index.memory_usage(deep=True))
+
+
+@singledispatch
+def estimate_size(data: pdT, exact: bool = False, index: bool = True) -> int:
+    """Memory usage of a Series or DataFrame, without touching every object unless asked to
+
+    The estimate is computed from the buffers of the arrays and, for columns holding Python objects, from
+    the size of a sample of the objects. In exact mode, the size is `memory_usage(deep=True)`, which
+    measures every object.
+
+    :param data: the Series or DataFrame
+    :param exact: use pandas' deep memory usage
+    :param index: include the size of the index
+    :return: the size in bytes
+    """
+    raise TypeError(f"Can't compute memory size of objects with type {type(data)}")
+
+
+@estimate_size.register(pd.Series)  # type: ignore
+def _(data: pd.Series, exact: bool = False, index: bool = True) -> int:
+    if exact:
+        return int(data.memory_usage(index=index, deep=True))
+
+    size = array_size(data.array)
+    if index:
+        size += index_size(data.index)
+    return size
+
+
+@estimate_size.register(pd.DataFrame)  # type: ignore
+def _(data: pd.DataFrame, exact: bool = False, index: bool = True) -> int:
+    if exact:
+        return int(data.memory_usage(index=index, deep=True).sum())
+
+    size = sum(estimate_size(series, index=False) for _, series in data.items())
+    if index:
+        size += index_size(data.index)
+    return size
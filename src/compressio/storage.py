@@ -0,0 +1,471 @@
+import io
+import json
+import mmap as mmap_module
+import pickle
+import struct
+from functools import singledispatch
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas._libs.sparse import IntIndex
+from pandas.api.types import is_categorical_dtype
+
+from compressio.arrays import (
+    BitArray,
+    BlockCompressedArray,
+    DecimalArray,
+    DeltaArray,
+    EncodedArray,
+    FrameOfReferenceArray,
+    RunLengthArray,
+)
+from compressio.arrays.frame_of_reference import NumpyExtensionArray
+from compressio.plan import (
+    CompressionPlan,
+    _decode_scalar,
+    _encode_scalar,
+    dtype_from_str,
+    dtype_to_str,
+)
+from compressio.typing import pdT
+
+# The file starts with the magic bytes and the length of the JSON header
+MAGIC = b"CMPRSSIO"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sQ")
+
+# Buffers start at multiples of this number of bytes, so that they can be viewed as arrays of any dtype
+ALIGNMENT = 64
+
+# Encoded arrays by the name of their encoding
+ENCODED_ARRAYS = {
+    array_type._dtype_class.encoding: array_type
+    for array_type in [
+        FrameOfReferenceArray,
+        DeltaArray,
+        DecimalArray,
+        RunLengthArray,
+        BitArray,
+        BlockCompressedArray,
+    ]
+}
+
+
+def _aligned(position: int) -> int:
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+class BufferWriter:
+    """Collects the buffers of the arrays, which are written after the header"""
+
+    def __init__(self):
+        self.buffers: List[Tuple[int, np.ndarray]] = []
+        self.size = 0
+
+    def add(self, values: np.ndarray) -> Dict[str, Any]:
+        """Add a numpy array of a fixed-width dtype
+
+        :param values: the array
+        :return: the description of the buffer in the header
+        """
+        values = np.ascontiguousarray(values)
+        offset = _aligned(self.size)
+        self.buffers.append((offset, values))
+        self.size = offset + values.nbytes
+        return {"offset": offset, "dtype": values.dtype.str, "length": len(values)}
+
+    def write(self, file) -> None:
+        position = 0
+        for offset, values in self.buffers:
+            file.write(b"\0" * (offset - position))
+            file.write(memoryview(values.view(np.uint8)))
+            position = offset + values.nbytes
+
+    def to_bytes(self) -> bytes:
+        stream = io.BytesIO()
+        self.write(stream)
+        return stream.getvalue()
+
+
+class BufferReader:
+    """Views the buffers in the (memory-mapped) file as numpy arrays, without copying them
+
+    Pickled objects are only restored with `allow_pickle`, as unpickling untrusted data can execute code.
+    """
+
+    def __init__(self, buffer, start: int, allow_pickle: bool = False):
+        self.buffer = buffer
+        self.start = start
+        self.allow_pickle = allow_pickle
+
+    def get(self, spec: Dict[str, Any]) -> np.ndarray:
+        dtype = np.dtype(spec["dtype"])
+        if spec["length"] == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.frombuffer(
+            self.buffer,
+            dtype=dtype,
+            count=spec["length"],
+            offset=self.start + spec["offset"],
+        )
+
+
+@singledispatch
+def write_array(values, writer: BufferWriter) -> Dict[str, Any]:
+    """Add the buffers of an array to the writer
+
+    :param values: numpy array or pandas (extension) array
+    :param writer: collects the buffers
+    :return: the description of the array in the header, which `read_array` restores the array from
+    """
+    raise TypeError(f"Arrays of type {type(values).__name__} can not be saved")
+
+
+@write_array.register(np.ndarray)
+def _(values: np.ndarray, writer: BufferWriter) -> Dict[str, Any]:
+    if values.dtype != object:
+        return {"kind": "numpy", "buffer": writer.add(values)}
+
+    # Strings are stored as their utf-8 encoding and the offsets at which they end
+    missing = np.asarray(pd.isna(values), dtype=bool)
+    strings = values[~missing]
+    if not all(isinstance(value, str) for value in strings):
+        # Other objects, e.g. mixed types or dicts, are pickled
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+        return {"kind": "pickle", "data": writer.add(np.frombuffer(data, np.uint8))}
+
+    encoded = [value.encode("utf-8", "surrogatepass") for value in strings]
+    ends = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return {
+        "kind": "strings",
+        "data": writer.add(data),
+        "ends": writer.add(ends),
+        "missing": writer.add(missing),
+        "na_value": _encode_scalar(values[missing][0]) if missing.any() else None,
+    }
+
+
+@write_array.register(NumpyExtensionArray)
+def _(values, writer: BufferWriter) -> Dict[str, Any]:
+    return write_array(values.to_numpy(), writer)
+
+
+@write_array.register(pd.arrays.DatetimeArray)
+@write_array.register(pd.arrays.TimedeltaArray)
+def _(values, writer: BufferWriter) -> Dict[str, Any]:
+    return {
+        "kind": "datetime",
+        "values": write_array(np.asarray(values.asi8), writer),
+        "dtype": str(values.dtype),
+    }
+
+
+@write_array.register(pd.arrays.IntegerArray)
+@write_array.register(pd.arrays.FloatingArray)
+@write_array.register(pd.arrays.BooleanArray)
+def _(values, writer: BufferWriter) -> Dict[str, Any]:
+    return {
+        "kind": "masked",
+        "data": writer.add(values._data),
+        "mask": writer.add(values._mask),
+        "dtype": str(values.dtype),
+    }
+
+
+@write_array.register(pd.Categorical)
+def _(values: pd.Categorical, writer: BufferWriter) -> Dict[str, Any]:
+    return {
+        "kind": "categorical",
+        "codes": writer.add(values.codes),
+        "categories": write_array(values.categories.array, writer),
+        "ordered": bool(values.ordered),
+    }
+
+
+@write_array.register(pd.arrays.SparseArray)
+def _(values: pd.arrays.SparseArray, writer: BufferWriter) -> Dict[str, Any]:
+    sp_index = values.sp_index.to_int_index()
+    return {
+        "kind": "sparse",
+        "values": write_array(values.sp_values, writer),
+        "indices": writer.add(sp_index.indices),
+        "length": int(sp_index.length),
+        "fill_value": _encode_scalar(values.fill_value),
+    }
+
+
+@write_array.register(EncodedArray)
+def _(values: EncodedArray, writer: BufferWriter) -> Dict[str, Any]:
+    state = {}
+    for name, value in values._encoded_state().items():
+        if isinstance(value, (np.ndarray, pd.api.extensions.ExtensionArray)):
+            state[name] = {"array": write_array(value, writer)}
+        else:
+            state[name] = _encode_scalar(value)
+
+    subtype = values.dtype.subtype
+    return {
+        "kind": "encoded",
+        "encoding": values.dtype.encoding,
+        # Categorical subtypes follow from the encoded values
+        "subtype": None if is_categorical_dtype(subtype) else dtype_to_str(subtype),
+        "state": state,
+    }
+
+
+def _write_arrow(values, writer: BufferWriter) -> Dict[str, Any]:
+    import pyarrow as pa
+
+    chunked = values._data
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_arrays([chunked], names=["values"])
+    with pa.ipc.new_stream(sink, table.schema) as stream:
+        stream.write_table(table)
+    data = np.frombuffer(sink.getvalue(), dtype=np.uint8)
+    return {
+        "kind": "arrow",
+        "data": writer.add(data),
+        "dtype": dtype_to_str(values.dtype),
+    }
+
+
+write_array.register(pd.arrays.ArrowStringArray, _write_arrow)
+if hasattr(pd.arrays, "ArrowExtensionArray"):
+    write_array.register(pd.arrays.ArrowExtensionArray, _write_arrow)
+
+
+def read_array(spec: Dict[str, Any], reader: BufferReader) -> Any:
+    """Restore an array from its description in the header
+
+    Fixed-width buffers are views of the file, strings are decoded into Python objects.
+
+    :param spec: the description written by `write_array`
+    :param reader: views the buffers
+    :return: numpy array or pandas (extension) array
+    """
+    kind = spec["kind"]
+    if kind == "numpy":
+        return reader.get(spec["buffer"])
+
+    if kind == "strings":
+        data = reader.get(spec["data"]).tobytes()
+        ends = reader.get(spec["ends"])
+        missing = reader.get(spec["missing"])
+        starts = np.concatenate([[0], ends[:-1]])
+        values = np.empty(len(missing), dtype=object)
+        values[~missing] = [
+            data[start:end].decode("utf-8", "surrogatepass")
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+        values[missing] = _decode_scalar(spec["na_value"])
+        return values
+
+    if kind == "pickle":
+        if not reader.allow_pickle:
+            raise ValueError(
+                "The data holds pickled objects, which can execute code when they are loaded. "
+                "Pass allow_pickle=True when the file is trusted"
+            )
+        return pickle.loads(reader.get(spec["data"]).tobytes())
+
+    if kind == "datetime":
+        dtype = pd.api.types.pandas_dtype(spec["dtype"])
+        values = read_array(spec["values"], reader)
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            unit = dtype.unit
+        else:
+            unit = np.datetime_data(dtype)[0]
+        if dtype.kind == "m":
+            return pd.arrays.TimedeltaArray(values.view(f"m8[{unit}]"), dtype=dtype)
+        return pd.arrays.DatetimeArray(values.view(f"M8[{unit}]"), dtype=dtype)
+
+    if kind == "masked":
+        array_type = pd.api.types.pandas_dtype(spec["dtype"]).construct_array_type()
+        return array_type(reader.get(spec["data"]), reader.get(spec["mask"]))
+
+    if kind == "categorical":
+        categories = pd.Index(read_array(spec["categories"], reader))
+        dtype = pd.CategoricalDtype(categories, ordered=spec["ordered"])
+        return pd.Categorical.from_codes(reader.get(spec["codes"]), dtype=dtype)
+
+    if kind == "sparse":
+        values = read_array(spec["values"], reader)
+        indices = reader.get(spec["indices"])
+        return pd.arrays.SparseArray(
+            values,
+            sparse_index=IntIndex(spec["length"], indices),
+            fill_value=_decode_scalar(spec["fill_value"]),
+            dtype=values.dtype,
+        )
+
+    if kind == "encoded":
+        array_type = ENCODED_ARRAYS[spec["encoding"]]
+        state = {
+            name: (
+                read_array(value["array"], reader)
+                if isinstance(value, dict)
+                else _decode_scalar(value)
+            )
+            for name, value in spec["state"].items()
+        }
+        if spec["subtype"] is not None:
+            state["subtype"] = dtype_from_str(spec["subtype"])
+        return array_type(**state)
+
+    if kind == "arrow":
+        import pyarrow as pa
+
+        data = pa.py_buffer(reader.get(spec["data"]))
+        table = pa.ipc.open_stream(data).read_all()
+        dtype = dtype_from_str(spec["dtype"])
+        return dtype.construct_array_type()(table.column(0))
+
+    raise ValueError(f"Unknown kind of array '{kind}'")
+
+
+def _check_name(name: Any) -> Any:
+    if not isinstance(name, (str, int, float, bool, type(None))):
+        raise TypeError(f"Only strings and numbers can be saved as names, got {name!r}")
+    return _encode_scalar(name)
+
+
+def write_index(index: pd.Index, writer: BufferWriter) -> Dict[str, Any]:
+    if isinstance(index, pd.RangeIndex):
+        return {
+            "kind": "range",
+            "start": index.start,
+            "stop": index.stop,
+            "step": index.step,
+            "name": _check_name(index.name),
+        }
+    if isinstance(index, pd.MultiIndex):
+        # The levels and the narrow codes, as they are in memory
+        return {
+            "kind": "multi",
+            "levels": [write_array(level.array, writer) for level in index.levels],
+            "codes": [write_array(codes, writer) for codes in index.codes],
+            "names": [_check_name(name) for name in index.names],
+        }
+    return {
+        "kind": "index",
+        "values": write_array(index.array, writer),
+        "name": _check_name(index.name),
+    }
+
+
+def read_index(spec: Dict[str, Any], reader: BufferReader) -> pd.Index:
+    if spec["kind"] == "range":
+        name = _decode_scalar(spec["name"])
+        return pd.RangeIndex(spec["start"], spec["stop"], spec["step"], name=name)
+    if spec["kind"] == "multi":
+        levels = [read_array(level, reader) for level in spec["levels"]]
+        names = [_decode_scalar(name) for name in spec["names"]]
+        return pd.MultiIndex(
+            levels=[pd.Index(level) for level in levels],
+            codes=[read_array(codes, reader) for codes in spec["codes"]],
+            names=names,
+            verify_integrity=False,
+        )
+    return pd.Index(
+        read_array(spec["values"], reader), name=_decode_scalar(spec["name"])
+    )
+
+
+def save(data: pdT, path, plan: Optional[CompressionPlan] = None) -> None:
+    """Save compressed data in the compressio format
+
+    The file holds a JSON header followed by the raw buffers of the columns: the narrow numpy arrays,
+    category codes and categories, sparse indices and the buffers of the encoded arrays, each aligned to
+    64 bytes. Strings are stored as utf-8, other objects (e.g. dicts or mixed types) are pickled.
+
+    :param data: the compressed series or frame
+    :param path: the file to write
+    :param plan: the compression plan to store with the data, see `load_plan`
+    """
+    if isinstance(data, pd.Series):
+        columns = [(data.name, data.array)]
+    else:
+        if data.columns.duplicated().any():
+            raise ValueError("Frames with duplicate column names can not be saved")
+        columns = [(name, data[name].array) for name in data.columns]
+
+    writer = BufferWriter()
+    header = {
+        "format_version": FORMAT_VERSION,
+        "kind": "series" if isinstance(data, pd.Series) else "frame",
+        "index": write_index(data.index, writer),
+        "columns": [
+            {"name": _check_name(name), "array": write_array(array, writer)}
+            for name, array in columns
+        ],
+        "plan": None if plan is None else plan.to_dict(),
+    }
+
+    encoded_header = json.dumps(header, default=str).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(encoded_header))
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, len(encoded_header)))
+        file.write(encoded_header)
+        file.write(b"\0" * (data_start - _PREAMBLE.size - len(encoded_header)))
+        writer.write(file)
+
+
+def _read_header(file) -> Tuple[Dict[str, Any], int]:
+    magic, header_size = _PREAMBLE.unpack(file.read(_PREAMBLE.size))
+    if magic != MAGIC:
+        raise ValueError("Not a compressio file")
+    header = json.loads(file.read(header_size).decode("utf-8"))
+    if header["format_version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"The file has format version {header['format_version']}, this version of compressio reads "
+            f"up to version {FORMAT_VERSION}"
+        )
+    return header, _aligned(_PREAMBLE.size + header_size)
+
+
+def load(path, mmap: bool = True, allow_pickle: bool = False) -> pdT:
+    """Load data saved with `save` or `Compress.save`
+
+    With `mmap`, the buffers are memory-mapped: the columns are views of the file that the operating system
+    pages in on access, and processes that load the same file share the pages. These columns are read-only,
+    modify a copy or load with `mmap=False`.
+
+    :param path: the file to read
+    :param mmap: memory-map the file instead of reading it
+    :param allow_pickle: restore columns of objects that are not strings, which are pickled; only load such
+        files when they are trusted, as unpickling can execute code
+    :return: the compressed series or frame
+    """
+    with open(path, "rb") as file:
+        header, data_start = _read_header(file)
+        if mmap:
+            buffer = mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+        else:
+            file.seek(0)
+            buffer = bytearray(file.read())
+
+    reader = BufferReader(buffer, data_start, allow_pickle)
+    index = read_index(header["index"], reader)
+    columns = {
+        _decode_scalar(column["name"]): read_array(column["array"], reader)
+        for column in header["columns"]
+    }
+    if header["kind"] == "series":
+        ((name, array),) = columns.items()
+        return pd.Series(array, index=index, name=name, copy=False)
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def load_plan(path) -> Optional[CompressionPlan]:
+    """Load the compression plan that was saved with the data, without loading the data
+
+    :param path: the file to read
+    :return: the plan, or None when the data was saved without one
+    """
+    with open(path, "rb") as file:
+        header, _ = _read_header(file)
+    if header["plan"] is None:
+        return None
+    return CompressionPlan.from_dict(header["plan"])
@@ -0,0 +1,147 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger("compressio")
+
+_local = threading.local()
+
+
+class ColumnRecord:
+    """What the compression of a column did and where its time went
+
+    Times are in seconds: `inference_time` is spent in type inference, `statistics_time` in the column
+    statistics shared by the algorithms (see `column_statistics`) and `cast_time` in the remainder of the
+    algorithms. `algorithms` is the chain in the order it is applied, `applied` the algorithms of the chain
+    that changed the dtype. Sizes are in bytes and exclude the index.
+    """
+
+    def __init__(
+        self,
+        column: Any,
+        dtype_before: str,
+        bytes_before: int,
+        visions_type: Optional[str] = None,
+        algorithms: Optional[List[str]] = None,
+        applied: Optional[List[str]] = None,
+        dtype_after: Optional[str] = None,
+        bytes_after: Optional[int] = None,
+        inference_time: float = 0.0,
+        statistics_time: float = 0.0,
+        cast_time: float = 0.0,
+    ):
+        self.column = column
+        self.dtype_before = dtype_before
+        self.bytes_before = bytes_before
+        self.visions_type = visions_type
+        self.algorithms = algorithms if algorithms is not None else []
+        self.applied = applied if applied is not None else []
+        self.dtype_after = dtype_after
+        self.bytes_after = bytes_after
+        self.inference_time = inference_time
+        self.statistics_time = statistics_time
+        self.cast_time = cast_time
+
+    @property
+    def total_time(self) -> float:
+        return self.inference_time + self.statistics_time + self.cast_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "column": self.column,
+            "visions_type": self.visions_type,
+            "algorithms": list(self.algorithms),
+            "applied": list(self.applied),
+            "dtype_before": self.dtype_before,
+            "dtype_after": self.dtype_after,
+            "bytes_before": self.bytes_before,
+            "bytes_after": self.bytes_after,
+            "inference_time": self.inference_time,
+            "statistics_time": self.statistics_time,
+            "cast_time": self.cast_time,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnRecord({self.column}: {self.dtype_before} -> {self.dtype_after}, "
+            f"{self.total_time:.4f}s)"
+        )
+
+
+class CompressionReport:
+    """The records of the columns of a compression, obtained with `Compress(telemetry=True)`"""
+
+    def __init__(self, records: Optional[List[ColumnRecord]] = None):
+        self.records = records if records is not None else []
+
+    def __getitem__(self, column) -> ColumnRecord:
+        for record in self.records:
+            if record.column == column:
+                return record
+        raise KeyError(column)
+
+    def __iter__(self) -> Iterator[ColumnRecord]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __repr__(self) -> str:
+        return f"CompressionReport({self.records})"
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per column, indexed by the column name"""
+        columns = list(ColumnRecord(None, "", 0).to_dict())
+        frame = pd.DataFrame(
+            [record.to_dict() for record in self.records], columns=columns
+        )
+        return frame.set_index("column")
+
+    def to_json(self) -> str:
+        return json.dumps([record.to_dict() for record in self.records], default=str)
+
+
+def log_record(record: ColumnRecord) -> None:
+    """Callback that logs the records to the "compressio" logger at debug level"""
+    logger.debug("compressed column %s", json.dumps(record.to_dict(), default=str))
+
+
+def current_record() -> Optional[ColumnRecord]:
+    """The record of the column that is compressed in this thread, if it is recorded"""
+    return getattr(_local, "record", None)
+
+
+@contextmanager
+def record_scope(record: ColumnRecord) -> Iterator[ColumnRecord]:
+    """Record the compression of a column within this scope, in the current thread"""
+    _local.record = record
+    try:
+        yield record
+    finally:
+        _local.record = None
+
+
+@contextmanager
+def timed(field: str) -> Iterator[None]:
+    """Add the time spent in this scope to a time field of the current record, if any
+
+    Nested scopes of the same field are only counted once.
+    """
+    record = current_record()
+    active = getattr(_local, "active", set())
+    if record is None or field in active:
+        yield
+        return
+
+    _local.active = active | {field}
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        setattr(record, field, getattr(record, field) + time.perf_counter() - start)
+        _local.active = active
@@ -1,5 +1,6 @@
-from functools import singledispatch
-from typing import Type, Union
+import time
+from functools import partial, singledispatch
+from typing import Any, Callable, List, Sequence, Type, Union
 
 import pandas as pd
 from visions import (
@@ -13,14 +14,25 @@ from visions import (
     VisionsBaseType,
 )
 
+from compressio.arrays import ENCODINGS
+from compressio.codecs import DEFAULT_CODEC, get_codec
 from compressio.compression_algorithms import (
+    MAX_UNIQUE_RATIO,
+    compress_blocks,
+    compress_boolean,
     compress_complex,
     compress_datetime,
+    compress_encoded,
     compress_float,
     compress_integer,
+    compress_integral_float,
+    compress_list,
     compress_object,
-    compress_sparse_missing,
+    compress_sparse,
+    compress_string,
 )
+from compressio.compression_algorithms.statistics import statistics_scope
+from compressio.telemetry import ColumnRecord, current_record
 from compressio.utils import compose
 
 
@@ -40,37 +52,162 @@ def _(f: Union[list, tuple]):
     return compose(f)
 
 
+def algorithm_name(func: Callable) -> str:
+    while isinstance(func, partial):
+        func = func.func
+    return getattr(func, "__name__", type(func).__name__)
+
+
+def encoding_funcs(encodings: Sequence[str]) -> List:
+    """The algorithm that applies the encodings, to prepend to the algorithms of a type
+
+    :param encodings: names of the encodings, see `compressio.arrays.ENCODINGS`
+    :return: an empty list when no encodings are enabled
+    """
+    unknown = set(encodings) - set(ENCODINGS)
+    if unknown:
+        raise ValueError(
+            f"Unknown encodings {sorted(unknown)}, choose from {list(ENCODINGS)}"
+        )
+    if len(encodings) == 0:
+        return []
+    return [partial(compress_encoded, encodings=tuple(encodings))]
+
+
 class BaseTypeCompressor:
-    def __init__(self, compression_map, *args, **kwargs):
+    def __init__(
+        self,
+        compression_map,
+        *args,
+        exact_sizes: bool = False,
+        cold_columns: Sequence = (),
+        codec: str = DEFAULT_CODEC,
+        **kwargs,
+    ):
+        """
+        :param compression_map: the compression algorithms by visions type
+        :param exact_sizes: measure the size of object columns exactly instead of from a sample
+        :param cold_columns: names of rarely read columns, which are additionally compressed in blocks by
+            the codec (see `compress_blocks`)
+        :param codec: the codec for the cold columns, see `compressio.codecs.CODECS`
+        """
         self.compression_map = compression_map
+        self.exact_sizes = exact_sizes
+        self.cold_columns = tuple(cold_columns)
+        self.codec = codec
+        if self.cold_columns:
+            # Fail early on unknown codecs and missing packages
+            get_codec(codec)
+
+    def algorithm_chain(
+        self, name: Any, dtype: Type[VisionsBaseType]
+    ) -> List[Callable]:
+        """The algorithms that compress a column, in the order in which they are applied
+
+        :param name: the name of the column
+        :param dtype: the visions type of the column
+        :return: the algorithms
+        """
+        algorithms = self.compression_map.get(dtype, [])
+        if isinstance(algorithms, (list, tuple)):
+            chain = list(reversed(algorithms))
+        else:
+            chain = [algorithms]
+        if name in self.cold_columns:
+            chain.append(partial(compress_blocks, codec=self.codec))
+        return chain
 
     def compress(self, series: pd.Series, dtype: Type[VisionsBaseType]) -> pd.Series:
+        record = current_record()
+        if record is not None:
+            return self._compress_recorded(series, dtype, record)
+
         compression_func = parse_func(self.compression_map.get(dtype, lambda x: x))
-        return compression_func(series)
+        if series.name in self.cold_columns:
+            compression_func = compose(
+                [partial(compress_blocks, codec=self.codec), compression_func]
+            )
+        # Algorithms composed on the same column share its statistics
+        with statistics_scope(self.exact_sizes):
+            return compression_func(series)
+
+    def _compress_recorded(
+        self, series: pd.Series, dtype: Type[VisionsBaseType], record: ColumnRecord
+    ) -> pd.Series:
+        """Apply the algorithms one by one, recording which change the dtype and the time they take"""
+        chain = self.algorithm_chain(series.name, dtype)
+        record.algorithms = [algorithm_name(func) for func in chain]
+        statistics_time = record.statistics_time
+        start = time.perf_counter()
+        with statistics_scope(self.exact_sizes):
+            for func in chain:
+                result = func(series)
+                if str(result.dtype) != str(series.dtype):
+                    record.applied.append(algorithm_name(func))
+                series = result
+        elapsed = time.perf_counter() - start
+        record.cast_time += elapsed - (record.statistics_time - statistics_time)
+        return series
 
 
 class DefaultCompressor(BaseTypeCompressor):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        max_unique_ratio: float = MAX_UNIQUE_RATIO,
+        encodings: Sequence[str] = (),
+        **kwargs,
+    ):
+        """
+        :param max_unique_ratio: only attempt a categorical encoding when the estimated fraction of distinct
+            values is at most this ratio
+        :param encodings: encoded arrays to consider after the dtype is narrowed, e.g.
+            ("frame_of_reference", "delta", "decimal", "run_length")
+        """
+        compress_object_ = partial(compress_object, max_unique_ratio=max_unique_ratio)
+        compress_string_ = partial(compress_string, max_unique_ratio=max_unique_ratio)
+        encode = encoding_funcs(encodings)
         compression_map = {
-            Integer: compress_integer,
-            Float: compress_float,
+            Integer: encode + [compress_integer],
+            DateTime: encode,
+            Float: encode + [compress_integral_float, compress_float],
             Complex: compress_complex,
-            Object: compress_object,
-            String: compress_object,
+            Boolean: [compress_boolean] + encode,
+            Object: encode + [compress_list, compress_object_],
+            String: encode + [compress_string_],
         }
         super().__init__(compression_map, *args, **kwargs)
 
 
 class SparseCompressor(BaseTypeCompressor):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        max_unique_ratio: float = MAX_UNIQUE_RATIO,
+        encodings: Sequence[str] = (),
+        **kwargs,
+    ):
+        """
+        :param max_unique_ratio: only attempt a categorical encoding when the estimated fraction of distinct
+            values is at most this ratio
+        :param encodings: encoded arrays to consider after the dtype is narrowed, e.g.
+            ("frame_of_reference", "delta", "decimal", "run_length"). Sparse columns are not encoded.
+        """
+        compress_object_ = partial(compress_object, max_unique_ratio=max_unique_ratio)
+        compress_string_ = partial(compress_string, max_unique_ratio=max_unique_ratio)
+        encode = encoding_funcs(encodings)
         compression_map = {
-            Integer: [compress_sparse_missing, compress_integer],
-            Float: [compress_sparse_missing, compress_float],
-            Complex: [compress_sparse_missing, compress_complex],
-            Object: compress_object,
-            Boolean: compress_sparse_missing,
+            Integer: encode + [compress_sparse, compress_integer],
+            Float: encode + [compress_sparse, compress_integral_float, compress_float],
+            Complex: [compress_sparse, compress_complex],
+            Object: encode + [compress_list, compress_object_],
+            Boolean: [compress_boolean] + encode + [compress_sparse],
             # Pending https://github.com/pandas-dev/pandas/issues/35762
-            DateTime: compress_datetime,
-            String: [compress_sparse_missing, compress_object],
+            DateTime: partial(
+                compress_datetime,
+                max_unique_ratio=max_unique_ratio,
+                encodings=tuple(encodings),
+            ),
+            String: encode + [compress_sparse, compress_string_],
         }
         super().__init__(compression_map, *args, **kwargs)
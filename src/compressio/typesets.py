@@ -1,10 +1,26 @@
-from visions import Boolean, Complex, DateTime, Float, Generic, Integer, Object, String
+import weakref
+from functools import lru_cache
+from typing import Dict, Optional, Type
+
+import numpy as np
+import pandas as pd
+from visions import (
+    Boolean,
+    Complex,
+    DateTime,
+    Float,
+    Generic,
+    Integer,
+    Object,
+    String,
+    VisionsBaseType,
+)
 from visions.typesets import VisionsTypeset
 
 
 class DefaultCompressioTypeset(VisionsTypeset):
     def __init__(self):
-        types = [Object, String, Integer, Float, Complex, Generic]
+        types = [Object, String, Integer, Float, Complex, Boolean, Generic]
         super().__init__(types)
 
 
@@ -12,3 +28,73 @@ class SparseCompressioTypeset(VisionsTypeset):
     def __init__(self):
         types = [Object, String, Integer, Float, Complex, DateTime, Boolean, Generic]
         super().__init__(types)
+
+
+@lru_cache(maxsize=None)
+def cached_typeset(typeset_type: Type[VisionsTypeset]) -> VisionsTypeset:
+    """A shared instance of a typeset without arguments, of which the type graphs are built once per process
+
+    :param typeset_type: the typeset class, e.g. `DefaultCompressioTypeset`
+    :return: the typeset
+    """
+    return typeset_type()
+
+
+# Visions types of the numpy dtype kinds of which the type follows from the dtype alone
+NATIVE_TYPES: Dict[str, Type[VisionsBaseType]] = {
+    "b": Boolean,
+    "i": Integer,
+    "u": Integer,
+    "f": Float,
+    "c": Complex,
+    "M": DateTime,
+}
+
+_native_types: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def native_types(
+    typeset: VisionsTypeset, with_inference: bool
+) -> Dict[str, Type[VisionsBaseType]]:
+    """The native dtype kinds of which the typeset resolves the type without traversing its graph
+
+    A kind is left out when its type is not in the typeset, or when the type has subtypes in the graph, e.g.
+    floats that are inferred to be integers.
+
+    :param typeset: the typeset
+    :param with_inference: whether the relation graph (True) or the base graph is traversed
+    :return: the visions type by dtype kind
+    """
+    cache = _native_types.setdefault(typeset, {})
+    if with_inference not in cache:
+        graph = typeset.relation_graph if with_inference else typeset.base_graph
+        cache[with_inference] = {
+            kind: visions_type
+            for kind, visions_type in NATIVE_TYPES.items()
+            if visions_type in typeset.types and graph.out_degree(visions_type) == 0
+        }
+    return cache[with_inference]
+
+
+def native_type(
+    series: pd.Series, typeset: VisionsTypeset, with_inference: bool
+) -> Optional[Type[VisionsBaseType]]:
+    """The visions type of a series with a native dtype, without traversing the graph of the typeset
+
+    Empty columns and columns that only hold missing values are Generic in visions, these are left to the
+    graph.
+
+    :param series: the series
+    :param typeset: the typeset
+    :param with_inference: whether type inference is used
+    :return: the type, or None when the graph has to be traversed
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, (np.dtype, pd.DatetimeTZDtype)) or len(series) == 0:
+        return None
+    visions_type = native_types(typeset, with_inference).get(dtype.kind)
+    if visions_type is None:
+        return None
+    if dtype.kind in "fcM" and pd.isna(series.iat[0]) and not series.notna().any():
+        return None
+    return visions_type
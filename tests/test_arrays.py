@@ -0,0 +1,518 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from compressio import (
+    Compress,
+    CompressionPlan,
+    DefaultCompressor,
+    SparseCompressioTypeset,
+    SparseCompressor,
+)
+from compressio.arrays import (
+    BitArray,
+    BlockCompressedArray,
+    DecimalArray,
+    DeltaArray,
+    DeltaDtype,
+    FrameOfReferenceArray,
+    FrameOfReferenceDtype,
+    RunLengthArray,
+)
+
+EPOCH_MS = 1_600_000_000_000
+
+
+@pytest.fixture(params=[FrameOfReferenceArray, DeltaArray])
+def array_type(request):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(np.arange(EPOCH_MS, EPOCH_MS + 1000)),
+        pd.Series(np.arange(1000)[::-1] * 3, dtype=np.uint32),
+        pd.Series([-(2**63), 2**63 - 1, 0]),
+        pd.Series([2**64 - 1, 2**64 - 5], dtype=np.uint64),
+        pd.Series([5, None, 2**40, 3], dtype="Int64"),
+        pd.Series([None, None], dtype="Int16"),
+        pd.Series([], dtype=np.int64),
+    ],
+)
+def test_round_trip(array_type, series):
+    encoded = pd.Series(array_type.encode(series.array))
+    assert encoded.dtype.subtype == series.dtype
+    assert_series_equal(
+        encoded.astype(series.dtype), series, check_index_type=False, check_dtype=True
+    )
+
+
+def test_frame_of_reference_width():
+    series = pd.Series(np.arange(EPOCH_MS, EPOCH_MS + 1000))
+    array = FrameOfReferenceArray.encode(series.array)
+    assert array._offsets.dtype == np.uint16
+    assert array.nbytes < series.nbytes / 3
+
+
+def test_delta_width():
+    series = pd.Series(np.arange(0, 10_000_000, 10))
+    array = DeltaArray.encode(series.array)
+    assert array._deltas.dtype == np.int8
+
+
+def test_dtype_from_string():
+    assert pd.api.types.pandas_dtype("for[int64]") == FrameOfReferenceDtype("int64")
+    assert pd.api.types.pandas_dtype("delta[UInt8]") == DeltaDtype("UInt8")
+
+    series = pd.Series([1, 2, None], dtype="Int32").astype("for[Int32]")
+    assert str(series.dtype) == "for[Int32]"
+    assert series.isna().tolist() == [False, False, True]
+
+
+def test_pandas_operations(array_type):
+    dense = pd.Series([10, None, 12, 11, 10], dtype="Int64")
+    series = pd.Series(array_type.encode(dense.array))
+
+    assert series[2] == 12
+    assert series[1] is pd.NA
+    assert series.iloc[1:3].astype("Int64").tolist() == [pd.NA, 12]
+    assert series.take([4, 0]).astype("Int64").tolist() == [10, 10]
+    assert series.reindex([0, 9]).astype("Int64").tolist() == [10, pd.NA]
+    assert series.min() == 10 and series.max() == 12 and series.sum() == 43
+    assert series.sort_values().astype("Int64").tolist() == [10, 10, 11, 12, pd.NA]
+    assert (series + 1).tolist() == (dense + 1).tolist()
+    assert pd.concat([series, series]).dtype == series.dtype
+    assert series.value_counts()[10] == 2
+
+    with pytest.raises(TypeError):
+        series[0] = 1
+
+
+def test_compressor_encodings():
+    df = pd.DataFrame(
+        {
+            "ids": EPOCH_MS + np.random.RandomState(0).randint(0, 60_000, 1000),
+            "sorted": np.arange(0, 10_000_000, 10_000),
+            "small": np.arange(1000) % 7,
+        }
+    )
+    compress = Compress(
+        compressor=DefaultCompressor(encodings=("frame_of_reference", "delta"))
+    )
+    compressed_df = compress.it(df)
+
+    assert str(compressed_df["ids"].dtype) == "for[int64]"
+    assert str(compressed_df["sorted"].dtype) == "delta[int32]"
+    assert compressed_df["small"].dtype == np.int8
+    for column in df.columns:
+        assert (compressed_df[column].to_numpy() == df[column].to_numpy()).all()
+
+
+def test_encodings_are_opt_in():
+    series = pd.Series(np.arange(EPOCH_MS, EPOCH_MS + 1000))
+    assert Compress().it(series).dtype == np.int64
+
+
+def test_sparse_compressor_encodings():
+    series = pd.Series(
+        [EPOCH_MS + i if i % 10 == 0 else None for i in range(1000)], dtype="Int64"
+    )
+    compress = Compress(compressor=SparseCompressor(encodings=("frame_of_reference",)))
+    compressed = compress.it(series)
+    assert pd.api.types.is_sparse(compressed)
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        DefaultCompressor(encodings=("zigzag",))
+
+
+def test_plan():
+    df = pd.DataFrame({"ids": np.arange(EPOCH_MS, EPOCH_MS + 1000)})
+    compress = Compress(compressor=DefaultCompressor(encodings=("frame_of_reference",)))
+    plan = CompressionPlan.from_json(compress.fit(df).to_json())
+
+    batch = pd.DataFrame({"ids": np.arange(EPOCH_MS + 5000, EPOCH_MS + 5100)})
+    compressed_batch = compress.transform(batch, plan)
+    assert str(compressed_batch["ids"].dtype) == "for[int64]"
+    assert (compressed_batch["ids"].to_numpy() == batch["ids"].to_numpy()).all()
+
+
+@pytest.mark.parametrize("tz", [None, "Europe/Amsterdam"])
+def test_datetime_round_trip(array_type, tz):
+    series = pd.Series(pd.date_range("2021-03-27", periods=5000, freq="min", tz=tz))
+    series = series.sample(frac=1, random_state=0).reset_index(drop=True)
+    series[[3, 17]] = pd.NaT
+
+    encoded = pd.Series(array_type.encode(series.array))
+    assert encoded.dtype.subtype == series.dtype
+    assert encoded[3] is pd.NaT
+    assert encoded[0] == series[0]
+    assert_series_equal(encoded.astype(series.dtype), series)
+
+
+def test_datetime_resolution():
+    series = pd.Series(pd.date_range("2021-03-01", periods=3 * 86400, freq="s"))
+    series = series.sample(frac=1, random_state=0).reset_index(drop=True)
+
+    array = FrameOfReferenceArray.encode(series.array)
+    assert array._step == 10**9
+    assert array._offsets.dtype == np.uint32
+    assert array._offsets.nbytes == series.nbytes / 2
+    assert pd.Series(array).min() == series.min()
+
+    days = pd.Series(pd.date_range("2000-01-01", periods=1000, freq="D"))
+    array = DeltaArray.encode(days.array)
+    assert array._step == 86400 * 10**9
+    assert array._deltas.dtype == np.int8
+
+
+def test_compress_datetime_encodings():
+    series = pd.Series(
+        pd.date_range("2021-03-01", periods=10_000, freq="s", tz="UTC")
+    ).sample(frac=1, random_state=0)
+    series.iloc[5] = pd.NaT
+
+    compress = Compress(
+        typeset=SparseCompressioTypeset(),
+        compressor=SparseCompressor(encodings=("frame_of_reference", "delta")),
+    )
+    compressed = compress.it(series)
+    assert str(compressed.dtype).endswith("[datetime64[ns, UTC]]")
+    assert_series_equal(compressed.astype(series.dtype), series)
+
+    compressed = compress.it(series.sort_values())
+    assert str(compressed.dtype) == "delta[datetime64[ns, UTC]]"
+    assert compressed.array._deltas.dtype == np.int8
+
+
+@pytest.mark.parametrize(
+    "series,decimals,scaled_type",
+    [
+        (pd.Series([19.99, 5.0, np.nan, 0.01]), 2, np.int16),
+        (pd.Series([0.5, 0.25, 1.125], dtype=np.float32), 3, np.int16),
+        (pd.Series([1e6, -3.0]), 0, np.int32),
+        (pd.Series([np.nan, np.nan]), 0, np.int8),
+    ],
+)
+def test_decimal_round_trip(series, decimals, scaled_type):
+    array = DecimalArray.encode(series.array)
+    assert array._decimals == decimals
+    assert array._scaled.dtype == scaled_type
+
+    encoded = pd.Series(array)
+    assert str(encoded.dtype) == f"decimal[{series.dtype}]"
+    assert_series_equal(encoded.astype(series.dtype), series)
+    assert (encoded.isna() == series.isna()).all()
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([0.1234567]),
+        pd.Series([1.0, np.inf]),
+        pd.Series([-0.0, 1.0]),
+        pd.Series([2.0**60]),
+    ],
+)
+def test_decimal_not_encodable(series):
+    with pytest.raises(ValueError):
+        DecimalArray.encode(series.array)
+
+
+def test_compressor_decimal():
+    prices = pd.Series(np.round(np.random.RandomState(0).uniform(0, 500, 1000), 2))
+    df = pd.DataFrame(
+        {
+            "prices": prices,
+            "counts": pd.Series([1.0, np.nan] * 500),
+            "noise": np.random.RandomState(1).rand(1000),
+        }
+    )
+    compress = Compress(compressor=DefaultCompressor(encodings=("decimal",)))
+    compressed_df = compress.it(df)
+
+    assert str(compressed_df["prices"].dtype) == "decimal[float64]"
+    assert str(compressed_df["counts"].dtype) == "Int8"
+    assert compressed_df["noise"].dtype == np.float64
+    assert_series_equal(compressed_df["prices"].astype(np.float64), df["prices"])
+    assert compressed_df["prices"].max() == prices.max()
+
+
+@pytest.fixture
+def runs():
+    return pd.Series(np.repeat([3, 1, 4, 1, 5], [1000, 2000, 5, 300, 10]))
+
+
+def test_run_length_round_trip(runs):
+    array = RunLengthArray.encode(runs.array)
+    assert array.run_count == 5
+    assert array.nbytes < runs.nbytes / 100
+    assert_series_equal(pd.Series(array).astype(runs.dtype), runs)
+    assert array.run_lengths.tolist() == [1000, 2000, 5, 300, 10]
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(["a"] * 5 + [None] * 3 + ["b"] * 2, dtype="category"),
+        pd.Series(["x"] * 3 + [None, None, "y"], dtype=object),
+        pd.Series([1.0, 1.0, np.nan, np.nan, 2.0]),
+        pd.Series([True] * 4 + [False]),
+        pd.Series([1, 1, None, 2], dtype="Int8"),
+        pd.Series(pd.date_range("2020", periods=3, tz="UTC").repeat(3)),
+        pd.Series([], dtype=np.int64),
+    ],
+)
+def test_run_length_dtypes(series):
+    encoded = pd.Series(RunLengthArray.encode(series.array))
+    assert str(encoded.dtype) == f"rle[{series.dtype}]"
+    assert (encoded.isna() == series.isna()).all()
+    assert_series_equal(encoded.astype(series.dtype), series)
+
+
+@pytest.mark.parametrize(
+    "dtype,expected",
+    [
+        ("int8", True),
+        ("float64", True),
+        ("object", True),
+        ("category", True),
+        ("string", True),
+        ("Int16", True),
+        ("boolean", True),
+        ("datetime64[ns, UTC]", True),
+        ("rle[int8]", False),
+        ("Sparse[int8, 0]", False),
+    ],
+)
+def test_run_length_supports(dtype, expected):
+    assert RunLengthArray.supports(pd.api.types.pandas_dtype(dtype)) == expected
+
+
+def test_run_length_supports_nested():
+    pa = pytest.importorskip("pyarrow")
+    assert not RunLengthArray.supports(pd.ArrowDtype(pa.list_(pa.int8())))
+    assert not RunLengthArray.supports(pd.ArrowDtype(pa.struct([("a", pa.int8())])))
+
+
+def test_run_length_operations(runs):
+    series = pd.Series(RunLengthArray.encode(runs.array))
+
+    assert series[3000] == 4
+    assert series.iloc[2999:3003].tolist() == [1, 4, 4, 4]
+    assert series.iloc[2999:3003].array.run_count == 2
+    assert series.iloc[::1000].tolist() == runs.iloc[::1000].tolist()
+    assert series.take([0, 3004, 3305]).tolist() == [3, 4, 5]
+    assert series.reindex([0, 99999]).tolist() == [3, pd.NA]
+    assert series.sum() == runs.sum()
+    assert series.mean() == runs.mean()
+    assert series.min() == 1 and series.max() == 5
+    assert series.groupby(series).size().tolist() == [2300, 1000, 5, 10]
+
+    missing = pd.Series(RunLengthArray.encode(pd.Series([1.0, np.nan, np.nan]).array))
+    assert missing.sum() == 1.0
+    assert np.isnan(missing.sum(skipna=False))
+    assert missing.isna().tolist() == [False, True, True]
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([0.0] * 500 + [-0.0] * 500),
+        pd.Series([0.0] * 500 + [-0.0] * 500, dtype="Float64"),
+        pd.Series([complex(0, 0)] * 500 + [complex(0, -0.0)] * 500),
+    ],
+)
+def test_run_length_signed_zeros(series):
+    array = RunLengthArray.encode(series.array)
+    assert array.run_count == 2
+    decoded = np.asarray(pd.Series(array).astype(series.dtype), dtype=complex)
+    assert (np.signbit(decoded.imag) | np.signbit(decoded.real)).tolist() == [
+        False
+    ] * 500 + [True] * 500
+
+
+def test_run_length_object_types():
+    values = [1] * 400 + [True] * 300 + [1.0] * 300
+    array = RunLengthArray.encode(pd.Series(values, dtype=object).array)
+    assert array.run_count == 3
+    assert [type(value) for value in pd.Series(array)] == list(map(type, values))
+
+
+def test_compressor_run_length_signed_zeros():
+    series = pd.Series([0.0] * 500 + [-0.0] * 500)
+    compressed = Compress(compressor=DefaultCompressor(encodings=("run_length",))).it(
+        series
+    )
+    assert str(compressed.dtype) == "rle[float16]"
+    assert np.signbit(compressed.astype(np.float64)).sum() == 500
+
+
+def test_compressor_run_length(runs):
+    df = pd.DataFrame(
+        {
+            "runs": runs,
+            "status": pd.Series(np.repeat(["ok", "failed", "ok"], [1000, 15, 2300])),
+            "random": np.random.RandomState(0).randint(0, 100, len(runs)),
+        }
+    )
+    compress = Compress(compressor=DefaultCompressor(encodings=("run_length",)))
+    compressed_df = compress.it(df)
+
+    assert str(compressed_df["runs"].dtype) == "rle[int8]"
+    assert str(compressed_df["status"].dtype) == "rle[category]"
+    assert compressed_df["random"].dtype == np.int8
+    for column in df.columns:
+        assert compressed_df[column].tolist() == df[column].tolist()
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([True, False, True] * 7),
+        pd.Series([True, None, False, None] * 5, dtype="boolean"),
+        pd.Series([True, None, False], dtype=object),
+        pd.Series([], dtype=bool),
+    ],
+)
+def test_bits_round_trip(series):
+    array = BitArray.encode(series.array)
+    assert array.nbytes <= 2 * (len(series) + 7) // 8
+
+    encoded = pd.Series(array)
+    expected = series.astype("boolean") if series.dtype == object else series
+    assert str(encoded.dtype) == f"bits[{expected.dtype}]"
+    assert_series_equal(encoded.astype(expected.dtype), expected)
+    assert (encoded.isna() == series.isna()).all()
+
+
+def test_bits_operations():
+    flags = pd.Series([True, False, None, None, None, None, True, False] * 1000)
+    series = pd.Series(BitArray.encode(flags.array))
+    assert series.nbytes == flags.nbytes / 32
+
+    assert series[0] is True and series[2] is pd.NA
+    assert series.any() and not series.all()
+    assert series.sum() == 2000 and series.mean() == 0.5
+    assert series.iloc[6:10].tolist() == [True, False, True, False]
+    assert series[series.fillna(False).astype(bool)].sum() == 2000
+
+    dense = pd.Series([True, False, True])
+    packed = pd.Series(BitArray.encode(dense.array))
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert df[packed]["x"].tolist() == [1, 3]
+    assert packed[packed].tolist() == [True, True]
+    assert packed.all() == dense.all() and packed.min() == dense.min()
+    assert packed.reindex([0, 5]).tolist() == [True, pd.NA]
+
+    with pytest.raises(TypeError):
+        BitArray.encode(pd.Series([True, 1], dtype=object).array)
+
+
+def test_compressor_bits():
+    flags = [True, False, None, None, None, None, True, False] * 1000
+    df = pd.DataFrame(
+        {
+            "flags": pd.Series(flags),
+            "dense": np.arange(8000) % 3 == 0,
+            "mostly_missing": pd.Series([None] * 7990 + [True] * 10, dtype="boolean"),
+        }
+    )
+    compressed_df = Compress().it(df)
+    assert str(compressed_df["flags"].dtype) == "bits[boolean]"
+    assert str(compressed_df["dense"].dtype) == "bits[bool]"
+    assert compressed_df.memory_usage(index=False).sum() < 3 * 2000
+
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor()
+    )
+    compressed_df = compress.it(df)
+    assert str(compressed_df["flags"].dtype) == "bits[boolean]"
+    assert pd.api.types.is_sparse(compressed_df["mostly_missing"])
+    for column in df.columns:
+        assert compressed_df[column].astype(object).fillna("NA").tolist() == (
+            df[column].astype(object).fillna("NA").tolist()
+        )
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(np.arange(10_000) % 100, dtype=np.int8),
+        pd.Series([1.5, None, 3.0] * 1000),
+        pd.Series([1, None] * 1000, dtype="Int16"),
+        pd.Series(pd.date_range("2021-03-27", periods=3000, freq="s", tz="UTC")),
+        pd.Series(pd.to_timedelta([1, None], unit="s")),
+        pd.Series([True, False] * 10),
+        pd.Series([], dtype=np.int64),
+    ],
+)
+def test_blocks_round_trip(series):
+    array = BlockCompressedArray.encode(series.array, block_size=1000)
+    encoded = pd.Series(array)
+    assert str(encoded.dtype) == f"blocks[{series.dtype}, zlib]"
+    assert_series_equal(encoded.astype(series.dtype), series)
+    assert (encoded.isna() == series.isna()).all()
+    if len(series) > 0:
+        assert (
+            encoded.iloc[-1] is series.iloc[-1] or encoded.iloc[-1] == series.iloc[-1]
+        )
+        assert_series_equal(
+            encoded.iloc[999:2001].astype(series.dtype), series.iloc[999:2001]
+        )
+
+
+def test_blocks_missing_positions():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.integers(0, 10, 1003), dtype="Int64")
+    series[rng.random(1003) < 0.3] = None
+    array = BlockCompressedArray.encode(series.array, block_size=100)
+    for position in [0, 1, 7, 8, 9, 99, 100, 555, 1000, 1002]:
+        assert (
+            array[position] is pd.NA
+            if series.isna()[position]
+            else array[position] == series[position]
+        )
+    for start, stop in [(0, 1), (3, 5), (7, 17), (8, 16), (95, 333), (1000, 1003)]:
+        assert_series_equal(
+            pd.Series(array[start:stop]).astype("Int64"),
+            series.iloc[start:stop].reset_index(drop=True),
+        )
+
+
+def test_blocks_dtype():
+    dtype = pd.api.types.pandas_dtype("blocks[Int8, lzma]")
+    assert dtype.subtype == "Int8" and dtype.codec == "lzma"
+
+    series = pd.Series([1, None, 3], dtype="blocks[Int8, lzma]")
+    assert series.dtype == dtype
+    assert series.sum() == 4
+
+    with pytest.raises(ValueError):
+        BlockCompressedArray.encode(np.arange(3), codec="snappy")
+
+
+def test_compressor_cold_columns():
+    df = pd.DataFrame(
+        {
+            "audit_ids": np.arange(100_000) // 3,
+            "hot": np.arange(100_000) // 3,
+        }
+    )
+    compress = Compress(compressor=DefaultCompressor(cold_columns=["audit_ids"]))
+    compressed_df = compress.it(df)
+
+    assert str(compressed_df["audit_ids"].dtype) == "blocks[uint16, zlib]"
+    assert compressed_df["hot"].dtype == np.uint16
+    assert compressed_df["audit_ids"].nbytes < compressed_df["hot"].nbytes / 4
+    assert (compressed_df["audit_ids"].to_numpy() == df["audit_ids"].to_numpy()).all()
+
+    plan = CompressionPlan.from_json(compress.fit(df).to_json())
+    compressed_batch = compress.transform(df.iloc[:10], plan)
+    assert compressed_batch["audit_ids"].dtype == compressed_df["audit_ids"].dtype
+
+    with pytest.raises(ValueError):
+        DefaultCompressor(cold_columns=["audit_ids"], codec="snappy")
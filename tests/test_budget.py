@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from compressio import BudgetPlanner, Compress
+from compressio.budget import Candidate, access_cost, choose_candidates
+from compressio.size import estimate_size
+
+
+@pytest.fixture
+def df():
+    random = np.random.RandomState(0)
+    size = 10_000
+    return pd.DataFrame(
+        {
+            "ids": np.arange(10**9, 10**9 + size),
+            "prices": np.round(random.lognormal(3, 1, size), 2),
+            "zeros": np.where(
+                random.rand(size) < 0.99, 0, random.randint(1, 100, size)
+            ),
+            "flags": random.rand(size) < 0.5,
+        }
+    )
+
+
+def test_no_budget_cheapest(df):
+    planner = BudgetPlanner()
+    result = planner.fit_transform(df)
+
+    assert planner.choices == {
+        "ids": "narrow",
+        "prices": "original",
+        "zeros": "narrow",
+        "flags": "original",
+    }
+    assert all(access_cost(dtype) == 0 for dtype in result.dtypes)
+
+
+@pytest.mark.parametrize("budget", [140_000, "0.1 MB", 60_000])
+def test_budget_met(df, budget):
+    planner = BudgetPlanner()
+    result = planner.fit_transform(df, budget=budget)
+
+    limit = budget if isinstance(budget, int) else 100_000
+    assert estimate_size(result) <= limit
+    assert_frame_equal(
+        result.apply(lambda series: series.to_numpy()).astype(df.dtypes),
+        df,
+    )
+
+
+def test_ratio(df):
+    planner = BudgetPlanner()
+    result = planner.fit_transform(df, ratio=5)
+    assert estimate_size(df) / estimate_size(result) >= 5
+
+
+def test_access_frequency(df):
+    planner = BudgetPlanner()
+    planner.fit_transform(df, budget=140_000)
+    assert planner.choices["prices"] != "original"
+
+    # Frequently read columns are the last to get an expensive representation
+    planner.fit_transform(df, budget=140_000, access_frequency={"prices": 100})
+    assert planner.choices["prices"] == "original"
+
+
+def test_budget_unreachable(df):
+    with pytest.raises(ValueError, match="does not fit the budget"):
+        BudgetPlanner().fit_transform(df, budget=1_000)
+
+
+def test_budget_or_ratio(df):
+    with pytest.raises(ValueError):
+        BudgetPlanner().fit_transform(df, budget=1_000, ratio=2)
+
+
+def test_plan_reusable(df):
+    planner = BudgetPlanner()
+    result = planner.fit_transform(df, budget=60_000)
+    assert_frame_equal(Compress().transform(df, planner.plan), result)
+
+
+def test_candidates_measured(df):
+    # The candidates only keep their measurements, the chosen representation is rebuilt
+    planner = BudgetPlanner()
+    candidates = planner.evaluate(df)
+    for options in candidates.values():
+        for candidate in options:
+            assert not any(
+                isinstance(value, (pd.Series, pd.api.extensions.ExtensionArray))
+                for value in vars(candidate).values()
+            )
+
+    result = planner.fit_transform(df, budget=60_000)
+    chosen = {
+        col: {candidate.name: candidate for candidate in options}[planner.choices[col]]
+        for col, options in candidates.items()
+    }
+    for col, candidate in chosen.items():
+        assert result[col].dtype == candidate.dtype
+        assert estimate_size(result[col], index=False) == candidate.nbytes
+
+
+def test_budget_lists(df):
+    pytest.importorskip("pyarrow")
+    df["lists"] = pd.Series([[1, 2, 3], [4], None] * (len(df) // 3) + [[5]])
+    planner = BudgetPlanner()
+    result = planner.fit_transform(df)
+    assert str(result["lists"].dtype) == "list<item: int8>[pyarrow]"
+
+
+def test_summary(df):
+    summary = BudgetPlanner(codec=None).summary(df)
+    assert set(summary["column"]) == set(df.columns)
+    assert not summary["candidate"].str.contains("zlib").any()
+    # Per column, more expensive candidates are smaller
+    for _, candidates in summary.groupby("column"):
+        assert candidates["bytes"].is_monotonic_decreasing
+        assert candidates["cost"].is_monotonic_increasing
+
+
+def test_choose_candidates():
+    def candidate(name, nbytes, cost):
+        return Candidate(name, np.dtype("int64"), None, nbytes, cost)
+
+    candidates = {
+        "a": [candidate("dense", 100, 0), candidate("small", 10, 10)],
+        "b": [candidate("dense", 100, 0), candidate("small", 50, 1)],
+    }
+    chosen = choose_candidates(candidates, 160, {})
+    assert {column: c.name for column, c in chosen.items()} == {
+        "a": "dense",
+        "b": "small",
+    }
+    chosen = choose_candidates(candidates, 160, {"b": 100})
+    assert chosen["a"].name == "small"
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from compressio import Compress, SparseCompressioTypeset, SparseCompressor
+from compressio.concat import concat_series
+
+
+def test_concat_integers_widened():
+    pieces = [
+        pd.Series([-1, 2, 3], dtype=np.int8),
+        pd.Series([1000, 2], dtype=np.int16),
+        pd.Series([np.iinfo(np.int16).max + 1], dtype=np.uint16),
+    ]
+    result = concat_series(pieces)
+    assert result.dtype == np.int32
+    assert result.tolist() == [-1, 2, 3, 1000, 2, np.iinfo(np.int16).max + 1]
+
+
+def test_concat_integers_missing():
+    pieces = [
+        pd.Series([1, 2, 3], dtype=np.int8),
+        pd.Series([np.nan, np.nan], dtype=np.float16),
+        pd.Series([300, None], dtype="Int16"),
+    ]
+    result = concat_series(pieces)
+    assert str(result.dtype) == "Int16"
+    assert result.isna().sum() == 3
+
+
+def test_concat_bits():
+    pieces = [
+        Compress().it(pd.Series([True, False] * 100)),
+        Compress().it(pd.Series([True, None] * 100)),
+        pd.Series([None] * 3),
+    ]
+    result = concat_series(pieces)
+    assert str(result.dtype) == "bits[boolean]"
+    assert result.isna().sum() == 103
+    assert result.sum() == 200
+
+
+def test_concat_floats():
+    pieces = [
+        pd.Series([1.5], dtype=np.float16),
+        pd.Series([1e10], dtype=np.float32),
+        pd.Series([3], dtype=np.int8),
+    ]
+    result = concat_series(pieces)
+    assert result.dtype == np.float32
+    assert result.tolist() == [1.5, 1e10, 3.0]
+
+
+def test_concat_categories_unioned():
+    pieces = [
+        pd.Series(["a", "b", "a"], dtype="category"),
+        pd.Series(["c", "a"], dtype="category"),
+        pd.Series([np.nan]),
+    ]
+    result = concat_series(pieces)
+    assert result.dtype == "category"
+    assert set(result.cat.categories) == {"a", "b", "c"}
+    assert result.tolist()[:5] == ["a", "b", "a", "c", "a"]
+    assert result.isna().sum() == 1
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "small": [1] * 500 + [1000] * 500,
+            "floats": [0.5] * 1000,
+            "strings": ["a", "b"] * 250 + ["c", "d"] * 250,
+        }
+    )
+
+
+def test_iter_chunks(df):
+    chunks = (df.iloc[i : i + 100].copy() for i in range(0, len(df), 100))
+    result = Compress().iter_chunks(chunks)
+
+    assert result["small"].dtype == np.int16
+    assert result["floats"].dtype == np.float16
+    assert result["strings"].dtype == "category"
+    assert_frame_equal(result, df, check_dtype=False, check_categorical=False)
+
+
+def test_read_csv(df, tmp_path):
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    result = Compress().read_csv(path, chunksize=300)
+    assert_series_equal(result["small"], df["small"], check_dtype=False)
+    assert result["small"].dtype == np.int16
+    assert len(result) == len(df)
+
+
+def test_read_parquet(df, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path)
+
+    result = Compress().read_parquet(path, batch_size=300)
+    assert list(result.index) == list(range(len(df)))
+    assert result["strings"].dtype == "category"
+    assert_frame_equal(result, df, check_dtype=False, check_categorical=False)
+
+
+def test_concat_arrow_strings():
+    pytest.importorskip("pyarrow")
+    pieces = [
+        pd.Series(["a", "b"], dtype="category"),
+        pd.Series(["c", None], dtype="string[pyarrow]"),
+    ]
+    result = concat_series(pieces)
+    assert str(result.dtype) == "string"
+    assert result.tolist()[:3] == ["a", "b", "c"]
+    assert result.isna().sum() == 1
+
+
+def test_append_widens_affected_columns():
+    compress = Compress()
+    data = compress.it(
+        pd.DataFrame(
+            {
+                "small": np.arange(100),
+                "large": np.arange(100) * 1000,
+                "floats": np.linspace(0, 1, 100).astype(np.float16).astype(float),
+            }
+        )
+    )
+    assert data["small"].dtype == np.int8
+
+    new = pd.DataFrame({"small": [200, -1], "large": [5, 6], "floats": [0.5, np.nan]})
+    result = compress.append(data, new, ignore_index=True)
+
+    # 200 and -1 fit neither int8 nor uint8
+    assert result["small"].dtype == np.int16
+    assert result["large"].dtype == data["large"].dtype
+    assert result["floats"].dtype == np.float16
+    assert result["small"].tolist()[-2:] == [200, -1]
+    assert len(result) == 102
+
+
+def test_append_missing_integers():
+    compress = Compress()
+    data = compress.it(pd.Series(np.arange(10)))
+    result = compress.append(data, pd.Series([1.0, np.nan]))
+    assert str(result.dtype) == "Int8"
+    assert result.isna().sum() == 1
+
+
+def test_append_categories_extended():
+    compress = Compress()
+    data = compress.it(pd.Series(["a", "b"] * 50))
+    codes = data.cat.codes.copy()
+
+    result = compress.append(data, pd.Series(["c", "a", None]))
+    assert result.cat.categories.tolist() == ["a", "b", "c"]
+    # Existing values keep their codes
+    assert (result.cat.codes.iloc[:100].to_numpy() == codes.to_numpy()).all()
+    assert result.tolist()[-3:-1] == ["c", "a"]
+    assert result.isna().sum() == 1
+
+
+def test_append_sparse_stays_sparse():
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor()
+    )
+    data = compress.it(pd.Series([0] * 1000 + [5, 7]))
+    assert str(data.dtype) == "Sparse[int8, 0]"
+
+    result = compress.append(data, pd.Series([0, 0, 1000]))
+    assert str(result.dtype) == "Sparse[int16, 0]"
+    assert result.sparse.npoints == 3
+    assert result.sum() == 1012
+
+
+def test_append_reconciles_other_columns():
+    compress = Compress()
+    data = compress.it(pd.Series([True, False] * 50))
+    result = compress.append(data, pd.Series([True, None]))
+    assert str(result.dtype) == "bits[boolean]"
+    assert result.isna().sum() == 1
+
+
+def test_append_columns_differ():
+    compress = Compress()
+    data = compress.it(pd.DataFrame({"a": [1, 2]}))
+    with pytest.raises(ValueError):
+        compress.append(data, pd.DataFrame({"b": [3]}))
+
+
+def test_concat_lists_widened():
+    pytest.importorskip("pyarrow")
+    compress = Compress()
+    chunks = [
+        pd.DataFrame({"a": pd.Series([[1, 2], [3], None] * 100)}),
+        pd.DataFrame({"a": pd.Series([[100_000, 1]] * 10)}),
+    ]
+    result = compress.iter_chunks(chunks, ignore_index=True)
+    assert str(result["a"].dtype) == "list<item: int32>[pyarrow]"
+    assert result["a"].iloc[0] == [1, 2]
+    assert result["a"].iloc[-1] == [100_000, 1]
+    assert result["a"].isna().sum() == 100
@@ -2,12 +2,20 @@ import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_series_equal
+from visions import Object
 
+from compressio import DefaultCompressor, SparseCompressor
+from compressio.arrays import ENCODINGS
 from compressio.compression_algorithms import (
     compress_complex,
     compress_float,
     compress_integer,
+    compress_integral_float,
+    compress_list,
+    compress_object,
+    compress_string,
 )
+from compressio.compression_algorithms.type_compressions import arrow_string_candidates
 
 
 @pytest.mark.parametrize(
@@ -92,6 +100,55 @@ from compressio.compression_algorithms import (
             np.float64,
             np.float16,
         ),
+        # In range of float16, but not representable
+        (
+            pd.Series([0.1, 0.2], dtype=np.float64),
+            compress_float,
+            np.float64,
+            np.float64,
+        ),
+        (
+            pd.Series([0.5, 1e6], dtype=np.float64),
+            compress_float,
+            np.float64,
+            np.float32,
+        ),
+        (
+            pd.Series([0.1, 0.2], dtype=np.float32),
+            compress_float,
+            np.float32,
+            np.float32,
+        ),
+        (
+            pd.Series([1.0, np.nan, 300.0], dtype=np.float64),
+            compress_integral_float,
+            np.float64,
+            pd.Int16Dtype,
+        ),
+        (
+            pd.Series([1.0, 2.0], dtype=np.float32),
+            compress_integral_float,
+            np.float32,
+            np.int8,
+        ),
+        (
+            pd.Series([1.0, 2.5], dtype=np.float64),
+            compress_integral_float,
+            np.float64,
+            np.float64,
+        ),
+        (
+            pd.Series([1.0, -0.0], dtype=np.float64),
+            compress_integral_float,
+            np.float64,
+            np.float64,
+        ),
+        (
+            pd.Series([1.0, np.inf], dtype=np.float64),
+            compress_integral_float,
+            np.float64,
+            np.float64,
+        ),
     ],
 )
 def test_compress_series(series, func, before, expected):
@@ -102,3 +159,120 @@ def test_compress_series(series, func, before, expected):
     )
 
     assert_series_equal(series, compressed_series, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "series,max_unique_ratio,expected",
+    [
+        (pd.Series(["gold", "silver", "bronze"] * 1000), 0.5, "category"),
+        (pd.Series([f"id-{i}" for i in range(10_000)]), 0.5, "object"),
+        (pd.Series([f"id-{i % 3000}" for i in range(10_000)]), 0.5, "category"),
+        (pd.Series([f"id-{i % 3000}" for i in range(10_000)]), 0.1, "object"),
+        (pd.Series([None] * 100, dtype=object), 0.5, "category"),
+    ],
+)
+def test_compress_object_cardinality(series, max_unique_ratio, expected):
+    compressed_series = compress_object(series, max_unique_ratio=max_unique_ratio)
+    assert str(compressed_series.dtype) == expected
+    assert_series_equal(series, compressed_series.astype(object), check_dtype=False)
+
+
+def test_compressor_max_unique_ratio():
+    series = pd.Series([f"id-{i % 3000}" for i in range(10_000)])
+    assert DefaultCompressor().compress(series, Object).dtype == "category"
+    assert (
+        DefaultCompressor(max_unique_ratio=0.1).compress(series, Object).dtype == object
+    )
+
+
+@pytest.mark.parametrize(
+    "series,expected",
+    [
+        (pd.Series([f"event {i} happened" for i in range(10_000)]), "string"),
+        (pd.Series([f"event {i}" for i in range(10_000)] + [None]), "string"),
+        (pd.Series(["gold", "silver", "bronze"] * 1000), "category"),
+        (pd.Series([i if i % 2 else str(i) for i in range(10_000)]), "object"),
+    ],
+)
+def test_compress_string(series, expected):
+    pytest.importorskip("pyarrow")
+    compressed_series = compress_string(series)
+    assert str(compressed_series.dtype) == expected
+
+    def values(s):
+        return [None if pd.isna(value) else value for value in s]
+
+    assert values(compressed_series) == values(series)
+
+
+def test_arrow_dictionary_underestimated():
+    pytest.importorskip("pyarrow")
+    # A sample of a skewed column misses most of the rare values
+    values = [f"value {i}" for i in range(10)] * 1000 + [
+        f"rare {i}" for i in range(250)
+    ]
+    series = pd.Series(values)
+    candidates = arrow_string_candidates(series, unique_count=80)
+    dictionary = candidates[-1]
+    assert (
+        str(dictionary.dtype)
+        == "dictionary<values=string, indices=int16, ordered=0>[pyarrow]"
+    )
+    assert dictionary.tolist() == values
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        ([[1, 2, 3], [4], None, [], [500, 6]], "list<item: int16>[pyarrow]"),
+        ([[1.5, 2.0], [0.25], None], "list<item: float>[pyarrow]"),
+        ([[0.1], [2.0]], "list<item: double>[pyarrow]"),
+        ([["a", "b"], ["c"]], "list<item: string>[pyarrow]"),
+        ([[[1]], [[2, 3]]], "object"),
+        ([{"a": 1}, {"b": 2}], "object"),
+        ([(1, 2), (3,)], "object"),
+        ([[1, 2], 3], "object"),
+    ],
+)
+def test_compress_list(values, expected):
+    pytest.importorskip("pyarrow")
+    series = pd.Series(values * 1000)
+    compressed_series = compress_list(series)
+    assert str(compressed_series.dtype) == expected
+
+    def values_of(s):
+        return [None if value is None or value is pd.NA else value for value in s]
+
+    assert values_of(compressed_series) == values_of(series)
+
+
+def test_compress_list_nan():
+    pytest.importorskip("pyarrow")
+    series = pd.Series([[1.5, np.nan], None, [None, 0.25], np.nan] * 1000)
+    compressed_series = compress_list(series)
+    assert str(compressed_series.dtype) == "list<item: float>[pyarrow]"
+
+    first, missing, with_null, nan_row = compressed_series[:4]
+    assert first[0] == 1.5 and np.isnan(first[1])
+    assert missing is None or missing is pd.NA
+    assert with_null[0] is None and with_null[1] == 0.25
+    assert nan_row is None or nan_row is pd.NA
+
+
+def test_compressor_lists():
+    pytest.importorskip("pyarrow")
+    series = pd.Series([[1, 2, 3], [4], None] * 1000)
+    compressed_series = DefaultCompressor().compress(series, Object)
+    assert str(compressed_series.dtype) == "list<item: int8>[pyarrow]"
+
+
+@pytest.mark.parametrize("compressor_type", [DefaultCompressor, SparseCompressor])
+def test_compressor_lists_encodings(compressor_type):
+    # Encodings do not apply to Arrow lists, which are left as they are
+    pytest.importorskip("pyarrow")
+    series = pd.Series([[1, 2, 3], [4], None] * 1000)
+    compressor = compressor_type(encodings=tuple(ENCODINGS))
+    compressed_series = compressor.compress(series, Object)
+    assert str(compressed_series.dtype) == "list<item: int8>[pyarrow]"
+    assert compressed_series.tolist()[:2] == [[1, 2, 3], [4]]
+    assert compressed_series.isna().sum() == 1000
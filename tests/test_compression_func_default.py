@@ -22,7 +22,7 @@ bool_dtype = "boolean" if int(pd.__version__.split(".")[0]) >= 1 else "Bool"
         (
             pd.Series([True, False, None, None, None, None, True, False] * 1000),
             np.object,
-            bool_dtype,
+            f"bits[{bool_dtype}]",
         ),
     ],
 )
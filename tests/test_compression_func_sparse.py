@@ -6,6 +6,7 @@ import pytest
 from visions import StandardSet
 
 from compressio.compress import compress_func
+from compressio.compression_algorithms import compress_sparse
 from compressio.type_compressor import SparseCompressor
 
 nan_value = pd.NA if hasattr(pd, "NA") else np.nan
@@ -96,3 +97,51 @@ def test_compress_series(series, before, expected, inference):
         inplace=False,
     )
     assert compressed_series.dtype == expected
+
+
+@pytest.mark.parametrize(
+    "series,expected",
+    [
+        (pd.Series([0] * 9500 + list(range(1, 501))), pd.SparseDtype(np.int16, 0)),
+        (pd.Series([0.0] * 9500 + [1.5] * 500), pd.SparseDtype(np.float16, 0.0)),
+        (pd.Series([False] * 9900 + [True] * 100), pd.SparseDtype(bool, False)),
+    ],
+)
+def test_compress_most_frequent(series, expected):
+    series.index = series.index + 10
+    series.name = "values"
+    compressed_series = compress_func(
+        series,
+        typeset=StandardSet(),
+        compressor=SparseCompressor(),
+        with_inference=False,
+        inplace=False,
+    )
+    assert compressed_series.dtype == expected
+    assert compressed_series.name == series.name
+    assert (compressed_series.index == series.index).all()
+    assert (compressed_series.astype(series.dtype) == series).all()
+
+
+def test_compress_most_frequent_exact():
+    series = pd.Series([0.0] * 900 + [-0.0] * 100 + [np.nan, 1.0])
+    compressed_series = compress_func(
+        series,
+        typeset=StandardSet(),
+        compressor=SparseCompressor(),
+        with_inference=False,
+        inplace=False,
+    )
+    assert pd.api.types.is_sparse(compressed_series)
+    dense = compressed_series.sparse.to_dense()
+    assert np.array_equal(np.signbit(dense), np.signbit(series))
+    assert dense.isna().sum() == 1
+
+    mixed = pd.Series([1] * 900 + [1.0, True] * 50, dtype=object)
+    compressed = compress_sparse(mixed)
+    assert compressed.dtype == pd.SparseDtype(object, 1)
+
+    strings = pd.Series([""] * 6000 + [f"id{i}" for i in range(4000)])
+    assert compress_sparse(strings).dtype == pd.SparseDtype(object, "")
+    assert compress_sparse(strings, missing_only=True).dtype == object
+    assert [type(value) for value in compressed] == [type(value) for value in mixed]
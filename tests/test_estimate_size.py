@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from compressio.size import estimate_size
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pd.Series(np.arange(1000)),
+        pd.Series([1, None] * 100, dtype="Int16"),
+        pd.Series([1.0, np.nan] * 100, index=[f"row{i}" for i in range(200)]),
+        pd.Series(["a", "bb", None] * 100),
+        pd.DataFrame({"a": np.arange(10), "b": ["x"] * 10}),
+    ],
+)
+def test_estimate_size_matches_pandas(data):
+    expected = data.memory_usage(deep=True)
+    if isinstance(data, pd.DataFrame):
+        expected = expected.sum()
+
+    assert estimate_size(data) == expected
+    assert estimate_size(data, exact=True) == expected
+
+
+def test_estimate_size_object_sample():
+    data = pd.Series([f"value {i}" for i in range(100_000)])
+    expected = data.memory_usage(deep=True)
+    assert abs(estimate_size(data) - expected) / expected < 0.01
+    assert estimate_size(data, exact=True) == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (pd.Series(["a", "b"] * 100, dtype="category"), 200 + 2 * 8 + 2 * 50),
+        (pd.Series(pd.arrays.SparseArray([0] * 98 + [1, 2], fill_value=0)), 16 + 8),
+    ],
+)
+def test_estimate_size_buffers(data, expected):
+    assert estimate_size(data, index=False) == expected
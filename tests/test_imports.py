@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+import compressio
+
+HEAVY_MODULES = ["pandas", "visions", "networkx", "pint", "tqdm"]
+
+
+def loaded_modules(statement: str):
+    """The heavy modules that are loaded after running the statement in a fresh interpreter"""
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(filter(None, output.strip().split(",")))
+
+
+def test_import_is_lazy():
+    assert loaded_modules("import compressio") == set()
+
+
+@pytest.mark.parametrize("name", ["Compress", "Partitions", "BudgetPlanner"])
+def test_compress_without_diagnostics(name):
+    # Units and progress bars are loaded when a size is reported or a frame is compressed
+    loaded = loaded_modules(f"from compressio import {name}")
+    assert "pint" not in loaded
+    assert "tqdm" not in loaded
+
+
+def test_public_names():
+    for name in compressio.__all__:
+        assert getattr(compressio, name) is not None
+    assert set(compressio.__all__) <= set(dir(compressio))
+
+    with pytest.raises(AttributeError):
+        compressio.missing
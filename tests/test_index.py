@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_index_equal
+
+from compressio import Compress, load, save
+from compressio.size import index_size
+
+
+@pytest.fixture
+def df():
+    random = np.random.RandomState(0)
+    size = 10_000
+    index = pd.Index(random.choice(["alpha", "beta", "gamma"], size), name="key")
+    return pd.DataFrame({"values": np.arange(size)}, index=index)
+
+
+def test_index_opt_in(df):
+    assert Compress().it(df).index.dtype == object
+    compressed = Compress(index=True).it(df)
+    assert isinstance(compressed.index, pd.CategoricalIndex)
+    assert index_size(compressed.index) < index_size(df.index)
+    assert_index_equal(compressed.index.astype(object), df.index)
+    assert len(compressed.loc["beta"]) == (df.index == "beta").sum()
+
+
+def test_index_series_untouched(df):
+    series = df["values"]
+    compressed = Compress(index=True).it(series)
+    assert isinstance(compressed.index, pd.CategoricalIndex)
+    assert series.index.dtype == object
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.RangeIndex(100),
+        pd.Index(np.arange(100) * 7),
+        pd.date_range("2020-01-01", periods=100),
+        pd.Index([f"id {i}" for i in range(100)]),
+    ],
+)
+def test_index_kept(index):
+    # Only representations that are smaller are kept
+    data = pd.DataFrame({"values": np.arange(100)}, index=index)
+    compressed = Compress(index=True).it(data)
+    assert index_size(compressed.index) <= index_size(index)
+    assert_index_equal(compressed.index.astype(index.dtype), index)
+
+
+def test_multi_index():
+    index = pd.MultiIndex.from_product(
+        [["a", "b"], np.arange(10_000)], names=["letter", "number"]
+    )
+    data = pd.DataFrame({"values": np.arange(len(index))}, index=index).iloc[:10]
+    compressed = Compress(index=True).it(data)
+    # The levels that are not used after filtering are dropped, which narrows the codes
+    assert len(compressed.index.levels[1]) == 10
+    assert compressed.index.codes[1].dtype == np.int8
+    assert compressed.index.equals(data.index)
+    assert compressed.index.names == data.index.names
+
+
+def test_index_plan_and_storage(df, tmp_path):
+    compress = Compress(index=True)
+    fitted = compress.fit_transform(df)
+    assert isinstance(fitted.index, pd.CategoricalIndex)
+    assert_frame_equal(compress.transform(df), fitted)
+
+    save(fitted, tmp_path / "data.cio")
+    assert_frame_equal(load(tmp_path / "data.cio"), fitted)
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from compressio import (
+    Compress,
+    LazyFrame,
+    SparseCompressioTypeset,
+    SparseCompressor,
+)
+
+
+@pytest.fixture
+def df():
+    size = 10_000
+    return pd.DataFrame(
+        {
+            "small": np.arange(size) % 7,
+            "colors": ["red", "green"] * (size // 2),
+            "noise": np.random.RandomState(0).rand(size),
+            "zeros": [0] * (size - 10) + list(range(10)),
+        },
+        index=pd.RangeIndex(5, 5 + size),
+    )
+
+
+@pytest.mark.parametrize("codec", [None, "zlib", "lzma"])
+def test_lazy_columns(df, codec):
+    compress = Compress()
+    lazy = compress.it(df, lazy=True, codec=codec)
+    compressed = compress.it(df)
+
+    assert isinstance(lazy, LazyFrame)
+    assert lazy.shape == df.shape
+    assert list(lazy.columns) == list(df.columns)
+    assert (lazy.dtypes == compressed.dtypes).all()
+    assert_series_equal(lazy["small"], compressed["small"])
+    assert_frame_equal(lazy[["colors", "noise"]], compressed[["colors", "noise"]])
+    assert_frame_equal(lazy.to_pandas(), compressed)
+    if codec is not None:
+        assert lazy.nbytes < compressed.memory_usage(index=False, deep=True).sum()
+
+
+@pytest.mark.parametrize("codec", [None, "zlib"])
+def test_lazy_objects(codec):
+    df = pd.DataFrame(
+        {
+            "mixed": pd.Series([1, "a", None, 2.5] * 250, dtype=object),
+            "dicts": [{"a": 1}, {}, None, {"b": [1, 2]}] * 250,
+        }
+    )
+    compress = Compress()
+    lazy = compress.it(df, lazy=True, codec=codec)
+    assert_frame_equal(lazy.to_pandas(), compress.it(df))
+    assert [type(value) for value in lazy["mixed"].cat.categories] == [int, float, str]
+    assert list(lazy["dicts"][:4]) == [{"a": 1}, {}, None, {"b": [1, 2]}]
+
+
+def test_lazy_cache(df):
+    compress = Compress()
+    lazy = LazyFrame.from_frame(compress.it(df), codec="zlib", cache_size=2)
+    first = lazy["small"]
+    assert lazy["small"] is first
+
+    lazy["colors"]
+    lazy["small"]
+    lazy["noise"]
+    assert list(lazy._cache) == ["small", "noise"]
+    assert lazy["colors"] is not None and "small" not in lazy._cache
+
+    with pytest.raises(KeyError):
+        lazy["missing"]
+
+
+def test_lazy_dense(df):
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor()
+    )
+    compressed = compress.it(df)
+    assert pd.api.types.is_sparse(compressed["zeros"])
+
+    lazy = LazyFrame.from_frame(compressed, dense=True)
+    assert lazy["zeros"].dtype == np.int8
+    assert lazy["zeros"].tolist() == df["zeros"].tolist()
+
+    lazy = compress.it(df, lazy=True, dense=True, cache_size=1)
+    assert lazy.dense and lazy.cache_size == 1
+    assert lazy["zeros"].dtype == np.int8
+
+
+def test_lazy_arguments(df):
+    with pytest.raises(TypeError):
+        Compress().it(df["small"], lazy=True)
+    with pytest.raises(ValueError):
+        Compress().it(df, codec="zlib")
+    with pytest.raises(ValueError):
+        Compress().it(df, dense=True)
+    with pytest.raises(ValueError):
+        Compress().it(df, lazy=True, codec="snappy")
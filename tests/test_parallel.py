@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from compressio import Compress, SparseCompressor
+from compressio.parallel import resolve_n_jobs
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "integers": pd.Series(np.arange(1000), dtype=np.int64),
+            "floats": pd.Series(np.linspace(0, 1, 1000), dtype=np.float64),
+            "strings": pd.Series(["a", "b", "c", "d"] * 250, dtype=object),
+            "missing": pd.Series([np.nan] * 990 + [1.0] * 10),
+            "complex": pd.Series([complex(1, 2)] * 1000),
+        }
+    )
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_matches_serial(df, backend):
+    serial = Compress(compressor=SparseCompressor()).it(df)
+    parallel = Compress(compressor=SparseCompressor(), n_jobs=2, backend=backend).it(df)
+
+    assert list(parallel.columns) == list(df.columns)
+    assert_frame_equal(serial, parallel)
+
+
+def test_parallel_inplace(df):
+    compressed_df = Compress(n_jobs=2).it(df, inplace=True)
+    assert id(df) == id(compressed_df)
+
+
+def test_unknown_backend(df):
+    with pytest.raises(ValueError):
+        Compress(n_jobs=2, backend="gpu").it(df)
+
+
+@pytest.mark.parametrize("n_jobs,expected", [(None, 1), (1, 1), (3, 3)])
+def test_resolve_n_jobs(n_jobs, expected):
+    assert resolve_n_jobs(n_jobs) == expected
@@ -0,0 +1,182 @@
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from compressio import (
+    Compress,
+    DefaultCompressioTypeset,
+    DefaultCompressor,
+    Partitions,
+    compress_report,
+    storage_size,
+)
+from compressio.partitions import apply_plan
+from compressio.plan import ColumnPlan, CompressionPlan
+
+
+def make_partition(start: int, size: int, categories: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "integers": np.arange(start, start + size, dtype=np.int64),
+            "floats": np.linspace(0, 1, size),
+            "strings": np.array(
+                [categories[i % len(categories)] for i in range(size)], dtype=object
+            ),
+        },
+        index=pd.RangeIndex(start, start + size),
+    )
+
+
+@pytest.fixture
+def partitions():
+    return Partitions(
+        [
+            make_partition(0, 100, ["a", "b"]),
+            make_partition(100, 100, ["b", "c"]),
+            make_partition(1000, 50, ["d"]),
+        ]
+    )
+
+
+def test_partitions_consistent_dtypes(partitions):
+    compressed = Compress().it(partitions)
+
+    assert isinstance(compressed, Partitions)
+    assert len(compressed) == 3
+    dtypes = [frame.dtypes for frame in compressed]
+    for other in dtypes[1:]:
+        assert other.equals(dtypes[0])
+    assert compressed.plan["integers"].dtype == "int16"
+    assert compressed.plan["strings"].categories == ["a", "b", "c", "d"]
+
+
+def test_partitions_values(partitions):
+    compressed = Compress().it(partitions)
+    result = compressed.to_frame()
+    expected = pd.concat(list(partitions))
+
+    assert_frame_equal(
+        result.astype({"integers": np.int64, "strings": object}), expected
+    )
+    # Converting to a frame leaves the partitions intact
+    assert len(compressed[0].columns) == 3
+
+
+def test_partitions_loaders():
+    loaded = []
+
+    def loader(start):
+        loaded.append(start)
+        return make_partition(start, 10, ["x"])
+
+    partitions = Partitions([partial(loader, 0), partial(loader, 300)])
+    compressed = Compress().it(partitions)
+
+    # Once for the plan, once to apply it
+    assert loaded == [0, 300, 0, 300]
+    assert compressed.plan["integers"].dtype == "int16"
+
+
+def test_partitions_parallel(partitions):
+    expected = Compress().it(partitions).to_frame()
+    result = Compress(n_jobs=2).it(partitions).to_frame()
+    assert_frame_equal(result, expected)
+
+
+def test_partitions_missing_values():
+    partitions = Partitions(
+        [
+            pd.DataFrame({"value": [1.0, 2.0, 3.0]}),
+            pd.DataFrame({"value": [np.nan, 400.0, 5.0]}),
+        ]
+    )
+    compressed = Compress().it(partitions)
+    dtypes = {str(frame["value"].dtype) for frame in compressed}
+    assert len(dtypes) == 1
+    assert compressed.to_frame(ignore_index=True)["value"].isna().sum() == 1
+
+
+def test_partitions_categorical_and_object():
+    # The first partition is compressed to a categorical, the second stays object
+    first = pd.DataFrame({"values": [b"a", b"b"] * 500})
+    second = pd.DataFrame(
+        {"values": [str(i).encode() for i in range(1000)]}, index=range(1000, 2000)
+    )
+    compressed = Compress().it(Partitions([first, second]))
+
+    assert compressed.plan["values"].dtype == "object"
+    assert_frame_equal(compressed.to_frame().astype(object), pd.concat([first, second]))
+
+
+def test_partitions_mixed_categories():
+    first = pd.DataFrame({"values": np.array(["a", "b"] * 50, dtype=object)})
+    second = pd.DataFrame(
+        {"values": np.array([1, 2] * 50, dtype=object)}, index=range(100, 200)
+    )
+    compressed = Compress().it(Partitions([first, second]))
+
+    assert compressed.plan["values"].categories == ["a", "b", 1, 2]
+    assert compressed.to_frame()["values"].tolist() == ["a", "b"] * 50 + [1, 2] * 50
+
+
+def test_apply_plan_missing_categories():
+    plan = CompressionPlan({"values": ColumnPlan("String", "category", ["a"])})
+    partition = pd.DataFrame({"values": ["a", "b"] * 50})
+    with pytest.raises(ValueError):
+        apply_plan(
+            partition,
+            plan,
+            DefaultCompressioTypeset(),
+            DefaultCompressor(),
+            with_inference=False,
+        )
+
+
+def test_partitions_iterator():
+    loaded = []
+
+    def chunks():
+        for start in [0, 100]:
+            loaded.append(start)
+            yield make_partition(start, 100, ["a"])
+
+    # The partitions of an iterator are loaded as they are iterated
+    partitions = Partitions(chunks())
+    assert loaded == []
+    for frame, start in zip(partitions, [0, 100]):
+        assert loaded[-1] == start
+
+    with pytest.raises(TypeError):
+        Compress().it(Partitions(chunks()))
+
+
+def test_partitions_columns_differ():
+    partitions = Partitions([pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]})])
+    with pytest.raises(ValueError):
+        Compress().it(partitions)
+
+
+def test_partitions_storage_size(partitions):
+    expected = sum(storage_size(frame) for frame in partitions)
+    assert storage_size(partitions) == expected
+
+
+def test_partitions_report(partitions, capsys):
+    compress_report(partitions, DefaultCompressioTypeset(), DefaultCompressor(), False)
+    output = capsys.readouterr().out
+    assert "integers: converting from int64 to int16" in output
+    assert "strings: converting from object to category" in output
+
+
+def test_partitions_dask():
+    dd = pytest.importorskip("dask.dataframe")
+
+    data = pd.concat([make_partition(0, 100, ["a"]), make_partition(100, 100, ["b"])])
+    compressed = Compress().it(dd.from_pandas(data, npartitions=2))
+    result = compressed.compute()
+
+    assert result["integers"].dtype == np.uint8
+    assert list(result["strings"].cat.categories) == ["a", "b"]
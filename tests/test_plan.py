@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from compressio import Compress, SparseCompressioTypeset, SparseCompressor
+from compressio.plan import ColumnPlan, CompressionPlan
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "integers": pd.Series(np.arange(100), dtype=np.int64),
+            "floats": pd.Series(np.linspace(0, 1, 100), dtype=np.float64),
+            "strings": pd.Series(["a", "b", "c", "d"] * 25, dtype=object),
+            "complex": pd.Series([complex(1, 2)] * 100),
+        }
+    )
+
+
+def test_fit_transform_roundtrip(df):
+    compress = Compress()
+    expected = compress.it(df)
+    plan = compress.fit(df)
+
+    assert plan["integers"].dtype == "int8"
+    assert plan["strings"].categories == ["a", "b", "c", "d"]
+    assert_frame_equal(compress.transform(df), expected)
+
+
+def test_plan_serialization(df):
+    compress = Compress()
+    plan = compress.fit(df)
+
+    restored = CompressionPlan.from_json(plan.to_json())
+    assert restored == plan
+    assert_frame_equal(compress.transform(df, restored), compress.it(df))
+
+
+def test_transform_refits_violating_columns(df):
+    compress = Compress()
+    plan = compress.fit(df)
+    strings_plan = plan["strings"]
+
+    batch = df.copy()
+    batch.loc[0, "integers"] = 1000
+    result = compress.transform(batch)
+
+    assert result["integers"].dtype == np.int16
+    assert result["integers"].iloc[0] == 1000
+    assert plan["integers"].dtype == "int16"
+    # Untouched columns keep their plan
+    assert plan["strings"] is strings_plan
+
+
+def test_transform_inexact_floats():
+    compress = Compress()
+    compress.fit(pd.DataFrame({"floats": [0.5, 1.0, 2.0]}))
+    assert compress.plan["floats"].dtype == "float16"
+
+    batch = pd.DataFrame({"floats": [0.1, 1.7, 3.3]})
+    result = compress.transform(batch)
+    # Values that are not exact in float16 re-fit the column, as compressing it directly does
+    assert_frame_equal(result, compress.it(batch))
+    assert result["floats"].tolist() == [0.1, 1.7, 3.3]
+    assert compress.plan["floats"].dtype == "float64"
+
+
+def test_transform_unseen_category(df):
+    compress = Compress()
+    compress.fit(df)
+
+    batch = df.copy()
+    batch.loc[0, "strings"] = "e"
+    result = compress.transform(batch)
+    assert "e" in result["strings"].cat.categories
+
+
+def test_transform_without_fit(df):
+    with pytest.raises(ValueError):
+        Compress().transform(df)
+
+
+def test_sparse_plan():
+    df = pd.DataFrame({"sparse": pd.Series([np.nan] * 1000 + [1.0, 2.0, 3.0])})
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor()
+    )
+    plan = compress.fit(df)
+    assert plan["sparse"].sparse
+
+    restored = CompressionPlan.from_json(plan.to_json())
+    assert restored["sparse"].target_dtype == compress.it(df)["sparse"].dtype
+
+
+@pytest.mark.parametrize(
+    "dtype,series,expected",
+    [
+        ("int8", pd.Series([1, 2, 3]), True),
+        ("int8", pd.Series([1, 2, 300]), False),
+        ("int8", pd.Series([1.0, 2.5]), False),
+        ("int8", pd.Series([1.0, np.nan]), False),
+        ("Int8", pd.Series([1.0, np.nan]), True),
+        ("float16", pd.Series([1.0, 1e10]), False),
+        ("float16", pd.Series([0.5, np.nan]), True),
+        ("float16", pd.Series([0.1, 1.7]), False),
+        ("float32", pd.Series([0.1]), False),
+        ("bool", pd.Series([True, False], dtype=object), True),
+    ],
+)
+def test_validate(dtype, series, expected):
+    assert ColumnPlan("Generic", dtype).validate(series) == expected
+
+
+def test_arrow_string_plan():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "text": [f"event {i} happened" for i in range(1000)],
+            "words": [f"v{i % 300}" for i in range(1000)],
+        }
+    )
+    compress = Compress()
+    compressed = compress.fit_transform(df)
+    plan = CompressionPlan.from_json(compress.plan.to_json())
+    assert plan["text"].dtype == "string[pyarrow]"
+
+    transformed = compress.transform(df, plan)
+    assert_frame_equal(transformed, compressed)
+    assert plan["text"].dtype == "string[pyarrow]"
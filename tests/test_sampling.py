@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+from visions import Float, Integer, StandardSet
+
+from compressio.compress import compress_func, get_data_and_dtype
+from compressio.sampling import sample_series
+from compressio.type_compressor import DefaultCompressor
+
+
+def test_sample_series():
+    series = pd.Series(np.arange(1000))
+    sample = sample_series(series, 30)
+    assert len(sample) == 30
+    assert sample.iloc[0] == 0
+    assert sample.iloc[-1] == 999
+    assert sample.index.is_unique
+    assert_series_equal(sample_series(series, 30), sample)
+
+
+def test_sample_series_small():
+    series = pd.Series(np.arange(10))
+    assert sample_series(series, 30) is series
+
+
+@pytest.mark.parametrize(
+    "series,expected",
+    [
+        (pd.Series(np.arange(10000) * 1.0), Integer),
+        # The random sample misses the single fractional value, verification catches it
+        (pd.Series([1.0] * 5000 + [1.5] + [2.0] * 5000), Float),
+    ],
+)
+def test_sampled_inference(series, expected):
+    data, dtype = get_data_and_dtype(series, StandardSet(), True, sample_size=30)
+    assert dtype == expected
+    assert len(data) == len(series)
+
+
+def test_sampled_compression_matches_full():
+    series = pd.Series([np.nan] + list(range(10000)) + [np.nan], dtype=np.float64)
+    kwargs = dict(typeset=StandardSet(), compressor=DefaultCompressor())
+    full = compress_func(series, with_inference=True, **kwargs)
+    sampled = compress_func(series, with_inference=True, sample_size=30, **kwargs)
+    assert str(sampled.dtype) == "Int16"
+    assert_series_equal(full, sampled)
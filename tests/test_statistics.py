@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from compressio.compression_algorithms.statistics import (
+    ColumnStatistics,
+    column_statistics,
+    estimate_unique_count,
+    statistics_scope,
+)
+
+
+@pytest.mark.parametrize(
+    "series,null_count,minv,maxv",
+    [
+        (pd.Series([1, 5, -3], dtype=np.int64), 0, -3, 5),
+        (pd.Series([1.0, np.nan, 0.5]), 1, 0.5, 1.0),
+        (pd.Series([1, None, 7], dtype="Int64"), 1, 1, 7),
+        (pd.Series(pd.arrays.SparseArray([0, 0, 3, 0], fill_value=0)), 0, 0, 3),
+        (pd.Series(pd.arrays.SparseArray([np.nan, 2.0, np.nan])), 2, 2.0, 2.0),
+        (pd.Series(["a", None, "b"]), 1, None, None),
+        (pd.Series([np.nan, np.nan]), 2, None, None),
+    ],
+)
+def test_column_statistics(series, null_count, minv, maxv):
+    stats = ColumnStatistics.from_series(series)
+    assert stats.length == len(series)
+    assert stats.null_count == null_count
+    assert stats.hasnans == series.hasnans
+    assert stats.min == minv
+    assert stats.max == maxv
+
+
+def test_complex_statistics():
+    series = pd.Series([complex(1, -2), complex(-3, 4), np.nan])
+    stats = ColumnStatistics.from_series(series)
+    assert stats.null_count == 1
+    assert stats.real_range == (-3, 1)
+    assert stats.imag_range == (-2, 4)
+
+
+@pytest.mark.parametrize(
+    "series,expected",
+    [
+        (pd.Series(["a", "b", "c"] * 100), 3),
+        (pd.Series(np.arange(50_000)), 50_000),
+        (pd.Series([1, 2, None]), 2),
+        (pd.Series([None, None]), 0),
+    ],
+)
+def test_estimate_unique_count(series, expected):
+    assert estimate_unique_count(series) == expected
+
+
+def test_statistics_cached_within_scope():
+    series = pd.Series([1, 2, 3])
+    assert column_statistics(series) is not column_statistics(series)
+    with statistics_scope():
+        assert column_statistics(series) is column_statistics(series)
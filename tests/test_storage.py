@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+import compressio
+from compressio import (
+    Compress,
+    DefaultCompressor,
+    SparseCompressioTypeset,
+    SparseCompressor,
+)
+
+
+@pytest.fixture
+def df():
+    random = np.random.RandomState(0)
+    size = 1000
+    return pd.DataFrame(
+        {
+            "integers": random.randint(0, 100, size),
+            "floats": random.rand(size),
+            "categories": random.choice(["gold", "silver", "bronze"], size),
+            "text": [f"event {i} ✓" for i in range(size)],
+            "flags": random.rand(size) > 0.5,
+            "missing_flags": pd.Series([True, None, False, None] * (size // 4)),
+            "missing_integers": pd.Series([1, None] * (size // 2)),
+            "dates": pd.date_range("2021-03-27", periods=size, freq="min", tz="UTC"),
+            "zeros": [0] * (size - 10) + list(range(10)),
+            "status": np.repeat(["ok", "failed"], size // 2),
+            "timestamps": np.arange(1_600_000_000_000, 1_600_000_000_000 + size),
+            "prices": np.round(random.uniform(0, 100, size), 2),
+        },
+        index=pd.RangeIndex(10, 10 + size, name="row"),
+    )
+
+
+def assert_same_values(loaded, df):
+    for column in df.columns:
+        assert loaded[column].astype(object).fillna("NA").tolist() == (
+            df[column].astype(object).fillna("NA").tolist()
+        )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, df, mmap):
+    compress = Compress(
+        compressor=DefaultCompressor(
+            encodings=("frame_of_reference", "delta", "decimal", "run_length")
+        )
+    )
+    path = tmp_path / "data.compressio"
+    compress.save(df, path)
+
+    loaded = compressio.load(path, mmap=mmap)
+    compressed = compress.transform(df)
+    assert_frame_equal(loaded, compressed)
+    assert_same_values(loaded, df)
+    assert compressio.load_plan(path) == compress.plan
+
+    # Memory-mapped columns are read-only views of the file
+    assert loaded["integers"].to_numpy().flags.writeable != mmap
+
+
+def test_save_load_sparse(tmp_path, df):
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor()
+    )
+    compressed = compress.it(df)
+    assert pd.api.types.is_sparse(compressed["zeros"])
+
+    path = tmp_path / "data.compressio"
+    compressio.save(compressed, path)
+    loaded = compressio.load(path)
+    assert (loaded.dtypes == compressed.dtypes).all()
+    assert_same_values(loaded, df)
+    assert compressio.load_plan(path) is None
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 2, 3], name="values"),
+        pd.Series(["a", None, "c"], index=pd.Index(["x", "y", "z"], name="key")),
+        pd.Series(
+            [1.5, np.nan],
+            index=pd.MultiIndex.from_arrays([[1, 2], ["a", "b"]], names=["n", "s"]),
+        ),
+        pd.Series(pd.to_timedelta([1, None], unit="s")),
+        pd.Series([], dtype=np.int64),
+    ],
+)
+def test_save_load_series(tmp_path, series):
+    path = tmp_path / "series.compressio"
+    compressio.save(series, path)
+    assert_series_equal(compressio.load(path), series)
+
+
+def test_save_load_objects(tmp_path):
+    df = pd.DataFrame(
+        {
+            "mixed": pd.Series([1, "a", None, 2.5], dtype=object),
+            "dicts": [{"a": 1}, {}, None, {"b": [1, 2]}],
+        }
+    )
+    path = tmp_path / "objects.compressio"
+    Compress().save(df, path)
+
+    # Objects other than strings are pickled, which is only restored on request
+    with pytest.raises(ValueError, match="allow_pickle"):
+        compressio.load(path)
+    loaded = compressio.load(path, allow_pickle=True)
+    assert_frame_equal(loaded, df)
+    assert [type(value) for value in loaded["mixed"]] == [int, str, type(None), float]
+
+
+def test_save_load_multi_index(tmp_path):
+    index = pd.MultiIndex.from_product(
+        [["a", "b"], np.arange(1000)], names=["letter", "number"]
+    )
+    compressed = Compress(index=True).it(
+        pd.DataFrame({"values": np.arange(len(index))}, index=index).iloc[:10]
+    )
+    path = tmp_path / "multi.compressio"
+    compressio.save(compressed, path)
+
+    loaded = compressio.load(path)
+    assert_frame_equal(loaded, compressed)
+    # The levels and the narrow codes are stored as they are
+    assert len(loaded.index.levels[1]) == 10
+    assert [codes.dtype for codes in loaded.index.codes] == [np.int8, np.int8]
+
+
+def test_load_unsupported(tmp_path):
+    path = tmp_path / "not.compressio"
+    path.write_bytes(b"PAR1" + bytes(100))
+    with pytest.raises(ValueError):
+        compressio.load(path)
@@ -0,0 +1,94 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from compressio import Compress, SparseCompressioTypeset, SparseCompressor
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "integers": np.arange(1000, dtype=np.int64),
+            "floats": np.arange(1000) / 4,
+            "strings": ["a", "b"] * 500,
+            "numbers": ["1", "2"] * 500,
+        }
+    )
+
+
+def test_report_records(df):
+    compress = Compress(telemetry=True)
+    compress.it(df)
+
+    report = compress.report
+    assert [record.column for record in report] == list(df.columns)
+
+    record = report["integers"]
+    assert record.visions_type == "Integer"
+    assert record.algorithms == ["compress_integer"]
+    assert record.applied == ["compress_integer"]
+    assert (record.dtype_before, record.dtype_after) == ("int64", "int16")
+    assert (record.bytes_before, record.bytes_after) == (8000, 2000)
+    assert record.statistics_time > 0
+    assert record.total_time >= record.cast_time >= 0
+
+    assert report["strings"].dtype_after == "category"
+
+
+def test_report_algorithm_chain(df):
+    compress = Compress(
+        typeset=SparseCompressioTypeset(), compressor=SparseCompressor(), telemetry=True
+    )
+    compress.it(df)
+
+    # Applied in the reverse order of the compression map
+    record = compress.report["floats"]
+    assert record.algorithms == [
+        "compress_float",
+        "compress_integral_float",
+        "compress_sparse",
+    ]
+    assert record.applied == ["compress_float"]
+
+
+def test_report_inference(df):
+    compress = Compress(with_type_inference=True, telemetry=True)
+    compress.it(df)
+
+    record = compress.report["numbers"]
+    assert record.visions_type == "Integer"
+    assert record.inference_time > 0
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_report_parallel(df, backend):
+    expected = Compress().it(df)
+
+    records = []
+    compress = Compress(n_jobs=2, backend=backend, callback=records.append)
+    assert_frame_equal(compress.it(df), expected)
+    assert [record.column for record in records] == list(df.columns)
+    assert compress.report.records == records
+
+
+def test_report_export(df):
+    compress = Compress(telemetry=True)
+    compress.it(df["integers"])
+
+    frame = compress.report.to_frame()
+    assert list(frame.index) == ["integers"]
+    assert frame.loc["integers", "dtype_after"] == "int16"
+
+    records = json.loads(compress.report.to_json())
+    assert records[0]["column"] == "integers"
+    assert records[0]["bytes_after"] == 2000
+
+
+def test_no_report_by_default(df):
+    compress = Compress()
+    compress.it(df)
+    assert compress.report is None
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from visions import Float, Integer, StandardSet
+from visions.typesets.typeset import get_type_from_path, traverse_graph
+
+from compressio import Compress, DefaultCompressioTypeset, SparseCompressioTypeset
+from compressio.compress import get_data_and_dtype
+from compressio.typesets import cached_typeset, native_type, native_types
+
+SERIES = {
+    "int64": pd.Series(np.arange(100)),
+    "uint8": pd.Series(np.arange(100, dtype=np.uint8)),
+    "bool": pd.Series([True, False] * 50),
+    "floats": pd.Series(np.arange(100) / 4),
+    "integral floats": pd.Series(np.arange(100) * 1.0),
+    "nan floats": pd.Series([np.nan, 1.5, 2.5]),
+    "all nan": pd.Series([np.nan, np.nan]),
+    "complex": pd.Series([1 + 1j, 2 + 0j]),
+    "real complex": pd.Series([1 + 0j, 2 + 0j]),
+    "datetime": pd.Series(pd.date_range("2020-01-01", periods=10)),
+    "datetime tz": pd.Series(pd.date_range("2020-01-01", periods=10, tz="UTC")),
+    "all nat": pd.Series([pd.NaT, pd.NaT], dtype="datetime64[ns]"),
+    "timedelta": pd.Series(pd.to_timedelta(np.arange(10), unit="s")),
+    "empty": pd.Series([], dtype=np.int64),
+    "strings": pd.Series(["a", "b"]),
+}
+
+
+@pytest.mark.parametrize(
+    "typeset_type", [DefaultCompressioTypeset, SparseCompressioTypeset]
+)
+@pytest.mark.parametrize("with_inference", [False, True])
+@pytest.mark.parametrize("name", list(SERIES))
+def test_native_type_matches_graph(typeset_type, with_inference, name):
+    series = SERIES[name]
+    typeset = cached_typeset(typeset_type)
+    graph = typeset.relation_graph if with_inference else typeset.base_graph
+
+    visions_type = native_type(series, typeset, with_inference)
+    _, path, _ = traverse_graph(series, typeset.root_node, graph)
+    expected = get_type_from_path(path)
+    if visions_type is not None:
+        assert visions_type == expected
+
+    _, dtype = get_data_and_dtype(series, typeset, with_inference)
+    assert dtype == expected
+
+
+def test_native_types_subtypes():
+    # Floats that hold integers are inferred to be integers, these traverse the graph
+    typeset = StandardSet()
+    assert native_types(typeset, False)["f"] == Float
+    assert "f" not in native_types(typeset, True)
+    assert native_types(typeset, True)["i"] == Integer
+
+
+def test_cached_typeset():
+    assert cached_typeset(DefaultCompressioTypeset) is cached_typeset(
+        DefaultCompressioTypeset
+    )
+    assert Compress().typeset is Compress().typeset